@@ -1,24 +1,38 @@
 import asyncio
+import contextlib
+import dataclasses
 import functools
 import importlib
 import os
+import threading
+import time
 import traceback
 from pathlib import Path
-from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Tuple, TypeVar
+from typing import Any, AsyncContextManager, AsyncGenerator, Callable, Dict, List, Optional, Tuple, TypeVar
 from uuid import UUID, uuid4
 
 import joblib
 from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage, ToolMessage
 from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.errors import GraphRecursionError
 from langgraph.graph.state import CompiledStateGraph
 from langgraph.pregel import Pregel
 from langgraph.types import Command, Interrupt
 
 from langgraph_agent_toolkit.agents.agent import Agent
+from langgraph_agent_toolkit.agents.interrupt_index import PendingInterruptIndex
 from langgraph_agent_toolkit.core.settings import settings
-from langgraph_agent_toolkit.helper.constants import DEFAULT_RECURSION_LIMIT, get_default_agent, set_default_agent
+from langgraph_agent_toolkit.helper.constants import (
+    DEFAULT_BATCH_MAX_CONCURRENCY,
+    DEFAULT_RECURSION_LIMIT,
+    get_default_agent,
+    set_default_agent,
+)
+from langgraph_agent_toolkit.helper.exceptions import AgentConfigurationError
 from langgraph_agent_toolkit.helper.logging import logger
+from langgraph_agent_toolkit.helper.metrics import StageTimingCallbackHandler, record_stage, stage, timed_enter
+from langgraph_agent_toolkit.helper.types import StreamProfile
 from langgraph_agent_toolkit.helper.utils import (
     convert_message_content_to_string,
     create_ai_message,
@@ -30,68 +44,151 @@ from langgraph_agent_toolkit.schema import AgentInfo, ChatMessage
 
 T = TypeVar("T")
 
+# LangGraph stream modes of each stream profile. Interrupts are only emitted in the
+# "updates" mode, so every profile subscribes to it.
+STREAM_PROFILE_MODES: Dict[StreamProfile, List[str]] = {
+    StreamProfile.FULL: ["updates", "messages", "custom"],
+    StreamProfile.TOKENS_ONLY: ["updates", "messages"],
+    StreamProfile.MESSAGES_ONLY: ["updates", "custom"],
+    StreamProfile.DELTAS: ["updates", "messages", "custom"],
+}
+
 
 class AgentExecutor:
     """Handles the loading, execution and saving logic for different LangGraph agents."""
 
-    def __init__(self, *args):
-        """Initialize the AgentExecutor by importing agents.
+    def __init__(self, *args, descriptions: Optional[Dict[str, str]] = None):
+        """Initialize the AgentExecutor by importing or registering agents.
 
         Args:
             *args: Variable length strings specifying the agents to import,
                   e.g., "langgraph_agent_toolkit.agents.blueprints.react.agent:react_agent".
+                  Strings prefixed with an agent ID, e.g. "react-agent=<module>:<object>",
+                  register the agent lazily: it is imported on first use or by `warmup`.
+            descriptions: Descriptions of lazily registered agents reported before they are loaded, by agent ID
 
         Raises:
             ValueError: If no agents are provided.
 
         """
         self.agents: Dict[str, Agent] = {}
+        self.interrupt_index = PendingInterruptIndex()
+        self._lazy_agents: Dict[str, str] = {}
+        self._import_paths: Dict[str, str] = {}
+        self._lazy_descriptions: Dict[str, str] = {}
+        self._load_locks: Dict[str, threading.Lock] = {}
+        self._agent_initializers: List[Callable[[Agent], None]] = []
 
         if not args:
             raise ValueError("At least one agent must be provided to AgentExecutor.")
 
         # Load agents from import strings
-        self.load_agents_from_imports(args)
+        self.load_agents_from_imports(args, descriptions)
         self._validate_default_agent_loaded()
 
-    def load_agents_from_imports(self, args: tuple) -> None:
-        """Dynamically imports agents based on the provided import strings."""
+    @staticmethod
+    def _import_agent(import_str: str) -> Optional[Agent]:
+        """Import an agent or a compiled graph from a "<module>:<object>" string."""
+        module_path, object_name = import_str.split(":")
+        module = importlib.import_module(module_path)
+        agent_obj = getattr(module, object_name)
+
+        if isinstance(agent_obj, (CompiledStateGraph, Pregel)):
+            return Agent(name=object_name, description=f"Dynamically loaded {object_name}", graph=agent_obj)
+        if isinstance(agent_obj, Agent):
+            return agent_obj
+        logger.warning(f"Object '{object_name}' is neither a graph nor an Agent instance")
+        return None
+
+    def load_agents_from_imports(self, args: tuple, descriptions: Optional[Dict[str, str]] = None) -> None:
+        """Dynamically imports agents based on the provided import strings.
+
+        Strings of the form "<agent_id>=<module>:<object>" are only registered, see `register_agent`.
+        """
+        descriptions = descriptions or {}
         for import_str in args:
+            agent_id, is_lazy, target = import_str.partition("=")
+            if is_lazy:
+                agent_id = agent_id.strip()
+                self.register_agent(agent_id, target.strip(), description=descriptions.get(agent_id))
+                continue
             try:
-                module_path, object_name = import_str.split(":")
-                module = importlib.import_module(module_path)
-                agent_obj = getattr(module, object_name)
-
-                if isinstance(agent_obj, (CompiledStateGraph, Pregel)):
-                    agent = Agent(name=object_name, description=f"Dynamically loaded {object_name}", graph=agent_obj)
+                agent = self._import_agent(import_str)
+                if agent is not None:
                     self.agents[agent.name] = agent
-                elif isinstance(agent_obj, Agent):
-                    self.agents[agent_obj.name] = agent_obj
-                else:
-                    logger.warning(f"Object '{object_name}' is neither a graph nor an Agent instance")
+                    self._import_paths[agent.name] = import_str
             except (ImportError, AttributeError, ValueError) as e:
                 logger.error(f"Error loading agent from '{import_str}': {e}")
 
+    def register_agent(self, agent_id: str, import_str: str, description: Optional[str] = None) -> None:
+        """Register an agent to be imported from "<module>:<object>" on first use.
+
+        Args:
+            agent_id: The ID under which the agent is served
+            import_str: Import string of the agent or compiled graph
+            description: Description reported before the agent is loaded
+
+        """
+        self._lazy_agents[agent_id] = import_str
+        if description is not None:
+            self._lazy_descriptions[agent_id] = description
+        self._load_locks.setdefault(agent_id, threading.Lock())
+
+    @property
+    def import_paths(self) -> Dict[str, str]:
+        """Import strings of the agents loaded or registered from imports, by agent ID."""
+        return {**self._import_paths, **self._lazy_agents}
+
+    @property
+    def agent_ids(self) -> List[str]:
+        """IDs of all loaded and lazily registered agents."""
+        return [*self.agents, *(agent_id for agent_id in self._lazy_agents if agent_id not in self.agents)]
+
     def _validate_default_agent_loaded(self) -> None:
         """Validate that a default agent is available and set it if needed.
 
         If the default agent from constants.py is not available,
         use the first loaded agent as the default and update the global value.
         """
-        if not self.agents:
+        agent_ids = self.agent_ids
+        if not agent_ids:
             raise ValueError("No agents were loaded. Please check your imports.")
 
         initial_default = get_default_agent()
 
-        if initial_default not in self.agents:
-            new_default = list(self.agents.keys())[0]
+        if initial_default not in agent_ids:
+            new_default = agent_ids[0]
             logger.warning(
                 f"Default agent '{initial_default}' not found in loaded agents. Using '{new_default}' as default."
             )
             set_default_agent(new_default)
 
+    def _load_agent(self, agent_id: str) -> Agent:
+        """Import a lazily registered agent, once even if requested by several threads at the same time."""
+        with self._load_locks[agent_id]:
+            # Another request may have loaded it while this one waited for the lock
+            if agent_id in self.agents:
+                return self.agents[agent_id]
+
+            import_str = self._lazy_agents[agent_id]
+            started_at = time.perf_counter()
+            try:
+                agent = self._import_agent(import_str)
+            except (ImportError, AttributeError, ValueError) as e:
+                raise AgentConfigurationError(f"Error loading agent '{agent_id}' from '{import_str}': {e}") from e
+            if agent is None:
+                raise AgentConfigurationError(f"Agent '{agent_id}' from '{import_str}' is not a graph or an Agent")
+            if agent.name != agent_id:
+                agent = dataclasses.replace(agent, name=agent_id)
+
+            for initializer in self._agent_initializers:
+                initializer(agent)
+            self.agents[agent_id] = agent
+            logger.info(f"Loaded agent '{agent_id}' in {(time.perf_counter() - started_at) * 1000:.1f}ms")
+            return agent
+
     def get_agent(self, agent_id: str) -> Agent:
-        """Get an agent by its ID.
+        """Get an agent by its ID, importing it first if it was registered lazily.
 
         Args:
             agent_id: The ID of the agent to retrieve
@@ -101,20 +198,74 @@ class AgentExecutor:
 
         Raises:
             KeyError: If the agent_id is not found
+            AgentConfigurationError: If a lazily registered agent cannot be imported
 
         """
-        if agent_id not in self.agents:
+        agent = self.agents.get(agent_id)
+        if agent is not None:
+            return agent
+        if agent_id not in self._lazy_agents:
             raise KeyError(f"Agent '{agent_id}' not found")
-        return self.agents[agent_id]
+        return self._load_agent(agent_id)
+
+    async def aget_agent(self, agent_id: str) -> Agent:
+        """Get an agent by its ID, importing a lazily registered agent in a worker thread."""
+        agent = self.agents.get(agent_id)
+        if agent is not None:
+            return agent
+        return await asyncio.to_thread(self.get_agent, agent_id)
+
+    def warmup(self, agent_ids: Optional[List[str]] = None) -> List[str]:
+        """Import lazily registered agents ahead of their first use.
+
+        Args:
+            agent_ids: IDs of the agents to load. If None, loads all registered agents.
+
+        Returns:
+            List[str]: IDs of the agents that are loaded
+
+        """
+        loaded = []
+        for agent_id in self.agent_ids if agent_ids is None else agent_ids:
+            try:
+                self.get_agent(agent_id)
+                loaded.append(agent_id)
+            except (KeyError, AgentConfigurationError) as e:
+                logger.error(f"Error warming up agent '{agent_id}': {e}")
+        return loaded
+
+    async def awarmup(self, agent_ids: Optional[List[str]] = None) -> List[str]:
+        """Import lazily registered agents concurrently in worker threads, see `warmup`."""
+        agent_ids = self.agent_ids if agent_ids is None else agent_ids
+        results = await asyncio.gather(*(asyncio.to_thread(self.warmup, [agent_id]) for agent_id in agent_ids))
+        return [agent_id for loaded in results for agent_id in loaded]
+
+    def add_agent_initializer(self, initializer: Callable[[Agent], None]) -> None:
+        """Apply `initializer` to every loaded agent and to agents loaded later.
+
+        Used to attach the checkpointer and observability platform of the service to
+        agents that are only imported on first use.
+        """
+        self._agent_initializers.append(initializer)
+        for agent in list(self.agents.values()):
+            initializer(agent)
 
     def get_all_agent_info(self) -> list[AgentInfo]:
-        """Get information about all available agents.
+        """Get information about all available agents, without importing lazily registered ones.
 
         Returns:
             A list of AgentInfo objects containing agent IDs and descriptions
 
         """
-        return [AgentInfo(key=agent_id, description=agent.description) for agent_id, agent in self.agents.items()]
+        return [
+            AgentInfo(
+                key=agent_id,
+                description=self.agents[agent_id].description
+                if agent_id in self.agents
+                else self._lazy_descriptions.get(agent_id, f"Loaded on first use from {self._lazy_agents[agent_id]}"),
+            )
+            for agent_id in self.agent_ids
+        ]
 
     def add_agent(self, agent_id: str, agent: Agent) -> None:
         """Add a new agent to the executor.
@@ -183,6 +334,7 @@ class AgentExecutor:
         model_config_key: Optional[str] = None,
         agent_config: Optional[Dict[str, Any]] = None,
         recursion_limit: Optional[int] = None,
+        resume: Optional[bool] = None,
     ) -> Tuple[Agent, Any, Any, UUID]:
         """Apply common setup for agent execution that both invoke and stream methods share.
 
@@ -196,6 +348,8 @@ class AgentExecutor:
             model_config_key: Optional model config key to override the default
             agent_config: Optional additional configuration for the agent
             recursion_limit: Optional recursion limit for the agent
+            resume: Whether the input resumes a pending interrupt. If None, the pending interrupt
+                index of the thread is consulted.
 
         Returns:
             Tuple containing:
@@ -205,10 +359,11 @@ class AgentExecutor:
                 - run_id: The UUID for this run
 
         """
-        agent = self.get_agent(agent_id)
+        agent = await self.aget_agent(agent_id)
         agent_graph = agent.graph
 
         run_id = uuid4()
+        is_new_thread = not thread_id
         thread_id = thread_id or str(uuid4())
 
         recursion_limit = recursion_limit or DEFAULT_RECURSION_LIMIT
@@ -219,13 +374,12 @@ class AgentExecutor:
         }
 
         # Handle model_config_key if provided (takes precedence over individual model settings)
-        if model_config_key and model_config_key in settings.MODEL_CONFIGS:
+        if model_config_key and (model_config := settings.get_model_config(model_config_key)):
             # Store the model_config_key so agents can use it if needed
             configurable["model_config_key"] = model_config_key
 
             # Extract basic model info for backward compatibility with agents that
             # don't explicitly check for model_config_key
-            model_config = settings.MODEL_CONFIGS[model_config_key]
             if "provider" in model_config:
                 configurable["model_provider"] = model_config["provider"]
             if "name" in model_config:
@@ -242,11 +396,14 @@ class AgentExecutor:
             configurable.update(agent_config)
 
         callback = agent.observability.get_callback_handler(update_trace=True)
+        callbacks = [StageTimingCallbackHandler()]
+        if callback:
+            callbacks.append(callback)
 
         config = RunnableConfig(
             configurable=configurable,
             run_id=run_id,
-            callbacks=[callback] if callback else None,
+            callbacks=callbacks,
             recursion_limit=recursion_limit,
             metadata={
                 "langfuse_session_id": thread_id,
@@ -255,14 +412,19 @@ class AgentExecutor:
             },
         )
 
-        # Check if there are any interrupts that need to be resumed
-        state = await agent_graph.aget_state(config=config)
-        interrupted_tasks = [task for task in state.tasks if hasattr(task, "interrupts") and task.interrupts]
+        # Check if there are any interrupts that need to be resumed.
+        # A freshly generated thread cannot have any, and an explicit `resume` skips the lookup.
+        if resume is None:
+            if is_new_thread:
+                resume = False
+            else:
+                with stage("interrupt_lookup"):
+                    resume = await self.interrupt_index.has_pending_interrupt(agent_id, agent_graph, config)
 
         _input = input.model_dump()
         input_data: Command | dict[str, Any]
 
-        if interrupted_tasks:
+        if resume:
             # User input is a response to resume agent execution from interrupt
             input_data = Command(resume=_input)
         else:
@@ -274,6 +436,31 @@ class AgentExecutor:
 
         return agent, input_data, config, run_id
 
+    @staticmethod
+    def _final_state_to_chat_message(state: dict[str, Any] | Any) -> ChatMessage:
+        """Convert the final graph state returned by `ainvoke` into a ChatMessage.
+
+        Args:
+            state: The final state of the graph, including `__interrupt__` if the run was interrupted
+
+        Returns:
+            ChatMessage: The generated message or the value of the first interrupt
+
+        """
+        if not isinstance(state, dict):
+            raise ValueError(f"Unexpected response type: {type(state).__name__}")
+
+        if state.get("__interrupt__"):
+            # The last thing to occur was an interrupt
+            # Return the value of the first interrupt as an AIMessage
+            return langchain_to_chat_message(AIMessage(content=state["__interrupt__"][0].value))
+
+        # Normal response, the agent completed successfully
+        generated_message = state.get("structured_response")
+        if not generated_message:
+            generated_message = state["messages"][-1]
+        return langchain_to_chat_message(generated_message)
+
     @handle_agent_errors
     async def invoke(
         self,
@@ -286,6 +473,7 @@ class AgentExecutor:
         model_config_key: Optional[str] = None,
         agent_config: Optional[Dict[str, Any]] = None,
         recursion_limit: Optional[int] = None,
+        resume: Optional[bool] = None,
     ) -> ChatMessage:
         """Invoke an agent with a message and return the response.
 
@@ -299,61 +487,139 @@ class AgentExecutor:
             model_config_key: Optional model config key to override the default
             agent_config: Optional additional configuration for the agent
             recursion_limit: Optional recursion limit for the agent
+            resume: Optional flag whether the input resumes a pending interrupt
 
         Returns:
             ChatMessage: The agent's response
 
         """
-        agent, input_data, config, run_id = await self._setup_agent_execution(
-            agent_id=agent_id,
-            input=input,
-            thread_id=thread_id,
-            user_id=user_id,
-            model_name=model_name,
-            model_provider=model_provider,
-            model_config_key=model_config_key,
-            agent_config=agent_config,
-            recursion_limit=recursion_limit,
-        )
+        with stage("setup"):
+            agent, input_data, config, run_id = await self._setup_agent_execution(
+                agent_id=agent_id,
+                input=input,
+                thread_id=thread_id,
+                user_id=user_id,
+                model_name=model_name,
+                model_provider=model_provider,
+                model_config_key=model_config_key,
+                agent_config=agent_config,
+                recursion_limit=recursion_limit,
+                resume=resume,
+            )
 
         # Wrap execution in trace context
-        with agent.observability.trace_context(
-            run_id=run_id,
-            user_id=user_id,
-            input=input_data,
-            agent_name=agent.name,
-        ):
-            # Invoke the agent
-            response_events: list[tuple[str, Any]] = await agent.graph.ainvoke(
+        with timed_enter(
+            "trace_context",
+            agent.observability.trace_context(
+                run_id=run_id,
+                user_id=user_id,
                 input=input_data,
-                config=config,
-                # stream_mode=["updates", "values"],
-                stream_mode=["values"],
+                agent_name=agent.name,
+            ),
+        ):
+            # Invoke the agent. With the plain "values" stream mode LangGraph keeps only the latest
+            # state (plus interrupts) instead of collecting a snapshot after every super-step.
+            thread_id = config["configurable"]["thread_id"]
+            try:
+                with stage("graph"):
+                    response: dict[str, Any] | Any = await agent.graph.ainvoke(
+                        input=input_data,
+                        config=config,
+                        stream_mode="values",
+                    )
+            except BaseException:
+                self.interrupt_index.invalidate(agent_id, thread_id)
+                raise
+            self.interrupt_index.set(
+                agent_id, thread_id, isinstance(response, dict) and bool(response.get("__interrupt__"))
             )
 
-            response_type, response = response_events[-1]
-
-            if response_type == "values" and "__interrupt__" not in response:
-                generated_message = response.get("structured_response")
-                if not generated_message:
-                    generated_message = response["messages"][-1]
-
-                # Normal response, the agent completed successfully
-                output = langchain_to_chat_message(generated_message)
-            elif response_type == "values" and "__interrupt__" in response:
-                # The last thing to occur was an interrupt
-                # Return the value of the first interrupt as an AIMessage
-                output = langchain_to_chat_message(AIMessage(content=response["__interrupt__"][0].value))
-            elif response_type == "updates" and "__interrupt__" in response:
-                # The last thing to occur was an interrupt
-                # Return the value of the first interrupt as an AIMessage
-                output = langchain_to_chat_message(AIMessage(content=response["__interrupt__"][0].value))
-            else:
-                raise ValueError(f"Unexpected response type: {response_type}")
+            output = self._final_state_to_chat_message(response)
 
             output.run_id = str(run_id)
             return output
 
+    async def batch(
+        self,
+        agent_id: str,
+        inputs: List[Dict[str, Any]],
+        max_concurrency: Optional[int] = None,
+        admit: Optional[Callable[[], AsyncContextManager[Any]]] = None,
+    ) -> List[ChatMessage | Exception]:
+        """Invoke an agent with many independent inputs, running at most `max_concurrency` at once.
+
+        Every item goes through `invoke`, so it gets its own thread, run ID, trace and interrupt handling.
+        A failing item does not affect the others.
+
+        Args:
+            agent_id: ID of the agent to invoke
+            inputs: Keyword arguments of `invoke` (except `agent_id`) for every item
+            max_concurrency: Optional concurrency limit, capped at `DEFAULT_BATCH_MAX_CONCURRENCY`
+            admit: Optional factory of a context manager held by every item while it runs, e.g. to
+                take an admission slot. Errors raised on entering it are reported for the item.
+
+        Returns:
+            List[ChatMessage | Exception]: Responses in the order of `inputs`, or the raised exception
+                for items that failed
+
+        """
+        await self.aget_agent(agent_id)
+
+        limit = min(max_concurrency or DEFAULT_BATCH_MAX_CONCURRENCY, DEFAULT_BATCH_MAX_CONCURRENCY)
+        semaphore = asyncio.Semaphore(max(limit, 1))
+
+        async def _invoke_item(item: Dict[str, Any]) -> ChatMessage | Exception:
+            async with semaphore:
+                try:
+                    async with admit() if admit is not None else contextlib.nullcontext():
+                        return await self.invoke(agent_id=agent_id, **item)
+                except Exception as e:
+                    return e
+
+        return list(await asyncio.gather(*(_invoke_item(item) for item in inputs)))
+
+    async def delete_threads(
+        self,
+        agent_id: str,
+        thread_ids: List[str],
+        max_concurrency: Optional[int] = None,
+    ) -> int:
+        """Delete all checkpoints and pending writes of threads through the checkpoint saver of an agent.
+
+        Every thread is removed with a single `adelete_thread` call of the saver, regardless of the
+        length of its history.
+
+        Args:
+            agent_id: ID of the agent whose checkpoint saver stores the threads
+            thread_ids: IDs of the threads to delete
+            max_concurrency: Optional concurrency limit, capped at `DEFAULT_BATCH_MAX_CONCURRENCY`
+
+        Returns:
+            int: Number of distinct threads deleted
+
+        Raises:
+            ValueError: If the agent has no checkpoint saver
+
+        """
+        agent = await self.aget_agent(agent_id)
+        checkpointer = getattr(agent.graph, "checkpointer", None)
+        if not isinstance(checkpointer, BaseCheckpointSaver):
+            raise ValueError(f"Agent '{agent_id}' has no checkpoint saver to delete threads from")
+
+        limit = min(max_concurrency or DEFAULT_BATCH_MAX_CONCURRENCY, DEFAULT_BATCH_MAX_CONCURRENCY)
+        semaphore = asyncio.Semaphore(max(limit, 1))
+        unique_thread_ids = list(dict.fromkeys(thread_ids))
+
+        async def _delete_thread(thread_id: str) -> None:
+            async with semaphore:
+                try:
+                    await checkpointer.adelete_thread(thread_id)
+                finally:
+                    self.interrupt_index.invalidate(agent_id, thread_id)
+
+        await asyncio.gather(*(_delete_thread(thread_id) for thread_id in unique_thread_ids))
+        return len(unique_thread_ids)
+
     @handle_agent_errors
     async def stream(
         self,
@@ -367,9 +633,17 @@ class AgentExecutor:
         stream_tokens: bool = True,
         agent_config: Optional[Dict[str, Any]] = None,
         recursion_limit: Optional[int] = None,
+        resume: Optional[bool] = None,
+        stream_profile: Optional[StreamProfile] = None,
     ) -> AsyncGenerator[str | ChatMessage, None]:
         """Stream an agent's response to a message, yielding either tokens or messages.
 
+        The stream profile selects the events and the LangGraph stream modes behind them:
+        `full` sends tokens, all messages and custom events, `tokens_only` sends only tokens
+        and interrupts, `messages_only` sends complete messages without tokens, and `deltas`
+        sends tokens and does not repeat AI messages already streamed as tokens, except for
+        their tool calls. Without a profile, `stream_tokens` selects `full` or only updates.
+
         Args:
             agent_id: ID of the agent to invoke
             input: User message to send to the agent
@@ -381,120 +655,162 @@ class AgentExecutor:
             stream_tokens: Whether to stream individual tokens
             agent_config: Optional additional configuration for the agent
             recursion_limit: Optional recursion limit for the agent
+            resume: Optional flag whether the input resumes a pending interrupt
+            stream_profile: Optional profile of the events to stream, overrides `stream_tokens`
 
         Yields:
             Either ChatMessage objects for full messages or strings for token chunks
 
         """
-        agent, input_data, config, run_id = await self._setup_agent_execution(
-            agent_id=agent_id,
-            input=input,
-            thread_id=thread_id,
-            user_id=user_id,
-            model_name=model_name,
-            model_provider=model_provider,
-            model_config_key=model_config_key,
-            agent_config=agent_config,
-            recursion_limit=recursion_limit,
-        )
+        with stage("setup"):
+            agent, input_data, config, run_id = await self._setup_agent_execution(
+                agent_id=agent_id,
+                input=input,
+                thread_id=thread_id,
+                user_id=user_id,
+                model_name=model_name,
+                model_provider=model_provider,
+                model_config_key=model_config_key,
+                agent_config=agent_config,
+                recursion_limit=recursion_limit,
+                resume=resume,
+            )
 
-        # Wrap execution in trace context
-        with agent.observability.trace_context(
-            run_id=run_id,
-            user_id=user_id,
-            input=input_data,
-            agent_name=agent.name,
-        ):
-            # Stream from the agent with appropriate modes
-            stream_mode = ["updates", "messages", "custom"] if stream_tokens else ["updates"]
-
-            async for stream_event in agent.graph.astream(input=input_data, config=config, stream_mode=stream_mode):
-                if not isinstance(stream_event, tuple):
-                    continue
-
-                stream_mode, event = stream_event
-                new_messages = []
-
-                if stream_mode == "updates":
-                    for node, updates in event.items():
-                        # A simple approach to handle agent interrupts.
-                        # In a more sophisticated implementation, we could add
-                        # some structured ChatMessage type to return the interrupt value.
-                        if node == "__interrupt__":
-                            interrupt: Interrupt
-                            for interrupt in updates:
-                                new_messages.append(AIMessage(content=interrupt.value))
-                            continue
+        # Remember whether the run ended on an interrupt, so the next request on this thread
+        # does not need to read the checkpoint. Cancelled or failed runs drop the cached flag.
+        thread_id = config["configurable"]["thread_id"]
+        interrupted = False
+        completed = False
+        started_at = time.perf_counter()
+        first_token_recorded = False
+        try:
+            # Wrap execution in trace context
+            with timed_enter(
+                "trace_context",
+                agent.observability.trace_context(
+                    run_id=run_id,
+                    user_id=user_id,
+                    input=input_data,
+                    agent_name=agent.name,
+                ),
+            ):
+                # Stream from the agent with the modes of the profile
+                if stream_profile is not None:
+                    stream_profile = StreamProfile(stream_profile)
+                    stream_mode = STREAM_PROFILE_MODES[stream_profile]
+                else:
+                    stream_mode = STREAM_PROFILE_MODES[StreamProfile.FULL] if stream_tokens else ["updates"]
+                stream_tokens = "messages" in stream_mode
+                # IDs of AI messages already streamed as tokens, not repeated in the `deltas` profile
+                streamed_ids: set[str] = set()
 
-                        update_messages = (updates or {}).get("messages", [])
-
-                        # Special case for supervisor agent
-                        if node == "supervisor":
-                            # Get only the last AIMessage since supervisor includes all previous messages
-                            ai_messages = [msg for msg in update_messages if isinstance(msg, AIMessage)]
-                            if ai_messages:
-                                update_messages = [ai_messages[-1]]
-
-                        # Special case for expert agents
-                        if node in ("research_expert", "math_expert"):
-                            # Convert to ToolMessage so it displays in the UI as a tool response
-                            if update_messages:
-                                msg = ToolMessage(
-                                    content=update_messages[0].content,
-                                    name=node,
-                                    tool_call_id="",
-                                )
-                                update_messages = [msg]
-                        new_messages.extend(update_messages)
-
-                elif stream_mode == "custom":
-                    new_messages = [event]
-
-                elif stream_mode == "messages" and stream_tokens:
-                    msg, metadata = event
-                    if "skip_stream" in metadata.get("tags", []):
-                        continue
-                    # Skip non-LLM nodes that might send messages
-                    if not isinstance(msg, AIMessageChunk):
+                async for stream_event in agent.graph.astream(input=input_data, config=config, stream_mode=stream_mode):
+                    if not isinstance(stream_event, tuple):
                         continue
-                    content = remove_tool_calls(msg.content)
-                    if content:
-                        # Empty content in OpenAI context usually means the model is asking for a tool to be invoked
-                        yield convert_message_content_to_string(content)
-
-                # LangGraph streaming may emit tuples: (field_name, field_value)
-                # e.g. ('content', <str>), ('tool_calls', [ToolCall,...]), ('additional_kwargs', {...}), etc.
-                # We accumulate only supported fields into `parts` and skip unsupported metadata.
-                # More info at: https://langchain-ai.github.io/langgraph/cloud/how-tos/stream_messages/
-                processed_messages = []
-                current_message: dict[str, Any] = {}
-                for msg in new_messages:
-                    if isinstance(msg, tuple):
-                        key, value = msg
-                        # Store parts in temporary dict
-                        current_message[key] = value
-                    else:
-                        # Add complete message if we have one in progress
-                        if current_message:
-                            processed_messages.append(create_ai_message(current_message))
-                            current_message = {}
-                        processed_messages.append(msg)
-
-                # Add any remaining message parts
-                if current_message:
-                    processed_messages.append(create_ai_message(current_message))
-
-                for msg in processed_messages:
-                    try:
-                        chat_message = langchain_to_chat_message(msg)
-                        chat_message.run_id = str(run_id)
-                        # Skip the input message if it's repeated by LangGraph
-                        if chat_message.type == "human" and chat_message.content == msg:
+
+                    stream_mode, event = stream_event
+                    new_messages = []
+
+                    if stream_mode == "updates":
+                        for node, updates in event.items():
+                            # A simple approach to handle agent interrupts.
+                            # In a more sophisticated implementation, we could add
+                            # some structured ChatMessage type to return the interrupt value.
+                            if node == "__interrupt__":
+                                interrupted = True
+                                interrupt: Interrupt
+                                for interrupt in updates:
+                                    new_messages.append(AIMessage(content=interrupt.value))
+                                continue
+                            if stream_profile == StreamProfile.TOKENS_ONLY:
+                                continue
+
+                            update_messages = (updates or {}).get("messages", [])
+
+                            # Special case for supervisor agent
+                            if node == "supervisor":
+                                # Get only the last AIMessage since supervisor includes all previous messages
+                                ai_messages = [msg for msg in update_messages if isinstance(msg, AIMessage)]
+                                if ai_messages:
+                                    update_messages = [ai_messages[-1]]
+
+                            # Special case for expert agents
+                            if node in ("research_expert", "math_expert"):
+                                # Convert to ToolMessage so it displays in the UI as a tool response
+                                if update_messages:
+                                    msg = ToolMessage(
+                                        content=update_messages[0].content,
+                                        name=node,
+                                        tool_call_id="",
+                                    )
+                                    update_messages = [msg]
+                            new_messages.extend(update_messages)
+
+                    elif stream_mode == "custom":
+                        new_messages = [event]
+
+                    elif stream_mode == "messages" and stream_tokens:
+                        msg, metadata = event
+                        if "skip_stream" in metadata.get("tags", []):
                             continue
-                        yield chat_message
-                    except Exception as e:
-                        logger.error(f"Error parsing message: {e}")
-                        continue
+                        # Skip non-LLM nodes that might send messages
+                        if not isinstance(msg, AIMessageChunk):
+                            continue
+                        content = remove_tool_calls(msg.content)
+                        if content:
+                            if stream_profile == StreamProfile.DELTAS and msg.id:
+                                streamed_ids.add(msg.id)
+                            if not first_token_recorded:
+                                first_token_recorded = True
+                                record_stage("first_token", time.perf_counter() - started_at)
+                            # Empty content in OpenAI context usually means the model is asking for a tool to be invoked
+                            yield convert_message_content_to_string(content)
+
+                    # LangGraph streaming may emit tuples: (field_name, field_value)
+                    # e.g. ('content', <str>), ('tool_calls', [ToolCall,...]), ('additional_kwargs', {...}), etc.
+                    # We accumulate only supported fields into `parts` and skip unsupported metadata.
+                    # More info at: https://langchain-ai.github.io/langgraph/cloud/how-tos/stream_messages/
+                    processed_messages = []
+                    current_message: dict[str, Any] = {}
+                    for msg in new_messages:
+                        if isinstance(msg, tuple):
+                            key, value = msg
+                            # Store parts in temporary dict
+                            current_message[key] = value
+                        else:
+                            # Add complete message if we have one in progress
+                            if current_message:
+                                processed_messages.append(create_ai_message(current_message))
+                                current_message = {}
+                            processed_messages.append(msg)
+
+                    # Add any remaining message parts
+                    if current_message:
+                        processed_messages.append(create_ai_message(current_message))
+
+                    for msg in processed_messages:
+                        if isinstance(msg, AIMessage) and msg.id in streamed_ids:
+                            if not msg.tool_calls:
+                                continue
+                            # The content was streamed already, only the tool calls are new
+                            msg = msg.model_copy(update={"content": ""})
+                        try:
+                            chat_message = langchain_to_chat_message(msg)
+                            chat_message.run_id = str(run_id)
+                            # Skip the input message if it's repeated by LangGraph
+                            if chat_message.type == "human" and chat_message.content == msg:
+                                continue
+                            yield chat_message
+                        except Exception as e:
+                            logger.error(f"Error parsing message: {e}")
+                            continue
+            completed = True
+        finally:
+            record_stage("graph", time.perf_counter() - started_at)
+            if completed:
+                self.interrupt_index.set(agent_id, thread_id, interrupted)
+            else:
+                self.interrupt_index.invalidate(agent_id, thread_id)
 
     def save(self, path: str, agent_ids: Optional[List[str]] = None) -> None:
         """Save agents to disk using joblib.
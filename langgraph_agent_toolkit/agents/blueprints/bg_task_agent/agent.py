@@ -33,9 +33,8 @@ async def acall_model(state: AgentState, config: RunnableConfig) -> AgentState:
     # Check for model_config_key in configurable
     model_config_key = config["configurable"].get("model_config_key")
 
-    if model_config_key and model_config_key in settings.MODEL_CONFIGS:
+    if model_config_key and (model_config := settings.get_model_config(model_config_key)):
         # Create model from configuration
-        model_config = settings.MODEL_CONFIGS[model_config_key]
         m = CompletionModelFactory.get_model_from_config(model_config)
     else:
         # Fall back to traditional approach
@@ -155,9 +155,8 @@ async def acall_model(state: AgentState, config: RunnableConfig) -> AgentState:
     # Check if a model_config is specified in agent_config
     model_config_key = config["configurable"].get("agent_config", {}).get("model_config")
 
-    if model_config_key and model_config_key in settings.MODEL_CONFIGS:
+    if model_config_key and (model_config := settings.get_model_config(model_config_key)):
         # Use the model configuration from settings
-        model_config = settings.MODEL_CONFIGS[model_config_key]
         model = CompletionModelFactory.get_model_from_config(model_config)
     else:
         # Fall back to the traditional approach
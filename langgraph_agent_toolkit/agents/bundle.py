@@ -0,0 +1,175 @@
+import os
+import time
+from pathlib import Path
+from typing import Annotated, Any, Dict, List, Optional, Sequence
+
+from pydantic import BaseModel, Field, SecretStr, TypeAdapter
+from pydantic_core import to_jsonable_python
+
+from langgraph_agent_toolkit import __version__
+from langgraph_agent_toolkit.agents.agent_executor import AgentExecutor
+from langgraph_agent_toolkit.core.observability.base import BaseObservabilityPlatform
+from langgraph_agent_toolkit.core.observability.empty import EmptyObservability
+from langgraph_agent_toolkit.core.observability.factory import ObservabilityFactory
+from langgraph_agent_toolkit.core.observability.types import ObservabilityBackend
+from langgraph_agent_toolkit.core.settings import settings
+from langgraph_agent_toolkit.helper.exceptions import AgentConfigurationError
+from langgraph_agent_toolkit.helper.logging import logger
+
+
+BUNDLE_FORMAT_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+PROMPTS_DIR = "prompts"
+
+# Settings replaced by the bundle itself or that may hold credentials
+_EXCLUDED_SETTINGS = ("AGENT_PATHS", "AGENT_BUNDLE_PATH", "MODEL_CONFIGS", "DB_CONFIGS")
+
+
+class BundledAgent(BaseModel):
+    """An agent of a bundle, imported on first use."""
+
+    import_path: str = Field(description="Import string of the agent, '<module>:<object>'")
+    description: str = Field(description="Description of the agent")
+
+
+class BundleManifest(BaseModel):
+    """Contents of an agent bundle."""
+
+    format_version: int = Field(default=BUNDLE_FORMAT_VERSION, description="Version of the bundle format")
+    toolkit_version: str = Field(default=__version__, description="Toolkit version that built the bundle")
+    created_at: float = Field(default_factory=time.time, description="Build time as a Unix timestamp")
+    agents: Dict[str, BundledAgent] = Field(description="Agents by ID")
+    settings: Dict[str, Any] = Field(default_factory=dict, description="Settings at build time, without secrets")
+    prompts: List[str] = Field(default_factory=list, description="Names of the prompts pulled at build time")
+
+
+def snapshot_settings() -> Dict[str, Any]:
+    """Return the JSON-compatible settings, leaving out secrets."""
+    values = {}
+    for key in type(settings).model_fields:
+        value = getattr(settings, key)
+        if key.startswith(_EXCLUDED_SETTINGS) or isinstance(value, SecretStr):
+            continue
+        values[key] = value
+    return to_jsonable_python(values)
+
+
+def apply_settings_snapshot(snapshot: Dict[str, Any]) -> List[str]:
+    """Apply bundled settings that are not set in the environment.
+
+    Returns:
+        List[str]: Names of the applied settings
+
+    """
+    fields = type(settings).model_fields
+    applied = []
+    for key, value in snapshot.items():
+        if key not in fields or key in os.environ:
+            continue
+        field = fields[key]
+        annotation = Annotated[(field.annotation, *field.metadata)] if field.metadata else field.annotation
+        setattr(settings, key, TypeAdapter(annotation).validate_python(value))
+        applied.append(key)
+    return applied
+
+
+def build_bundle(
+    path: str | Path,
+    agent_paths: Optional[Sequence[str]] = None,
+    prompt_names: Sequence[str] = (),
+    observability: Optional[BaseObservabilityPlatform] = None,
+    template_format: str = "f-string",
+) -> BundleManifest:
+    """Build an agent bundle from the configured agents.
+
+    Every agent is imported once to check it and record its description. The prompts are
+    pulled from the observability platform and stored in the bundle, so loading it does
+    not pull them over the network.
+
+    Args:
+        path: Directory of the bundle
+        agent_paths: Agents to bundle, defaults to `AGENT_PATHS`
+        prompt_names: Names of the prompts to pull into the bundle
+        observability: Platform to pull the prompts from, defaults to `OBSERVABILITY_BACKEND`
+        template_format: Template format of the pulled prompts
+
+    Raises:
+        AgentConfigurationError: If an agent cannot be imported
+
+    """
+    bundle_dir = Path(path)
+    bundle_dir.mkdir(exist_ok=True, parents=True)
+
+    executor = AgentExecutor(*(agent_paths or settings.AGENT_PATHS))
+    loaded = executor.warmup()
+    failed = [agent_id for agent_id in executor.agent_ids if agent_id not in loaded]
+    if failed:
+        raise AgentConfigurationError(f"Cannot bundle agents that failed to load: {', '.join(failed)}")
+
+    import_paths = executor.import_paths
+    agents = {
+        agent_id: BundledAgent(import_path=import_paths[agent_id], description=executor.agents[agent_id].description)
+        for agent_id in executor.agent_ids
+    }
+
+    if prompt_names:
+        platform = observability or ObservabilityFactory.create(
+            settings.OBSERVABILITY_BACKEND or ObservabilityBackend.EMPTY
+        )
+        writer = EmptyObservability(prompts_dir=str(bundle_dir / PROMPTS_DIR))
+        for name in prompt_names:
+            writer.push_prompt(name, platform.pull_prompt(name, template_format=template_format))
+
+    manifest = BundleManifest(agents=agents, settings=snapshot_settings(), prompts=list(prompt_names))
+    # The manifest is written last, so an interrupted build does not leave a loadable bundle
+    tmp_path = bundle_dir / f"{MANIFEST_FILE}.tmp"
+    tmp_path.write_text(manifest.model_dump_json(indent=2))
+    tmp_path.replace(bundle_dir / MANIFEST_FILE)
+    logger.info(f"Built agent bundle {bundle_dir} with agents {list(agents)} and {len(prompt_names)} prompts")
+    return manifest
+
+
+def read_manifest(path: str | Path) -> BundleManifest:
+    """Read the manifest of an agent bundle.
+
+    Raises:
+        ValueError: If the bundle was built with an unsupported format version
+
+    """
+    manifest = BundleManifest.model_validate_json((Path(path) / MANIFEST_FILE).read_bytes())
+    if manifest.format_version != BUNDLE_FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported agent bundle format version {manifest.format_version}, expected {BUNDLE_FORMAT_VERSION}"
+        )
+    if manifest.toolkit_version != __version__:
+        logger.warning(f"Agent bundle was built with version {manifest.toolkit_version}, running {__version__}")
+    return manifest
+
+
+def load_bundle(path: str | Path, apply_settings: bool = True) -> AgentExecutor:
+    """Create an AgentExecutor from an agent bundle without importing its agents.
+
+    Agents are imported on first use. Bundled prompts are served by all observability
+    platforms instead of being pulled or pushed remotely.
+
+    Args:
+        path: Directory of the bundle
+        apply_settings: Whether to apply bundled settings that are not set in the environment
+
+    """
+    started_at = time.perf_counter()
+    bundle_dir = Path(path)
+    manifest = read_manifest(bundle_dir)
+
+    if apply_settings:
+        applied = apply_settings_snapshot(manifest.settings)
+        logger.debug(f"Applied bundled settings: {applied}")
+    if manifest.prompts:
+        BaseObservabilityPlatform.use_prompt_snapshot(bundle_dir / PROMPTS_DIR)
+
+    executor = AgentExecutor(
+        *(f"{agent_id}={agent.import_path}" for agent_id, agent in manifest.agents.items()),
+        descriptions={agent_id: agent.description for agent_id, agent in manifest.agents.items()},
+    )
+    logger.info(f"Loaded agent bundle {bundle_dir} in {(time.perf_counter() - started_at) * 1000:.1f}ms")
+    return executor
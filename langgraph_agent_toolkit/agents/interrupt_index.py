@@ -0,0 +1,100 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.pregel import Pregel
+
+from langgraph_agent_toolkit.helper.constants import (
+    DEFAULT_INTERRUPT_INDEX_MAX_SIZE,
+    DEFAULT_INTERRUPT_INDEX_TTL_SECOND,
+)
+
+
+INTERRUPT_CHANNEL = "__interrupt__"
+
+
+class PendingInterruptIndex:
+    """Per-thread index of pending interrupts.
+
+    The index is updated whenever a run ends, so follow-up requests on the same thread know whether
+    they resume an interrupt without reading the checkpoint again. On a cache miss only the latest
+    checkpoint tuple is read, where LangGraph persists interrupts as pending writes, instead of
+    assembling the full state snapshot with `aget_state`.
+
+    Both positive and negative flags are cached per process. Runs and manual state updates only
+    refresh the index of the process serving them, so callers writing the state directly must call
+    `invalidate`. Entries expire after a TTL, which bounds staleness when several replicas or
+    workers serve the same thread without sticky sessions; such deployments need a short TTL
+    (`DEFAULT_INTERRUPT_INDEX_TTL_SECOND`) or clients sending the explicit `resume` flag, which
+    bypasses the lookup entirely.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_INTERRUPT_INDEX_MAX_SIZE,
+        ttl_seconds: float = DEFAULT_INTERRUPT_INDEX_TTL_SECOND,
+    ):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[Tuple[str, str], Tuple[float, bool]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, agent_id: str, thread_id: str) -> Optional[bool]:
+        """Return the cached pending-interrupt flag, or None if unknown or expired."""
+        key = (agent_id, thread_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            updated_at, pending = entry
+            if self.ttl_seconds > 0 and time.monotonic() - updated_at >= self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return pending
+
+    def set(self, agent_id: str, thread_id: str, pending: bool) -> None:
+        """Record whether the thread has a pending interrupt after a run ended."""
+        if self.max_size <= 0:
+            return
+        key = (agent_id, thread_id)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), pending)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, agent_id: str, thread_id: str) -> None:
+        """Forget the cached flag for a thread, e.g. after a failed run or a manual state update."""
+        with self._lock:
+            self._entries.pop((agent_id, thread_id), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    async def read_pending_interrupt(graph: Pregel, config: RunnableConfig) -> bool:
+        """Read whether the latest checkpoint of a thread has pending interrupts."""
+        checkpointer = getattr(graph, "checkpointer", None)
+        if isinstance(checkpointer, BaseCheckpointSaver):
+            checkpoint_tuple = await checkpointer.aget_tuple(config)
+            if checkpoint_tuple is None:
+                return False
+            return any(write[1] == INTERRUPT_CHANNEL for write in checkpoint_tuple.pending_writes or [])
+
+        # Graphs without an attached saver (e.g. inherited checkpointers) need the full state lookup
+        state = await graph.aget_state(config=config)
+        return any(getattr(task, "interrupts", None) for task in state.tasks)
+
+    async def has_pending_interrupt(self, agent_id: str, graph: Pregel, config: RunnableConfig) -> bool:
+        """Return whether the thread in `config` is waiting for an interrupt to be resumed."""
+        thread_id = str(config["configurable"]["thread_id"])
+        pending = self.get(agent_id, thread_id)
+        if pending is None:
+            pending = await self.read_pending_interrupt(graph, config)
+            self.set(agent_id, thread_id, pending)
+        return pending
@@ -1,21 +1,29 @@
 import json
 import os
-from collections.abc import AsyncGenerator, Generator
+from collections.abc import AsyncGenerator, AsyncIterable, Generator, Iterable
 from typing import Any, Dict
 
 import httpx
 
+from langgraph_agent_toolkit.helper.types import StreamProfile
 from langgraph_agent_toolkit.schema import (
     AddMessagesInput,
     AddMessagesResponse,
+    BatchInput,
+    BatchResponse,
     ChatHistory,
     ChatHistoryInput,
     ChatMessage,
     ClearHistoryInput,
     ClearHistoryResponse,
+    DeleteThreadsInput,
+    DeleteThreadsResponse,
     Feedback,
     FeedbackResponse,
+    HistoryImportEvent,
+    HistoryImportRecord,
     MessageInput,
+    RunResponse,
     ServiceMetadata,
     StreamInput,
     UserComplexInput,
@@ -27,6 +35,13 @@ class AgentClientError(Exception):
     pass
 
 
+def _encode_import_record(record: HistoryImportRecord | dict[str, Any]) -> bytes:
+    # Plain dicts are sent as they are, so invalid records are reported by the service per line
+    if isinstance(record, HistoryImportRecord):
+        return record.model_dump_json(exclude_none=True).encode("utf-8") + b"\n"
+    return json.dumps(record).encode("utf-8") + b"\n"
+
+
 class AgentClient:
     """Client for interacting with the agent service."""
 
@@ -101,6 +116,7 @@ class AgentClient:
         user_id: str | None = None,
         agent_config: dict[str, Any] | None = None,
         recursion_limit: int | None = None,
+        resume: bool | None = None,
     ) -> ChatMessage:
         """Invoke the agent asynchronously. Only the final message is returned.
 
@@ -113,6 +129,7 @@ class AgentClient:
             user_id (str, optional): User ID for identifying the user
             agent_config (dict[str, Any], optional): Additional configuration to pass through to the agent
             recursion_limit (int, optional): Recursion limit for the agent
+            resume (bool, optional): Whether the input resumes a pending interrupt
 
         Returns:
             ChatMessage: The response from the agent
@@ -136,6 +153,8 @@ class AgentClient:
             request.user_id = user_id
         if recursion_limit is not None:
             request.recursion_limit = recursion_limit
+        if resume is not None:
+            request.resume = resume
 
         async with httpx.AsyncClient() as client:
             try:
@@ -161,6 +180,7 @@ class AgentClient:
         user_id: str | None = None,
         agent_config: dict[str, Any] | None = None,
         recursion_limit: int | None = None,
+        resume: bool | None = None,
     ) -> ChatMessage:
         """Invoke the agent synchronously. Only the final message is returned.
 
@@ -173,6 +193,7 @@ class AgentClient:
             user_id (str, optional): User ID for identifying the user
             agent_config (dict[str, Any], optional): Additional configuration to pass through to the agent
             recursion_limit (int, optional): Recursion limit for the agent
+            resume (bool, optional): Whether the input resumes a pending interrupt
 
         Returns:
             ChatMessage: The response from the agent
@@ -196,6 +217,8 @@ class AgentClient:
             request.user_id = user_id
         if recursion_limit is not None:
             request.recursion_limit = recursion_limit
+        if resume is not None:
+            request.resume = resume
 
         try:
             response = httpx.post(
@@ -210,6 +233,180 @@ class AgentClient:
 
         return ChatMessage.model_validate(response.json())
 
+    def _batch_request(self, inputs: list[UserInput | Dict[str, Any]], max_concurrency: int | None) -> BatchInput:
+        if not self.agent:
+            raise AgentClientError("No agent selected. Use update_agent() to select an agent.")
+
+        return BatchInput(
+            inputs=[i if isinstance(i, UserInput) else UserInput.model_validate(i) for i in inputs],
+            max_concurrency=max_concurrency,
+        )
+
+    async def abatch(
+        self,
+        inputs: list[UserInput | Dict[str, Any]],
+        max_concurrency: int | None = None,
+    ) -> BatchResponse:
+        """Invoke the agent asynchronously with many independent inputs in a single request.
+
+        Args:
+            inputs (list[UserInput | Dict[str, Any]]): User inputs, either as UserInput or as its dict form,
+                e.g. `{"input": {"message": "Hello"}, "thread_id": "..."}`
+            max_concurrency (int, optional): Maximum number of inputs processed at the same time on the server
+
+        Returns:
+            BatchResponse: Per-input results in the order of `inputs`
+
+        """
+        request = self._batch_request(inputs, max_concurrency)
+
+        async with httpx.AsyncClient() as client:
+            try:
+                response = await client.post(
+                    f"{self.base_url}/{self.agent}/batch",
+                    json=request.model_dump(),
+                    headers=self._headers,
+                    timeout=self.timeout,
+                )
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                raise AgentClientError(f"Error: {e}")
+
+        return BatchResponse.model_validate(response.json())
+
+    def batch(
+        self,
+        inputs: list[UserInput | Dict[str, Any]],
+        max_concurrency: int | None = None,
+    ) -> BatchResponse:
+        """Invoke the agent synchronously with many independent inputs in a single request.
+
+        Args:
+            inputs (list[UserInput | Dict[str, Any]]): User inputs, either as UserInput or as its dict form,
+                e.g. `{"input": {"message": "Hello"}, "thread_id": "..."}`
+            max_concurrency (int, optional): Maximum number of inputs processed at the same time on the server
+
+        Returns:
+            BatchResponse: Per-input results in the order of `inputs`
+
+        """
+        request = self._batch_request(inputs, max_concurrency)
+
+        try:
+            response = httpx.post(
+                f"{self.base_url}/{self.agent}/batch",
+                json=request.model_dump(),
+                headers=self._headers,
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            raise AgentClientError(f"Error: {e}")
+
+        return BatchResponse.model_validate(response.json())
+
+    async def acreate_run(self, user_input: UserInput | Dict[str, Any]) -> RunResponse:
+        """Submit a run for background execution on the server.
+
+        Args:
+            user_input (UserInput | Dict[str, Any]): User input, either as UserInput or as its dict form,
+                e.g. `{"input": {"message": "Hello"}, "thread_id": "..."}`
+
+        Returns:
+            RunResponse: The pending run. Use `aget_run` to poll for its result.
+
+        """
+        if not self.agent:
+            raise AgentClientError("No agent selected. Use update_agent() to select an agent.")
+
+        request = user_input if isinstance(user_input, UserInput) else UserInput.model_validate(user_input)
+        async with httpx.AsyncClient() as client:
+            try:
+                response = await client.post(
+                    f"{self.base_url}/{self.agent}/runs",
+                    json=request.model_dump(),
+                    headers=self._headers,
+                    timeout=self.timeout,
+                )
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                raise AgentClientError(f"Error: {e}")
+
+        return RunResponse.model_validate(response.json())
+
+    def create_run(self, user_input: UserInput | Dict[str, Any]) -> RunResponse:
+        """Submit a run for background execution on the server.
+
+        Args:
+            user_input (UserInput | Dict[str, Any]): User input, either as UserInput or as its dict form,
+                e.g. `{"input": {"message": "Hello"}, "thread_id": "..."}`
+
+        Returns:
+            RunResponse: The pending run. Use `get_run` to poll for its result.
+
+        """
+        if not self.agent:
+            raise AgentClientError("No agent selected. Use update_agent() to select an agent.")
+
+        request = user_input if isinstance(user_input, UserInput) else UserInput.model_validate(user_input)
+        try:
+            response = httpx.post(
+                f"{self.base_url}/{self.agent}/runs",
+                json=request.model_dump(),
+                headers=self._headers,
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            raise AgentClientError(f"Error: {e}")
+
+        return RunResponse.model_validate(response.json())
+
+    async def aget_run(self, run_id: str) -> RunResponse:
+        """Get the status and result of a submitted run.
+
+        Args:
+            run_id (str): ID returned by `acreate_run`
+
+        Returns:
+            RunResponse: The current state of the run
+
+        """
+        async with httpx.AsyncClient() as client:
+            try:
+                response = await client.get(
+                    f"{self.base_url}/runs/{run_id}",
+                    headers=self._headers,
+                    timeout=self.timeout,
+                )
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                raise AgentClientError(f"Error: {e}")
+
+        return RunResponse.model_validate(response.json())
+
+    def get_run(self, run_id: str) -> RunResponse:
+        """Get the status and result of a submitted run.
+
+        Args:
+            run_id (str): ID returned by `create_run`
+
+        Returns:
+            RunResponse: The current state of the run
+
+        """
+        try:
+            response = httpx.get(
+                f"{self.base_url}/runs/{run_id}",
+                headers=self._headers,
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            raise AgentClientError(f"Error: {e}")
+
+        return RunResponse.model_validate(response.json())
+
     def _parse_stream_line(self, line: str) -> ChatMessage | str | None:
         line = line.strip()
         if line.startswith("data: "):
@@ -245,7 +442,9 @@ class AgentClient:
         user_id: str | None = None,
         agent_config: dict[str, Any] | None = None,
         recursion_limit: int | None = None,
+        resume: bool | None = None,
         stream_tokens: bool = True,
+        stream_profile: StreamProfile | str | None = None,
     ) -> Generator[ChatMessage | str, None, None]:
         """Stream the agent's response synchronously.
 
@@ -262,8 +461,11 @@ class AgentClient:
             user_id (str, optional): User ID for identifying the user
             agent_config (dict[str, Any], optional): Additional configuration to pass through to the agent
             recursion_limit (int, optional): Recursion limit for the agent
+            resume (bool, optional): Whether the input resumes a pending interrupt
             stream_tokens (bool, optional): Stream tokens as they are generated
                 Default: True
+            stream_profile (StreamProfile | str, optional): Events to stream, one of "full", "tokens_only",
+                "messages_only" or "deltas". Overrides stream_tokens if set.
 
         Returns:
             Generator[ChatMessage | str, None, None]: The response from the agent
@@ -287,6 +489,10 @@ class AgentClient:
             request.user_id = user_id
         if recursion_limit is not None:
             request.recursion_limit = recursion_limit
+        if resume is not None:
+            request.resume = resume
+        if stream_profile is not None:
+            request.stream_profile = StreamProfile(stream_profile)
 
         try:
             with httpx.stream(
@@ -318,7 +524,9 @@ class AgentClient:
         user_id: str | None = None,
         agent_config: dict[str, Any] | None = None,
         recursion_limit: int | None = None,
+        resume: bool | None = None,
         stream_tokens: bool = True,
+        stream_profile: StreamProfile | str | None = None,
     ) -> AsyncGenerator[ChatMessage | str, None]:
         """Stream the agent's response asynchronously.
 
@@ -335,8 +543,11 @@ class AgentClient:
             user_id (str, optional): User ID for identifying the user
             agent_config (dict[str, Any], optional): Additional configuration to pass through to the agent
             recursion_limit (int, optional): Recursion limit for the agent
+            resume (bool, optional): Whether the input resumes a pending interrupt
             stream_tokens (bool, optional): Stream tokens as they are generated
                 Default: True
+            stream_profile (StreamProfile | str, optional): Events to stream, one of "full", "tokens_only",
+                "messages_only" or "deltas". Overrides stream_tokens if set.
 
         Returns:
             AsyncGenerator[ChatMessage | str, None]: The response from the agent
@@ -360,6 +571,10 @@ class AgentClient:
             request.user_id = user_id
         if recursion_limit is not None:
             request.recursion_limit = recursion_limit
+        if resume is not None:
+            request.resume = resume
+        if stream_profile is not None:
+            request.stream_profile = StreamProfile(stream_profile)
 
         async with httpx.AsyncClient() as client:
             try:
@@ -422,19 +637,25 @@ class AgentClient:
         self,
         thread_id: str,
         user_id: str | None = None,
+        limit: int | None = None,
+        before: str | None = None,
+        after: str | None = None,
     ) -> ChatHistory:
         """Get chat history.
 
         Args:
             thread_id (str, optional): Thread ID for identifying a conversation
             user_id (str, optional): User ID for identifying the user
+            limit (int, optional): Maximum number of messages, the latest ones without a cursor
+            before (str, optional): Return only messages before the message with this ID
+            after (str, optional): Return only messages after the message with this ID
 
         """
-        request = ChatHistoryInput(thread_id=thread_id, user_id=user_id)
+        request = ChatHistoryInput(thread_id=thread_id, user_id=user_id, limit=limit, before=before, after=after)
         try:
             response = httpx.get(
                 f"{self.base_url}/{self.agent}/history" if self.agent else f"{self.base_url}/history",
-                params=request.model_dump(),
+                params=request.model_dump(exclude_none=True),
                 headers=self._headers,
                 timeout=self.timeout,
             )
@@ -448,20 +669,26 @@ class AgentClient:
         self,
         thread_id: str,
         user_id: str | None = None,
+        limit: int | None = None,
+        before: str | None = None,
+        after: str | None = None,
     ) -> ChatHistory:
         """Get chat history asynchronously.
 
         Args:
             thread_id (str, optional): Thread ID for identifying a conversation
             user_id (str, optional): User ID for identifying the user
+            limit (int, optional): Maximum number of messages, the latest ones without a cursor
+            before (str, optional): Return only messages before the message with this ID
+            after (str, optional): Return only messages after the message with this ID
 
         """
-        request = ChatHistoryInput(thread_id=thread_id, user_id=user_id)
+        request = ChatHistoryInput(thread_id=thread_id, user_id=user_id, limit=limit, before=before, after=after)
         async with httpx.AsyncClient() as client:
             try:
                 response = await client.get(
                     f"{self.base_url}/{self.agent}/history" if self.agent else f"{self.base_url}/history",
-                    params=request.model_dump(),
+                    params=request.model_dump(exclude_none=True),
                     headers=self._headers,
                     timeout=self.timeout,
                 )
@@ -475,18 +702,20 @@ class AgentClient:
         self,
         thread_id: str | None = None,
         user_id: str | None = None,
+        delete_thread: bool = False,
     ) -> ClearHistoryResponse:
         """Clear chat history.
 
         Args:
             thread_id (str, optional): Thread ID for identifying a conversation
             user_id (str, optional): User ID for identifying the user
+            delete_thread (bool, optional): Delete all checkpoints of the thread instead of removing its messages
 
         """
         if not thread_id and not user_id:
             raise AgentClientError("At least one of thread_id or user_id must be provided")
 
-        request = ClearHistoryInput(thread_id=thread_id, user_id=user_id)
+        request = ClearHistoryInput(thread_id=thread_id, user_id=user_id, delete_thread=delete_thread)
         try:
             response = httpx.delete(
                 f"{self.base_url}/{self.agent}/history/clear" if self.agent else f"{self.base_url}/history/clear",
@@ -504,18 +733,20 @@ class AgentClient:
         self,
         thread_id: str | None = None,
         user_id: str | None = None,
+        delete_thread: bool = False,
     ) -> ClearHistoryResponse:
         """Clear chat history asynchronously.
 
         Args:
             thread_id (str, optional): Thread ID for identifying a conversation
             user_id (str, optional): User ID for identifying the user
+            delete_thread (bool, optional): Delete all checkpoints of the thread instead of removing its messages
 
         """
         if not thread_id and not user_id:
             raise AgentClientError("At least one of thread_id or user_id must be provided")
 
-        request = ClearHistoryInput(thread_id=thread_id, user_id=user_id)
+        request = ClearHistoryInput(thread_id=thread_id, user_id=user_id, delete_thread=delete_thread)
         async with httpx.AsyncClient() as client:
             try:
                 response = await client.delete(
@@ -530,6 +761,125 @@ class AgentClient:
 
         return ClearHistoryResponse.model_validate(response.json())
 
+    def import_history(
+        self,
+        records: Iterable[HistoryImportRecord | dict[str, Any]],
+        max_concurrency: int | None = None,
+    ) -> Generator[HistoryImportEvent, None, None]:
+        """Import conversations of many threads, streaming the records as NDJSON.
+
+        Args:
+            records (Iterable[HistoryImportRecord | dict[str, Any]]): Conversations to import, consumed lazily
+            max_concurrency (int, optional): Maximum number of records written at the same time
+
+        Returns:
+            Generator[HistoryImportEvent, None, None]: Error events of failed records, progress events
+                and the final summary
+
+        """
+        try:
+            with httpx.stream(
+                "POST",
+                f"{self.base_url}/{self.agent}/history/import" if self.agent else f"{self.base_url}/history/import",
+                content=(_encode_import_record(record) for record in records),
+                params={"max_concurrency": max_concurrency} if max_concurrency else None,
+                headers={**self._headers, "Content-Type": "application/x-ndjson"},
+                timeout=self.timeout,
+            ) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if line.strip():
+                        yield HistoryImportEvent.model_validate_json(line)
+        except httpx.HTTPError as e:
+            raise AgentClientError(f"Error: {e}")
+
+    async def aimport_history(
+        self,
+        records: Iterable[HistoryImportRecord | dict[str, Any]] | AsyncIterable[HistoryImportRecord | dict[str, Any]],
+        max_concurrency: int | None = None,
+    ) -> AsyncGenerator[HistoryImportEvent, None]:
+        """Import conversations of many threads asynchronously, streaming the records as NDJSON.
+
+        Args:
+            records (Iterable | AsyncIterable): Conversations to import, consumed lazily
+            max_concurrency (int, optional): Maximum number of records written at the same time
+
+        Returns:
+            AsyncGenerator[HistoryImportEvent, None]: Error events of failed records, progress events
+                and the final summary
+
+        """
+
+        async def content() -> AsyncGenerator[bytes, None]:
+            if isinstance(records, AsyncIterable):
+                async for record in records:
+                    yield _encode_import_record(record)
+            else:
+                for record in records:
+                    yield _encode_import_record(record)
+
+        async with httpx.AsyncClient() as client:
+            try:
+                async with client.stream(
+                    "POST",
+                    f"{self.base_url}/{self.agent}/history/import" if self.agent else f"{self.base_url}/history/import",
+                    content=content(),
+                    params={"max_concurrency": max_concurrency} if max_concurrency else None,
+                    headers={**self._headers, "Content-Type": "application/x-ndjson"},
+                    timeout=self.timeout,
+                ) as response:
+                    response.raise_for_status()
+                    async for line in response.aiter_lines():
+                        if line.strip():
+                            yield HistoryImportEvent.model_validate_json(line)
+            except httpx.HTTPError as e:
+                raise AgentClientError(f"Error: {e}")
+
+    def delete_threads(self, thread_ids: list[str]) -> DeleteThreadsResponse:
+        """Delete threads with all their checkpoints.
+
+        Args:
+            thread_ids (list[str]): IDs of the threads to delete
+
+        """
+        request = DeleteThreadsInput(thread_ids=thread_ids)
+        try:
+            response = httpx.request(
+                "DELETE",
+                f"{self.base_url}/{self.agent}/threads" if self.agent else f"{self.base_url}/threads",
+                json=request.model_dump(),
+                headers=self._headers,
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            raise AgentClientError(f"Error: {e}")
+
+        return DeleteThreadsResponse.model_validate(response.json())
+
+    async def adelete_threads(self, thread_ids: list[str]) -> DeleteThreadsResponse:
+        """Delete threads with all their checkpoints asynchronously.
+
+        Args:
+            thread_ids (list[str]): IDs of the threads to delete
+
+        """
+        request = DeleteThreadsInput(thread_ids=thread_ids)
+        async with httpx.AsyncClient() as client:
+            try:
+                response = await client.request(
+                    "DELETE",
+                    f"{self.base_url}/{self.agent}/threads" if self.agent else f"{self.base_url}/threads",
+                    json=request.model_dump(),
+                    headers=self._headers,
+                    timeout=self.timeout,
+                )
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                raise AgentClientError(f"Error: {e}")
+
+        return DeleteThreadsResponse.model_validate(response.json())
+
     def add_messages(
         self,
         messages: list[dict[str, str]] | list[MessageInput],
@@ -12,10 +12,12 @@ from pydantic import (
 )
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from langgraph_agent_toolkit.core.idempotency.types import IdempotencyBackends
 from langgraph_agent_toolkit.core.memory.types import MemoryBackends
 from langgraph_agent_toolkit.core.observability.types import ObservabilityBackend
+from langgraph_agent_toolkit.core.queue.types import RunQueueBackends
 from langgraph_agent_toolkit.helper.logging import logger
-from langgraph_agent_toolkit.helper.types import EnvironmentMode
+from langgraph_agent_toolkit.helper.types import EnvironmentMode, StreamBufferPolicy
 from langgraph_agent_toolkit.helper.utils import check_str_is_http
 
 
@@ -32,7 +34,12 @@ class Settings(BaseSettings):
     HOST: str = "0.0.0.0"
     PORT: int = 8080
 
+    # Request logging middleware, server errors are always logged
+    REQUEST_LOG_SAMPLE_RATE: float = Field(default=1.0, ge=0.0, le=1.0, description="Share of requests logged")
+    REQUEST_LOG_EXCLUDE_PATHS: list[str] = Field(default=["/health"], description="Paths that are never logged")
+
     AUTH_SECRET: SecretStr | None = None
+    METRICS_PUBLIC: bool = Field(default=False, description="Serve `/metrics` without the `AUTH_SECRET` bearer token")
     USE_FAKE_MODEL: bool = False
 
     # OpenAI Settings
@@ -78,11 +85,18 @@ class Settings(BaseSettings):
     OBSERVABILITY_BACKEND: ObservabilityBackend | None = None
 
     # Agent configuration
+    # "<agent_id>=<module>:<object>" entries are imported on first use, "<module>:<object>" ones at startup
     AGENT_PATHS: list[str] = [
-        "langgraph_agent_toolkit.agents.blueprints.react.agent:react_agent",
-        "langgraph_agent_toolkit.agents.blueprints.chatbot.agent:chatbot_agent",
-        "langgraph_agent_toolkit.agents.blueprints.react_so.agent:react_agent_so",
+        "react-agent=langgraph_agent_toolkit.agents.blueprints.react.agent:react_agent",
+        "chatbot-agent=langgraph_agent_toolkit.agents.blueprints.chatbot.agent:chatbot_agent",
+        "react-agent-so=langgraph_agent_toolkit.agents.blueprints.react_so.agent:react_agent_so",
     ]
+    AGENT_WARMUP: list[str] = Field(
+        default_factory=list, description="IDs of lazily loaded agents imported at startup, '*' for all"
+    )
+    AGENT_BUNDLE_PATH: str | None = Field(
+        default=None, description="Directory of an agent bundle used instead of AGENT_PATHS"
+    )
 
     LANGCHAIN_TRACING_V2: bool = False
     LANGCHAIN_PROJECT: str = "default"
@@ -110,10 +124,69 @@ class Settings(BaseSettings):
     POSTGRES_MIN_SIZE: int = Field(default=10, description="Minimum number of connections in the pool")
     POSTGRES_MAX_IDLE: int = Field(default=300, description="Maximum number of idle connections")
 
+    # Shared outbound HTTP clients used by LLM and embedding providers
+    HTTP_SHARED_CLIENTS: bool = True
+    HTTP_MAX_CONNECTIONS: int = Field(default=100, description="Maximum number of connections per HTTP pool")
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = Field(
+        default=20, description="Maximum number of idle keep-alive connections per HTTP pool"
+    )
+    HTTP_KEEPALIVE_EXPIRY: float = Field(default=30.0, description="Idle keep-alive connection expiry in seconds")
+    HTTP_HTTP2: bool = Field(default=False, description="Enable HTTP/2 for outbound pools (requires `h2`)")
+
+    # Token coalescing of the SSE stream, can be overridden per request
+    SSE_COALESCE_MS: int = Field(default=0, description="Default token coalescing window in ms, 0 disables it")
+    SSE_COALESCE_BYTES: int = Field(default=4096, description="Flush coalesced tokens once they reach this size")
+    SSE_DISCONNECT_CHECK_INTERVAL: float = Field(
+        default=0.5, description="Seconds between client disconnection checks of a stream, 0 disables them"
+    )
+    SSE_BUFFER_SIZE: int = Field(default=256, description="Maximum events buffered for a slow client, 0 is unbounded")
+    SSE_BUFFER_POLICY: StreamBufferPolicy = Field(
+        default=StreamBufferPolicy.BLOCK, description="Policy of a full stream buffer: block, merge_tokens, drop_tokens"
+    )
+
+    # Gunicorn runner
+    GUNICORN_WORKERS: int = Field(default=1, description="Number of gunicorn workers, 0 starts one per CPU")
+    GUNICORN_PRELOAD: bool = Field(
+        default=True, description="Import the agents in the master process before forking workers"
+    )
+
+    # Response compression negotiated with `Accept-Encoding`
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = Field(default=1024, description="Minimum size in bytes of a response to compress")
+    COMPRESSION_ENCODINGS: list[str] = Field(
+        default=["zstd", "br", "gzip"], description="Encodings in order of preference, br and zstd need extra packages"
+    )
+
+    # Background runs submitted through the `/runs` endpoints
+    RUN_QUEUE_BACKEND: RunQueueBackends = RunQueueBackends.MEMORY
+    RUN_WORKERS: int = Field(default=4, description="Number of in-process run workers, 0 disables background runs")
+    RUN_QUEUE_MAX_SIZE: int = Field(default=1000, description="Maximum number of pending runs")
+    RUN_RESULT_TTL: float = Field(default=3600.0, description="Seconds to keep results of finished runs")
+
+    # Responses of `/invoke` and `/batch` requests sent with an `Idempotency-Key` header
+    IDEMPOTENCY_BACKEND: IdempotencyBackends = IdempotencyBackends.MEMORY
+    IDEMPOTENCY_TTL: float = Field(default=86400.0, description="Seconds to keep responses of idempotent requests")
+    IDEMPOTENCY_MAX_ENTRIES: int = Field(
+        default=10000, description="Maximum number of responses kept by the in-memory backend"
+    )
+
+    # Admission control of `/invoke` and `/stream` runs, a limit of 0 disables it
+    MAX_CONCURRENT_RUNS: int = Field(default=0, description="Maximum agent runs in flight across all agents")
+    MAX_CONCURRENT_RUNS_PER_AGENT: int = Field(default=0, description="Default maximum agent runs in flight per agent")
+    AGENT_CONCURRENCY_LIMITS: Dict[str, int] = Field(
+        default_factory=dict, description="Per-agent overrides of MAX_CONCURRENT_RUNS_PER_AGENT"
+    )
+    ADMISSION_MAX_WAITING: int = Field(default=100, description="Maximum runs waiting for a slot per limit")
+    ADMISSION_TIMEOUT: float = Field(default=10.0, description="Maximum seconds a run waits for a slot")
+    ADMISSION_RETRY_AFTER: float = Field(default=1.0, description="Retry-After seconds of rejected runs")
+
     # Model configurations dictionary
     MODEL_CONFIGS: Dict[str, Dict[str, Any]] = Field(default_factory=dict)
     MODEL_CONFIGS_BASE64: str | None = None
     MODEL_CONFIGS_PATH: str | None = None
+    MODEL_CONFIGS_WATCH: bool = Field(
+        default=True, description="Reload MODEL_CONFIGS when the file at MODEL_CONFIGS_PATH changes"
+    )
 
     # Database configurations dictionary
     DB_CONFIGS: Dict[str, Dict[str, Any]] = Field(default_factory=dict)
@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+
+from langgraph_agent_toolkit.core.idempotency.types import IdempotencyRecord
+
+
+class BaseIdempotencyStore(ABC):
+    """Base class for stores of responses to idempotent requests.
+
+    Stores shared between processes let a retry reaching another process get the stored
+    response. Expired records must never be returned.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> IdempotencyRecord | None:
+        """Get the record stored for a key.
+
+        Returns:
+            The record, or None if the key is unknown or expired
+
+        """
+        pass
+
+    @abstractmethod
+    async def put(self, record: IdempotencyRecord) -> None:
+        """Store the response of a request until the record expires."""
+        pass
+
+    async def close(self) -> None:
+        """Release resources held by the store."""
+        pass
@@ -0,0 +1,37 @@
+from typing import Optional
+
+from langgraph.store.base import BaseStore
+
+from langgraph_agent_toolkit.core.idempotency.base import BaseIdempotencyStore
+from langgraph_agent_toolkit.core.idempotency.memory import InMemoryIdempotencyStore
+from langgraph_agent_toolkit.core.idempotency.store import LangGraphIdempotencyStore
+from langgraph_agent_toolkit.core.idempotency.types import IdempotencyBackends
+
+
+class IdempotencyStoreFactory:
+    """Factory for creating idempotency store instances."""
+
+    @staticmethod
+    def create(backend: IdempotencyBackends, store: Optional[BaseStore] = None) -> BaseIdempotencyStore:
+        """Create and return an idempotency store instance.
+
+        Args:
+            backend: The idempotency backend to create
+            store: The LangGraph store of the memory backend, required by the `store` backend
+
+        Returns:
+            An instance of the requested idempotency store
+
+        Raises:
+            ValueError: If the requested backend is not supported or misses its store
+
+        """
+        match backend:
+            case IdempotencyBackends.MEMORY:
+                return InMemoryIdempotencyStore()
+            case IdempotencyBackends.STORE:
+                if store is None:
+                    raise ValueError("The `store` idempotency backend requires a memory backend with a store")
+                return LangGraphIdempotencyStore(store)
+            case _:
+                raise ValueError(f"Unsupported idempotency backend: {backend}")
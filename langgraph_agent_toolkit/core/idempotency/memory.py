@@ -0,0 +1,36 @@
+from collections import OrderedDict
+
+from langgraph_agent_toolkit.core.idempotency.base import BaseIdempotencyStore
+from langgraph_agent_toolkit.core.idempotency.types import IdempotencyRecord
+from langgraph_agent_toolkit.core.settings import settings
+
+
+class InMemoryIdempotencyStore(BaseIdempotencyStore):
+    """In-process implementation of the idempotency store.
+
+    Records are only visible to the process that stored them. At most `max_entries` records
+    are kept, the oldest ones are dropped first.
+    """
+
+    def __init__(self, max_entries: int | None = None):
+        self.max_entries = settings.IDEMPOTENCY_MAX_ENTRIES if max_entries is None else max_entries
+        self._records: OrderedDict[str, IdempotencyRecord] = OrderedDict()
+
+    def _prune(self) -> None:
+        """Drop expired records, which are stored in expiration order."""
+        while self._records:
+            record = next(iter(self._records.values()))
+            if not record.is_expired:
+                break
+            self._records.popitem(last=False)
+
+    async def get(self, key: str) -> IdempotencyRecord | None:
+        self._prune()
+        return self._records.get(key)
+
+    async def put(self, record: IdempotencyRecord) -> None:
+        self._prune()
+        self._records.pop(record.key, None)
+        self._records[record.key] = record
+        while len(self._records) > self.max_entries:
+            self._records.popitem(last=False)
@@ -0,0 +1,33 @@
+from langgraph.store.base import BaseStore
+
+from langgraph_agent_toolkit.core.idempotency.base import BaseIdempotencyStore
+from langgraph_agent_toolkit.core.idempotency.types import IdempotencyRecord
+
+
+class LangGraphIdempotencyStore(BaseIdempotencyStore):
+    """Idempotency store backed by the LangGraph store of the memory backend.
+
+    Records are shared by all processes using the same database. Expired records are
+    deleted when they are read, and by the store itself when it supports TTLs.
+    """
+
+    namespace = ("idempotency",)
+
+    def __init__(self, store: BaseStore):
+        self.store = store
+
+    async def get(self, key: str) -> IdempotencyRecord | None:
+        item = await self.store.aget(self.namespace, key)
+        if item is None:
+            return None
+        record = IdempotencyRecord.model_validate(item.value)
+        if record.is_expired:
+            await self.store.adelete(self.namespace, key)
+            return None
+        return record
+
+    async def put(self, record: IdempotencyRecord) -> None:
+        kwargs = {}
+        if self.store.supports_ttl:
+            kwargs["ttl"] = (record.expires_at - record.created_at) / 60
+        await self.store.aput(self.namespace, record.key, record.model_dump(), index=False, **kwargs)
@@ -0,0 +1,24 @@
+import time
+from enum import StrEnum, auto
+from typing import Any, Dict
+
+from pydantic import BaseModel, Field
+
+
+class IdempotencyBackends(StrEnum):
+    MEMORY = auto()
+    STORE = auto()
+
+
+class IdempotencyRecord(BaseModel):
+    """Stored response of a request sent with an `Idempotency-Key` header."""
+
+    key: str
+    fingerprint: str = Field(description="Hash of the request the key was first used with.")
+    response: Dict[str, Any] = Field(description="JSON body of the successful response.")
+    created_at: float = Field(default_factory=time.time)
+    expires_at: float
+
+    @property
+    def is_expired(self) -> bool:
+        return self.expires_at <= time.time()
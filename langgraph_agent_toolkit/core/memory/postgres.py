@@ -127,7 +127,7 @@ class PostgresMemoryBackend(BaseMemoryBackend):
 
         """
         async with self._get_connection_context(
-            lambda pool: AsyncPostgresStore(conn=pool, app_prefix="store")
+            lambda pool: AsyncPostgresStore(conn=pool), app_prefix="store"
         ) as store:
             yield store
 
@@ -1,6 +1,8 @@
+from langgraph_agent_toolkit.core.models.cache import ModelInstanceCache, model_cache
 from langgraph_agent_toolkit.core.models.chat_openai import ChatOpenAIPatched
 from langgraph_agent_toolkit.core.models.factory import CompletionModelFactory, EmbeddingModelFactory
 from langgraph_agent_toolkit.core.models.fake import FakeToolModel
+from langgraph_agent_toolkit.core.models.transport import HttpClientRegistry, http_client_registry
 
 
 __all__ = [
@@ -8,4 +10,8 @@ __all__ = [
     "FakeToolModel",
     "EmbeddingModelFactory",
     "CompletionModelFactory",
+    "ModelInstanceCache",
+    "model_cache",
+    "HttpClientRegistry",
+    "http_client_registry",
 ]
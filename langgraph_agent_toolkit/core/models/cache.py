@@ -0,0 +1,196 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+from pydantic import SecretStr
+
+from langgraph_agent_toolkit.helper.constants import DEFAULT_MODEL_CACHE_MAX_SIZE, DEFAULT_MODEL_CACHE_TTL_SECOND
+from langgraph_agent_toolkit.helper.logging import logger
+from langgraph_agent_toolkit.helper.metrics import metrics
+
+
+T = TypeVar("T")
+
+_SECRET_KEY_MARKERS = ("key", "token", "secret", "password")
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Snapshot of the model cache counters."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class _Uncacheable(Exception):
+    """Raised when a parameter value cannot be turned into a stable cache key."""
+
+
+def _hash_secret(value: str) -> str:
+    return "sha256:" + hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+def _freeze(name: str, value: Any) -> Hashable:
+    if isinstance(value, SecretStr):
+        return _hash_secret(value.get_secret_value())
+    if isinstance(value, str):
+        if any(marker in name.lower() for marker in _SECRET_KEY_MARKERS):
+            return _hash_secret(value)
+        return value
+    if value is None or isinstance(value, (bool, int, float, bytes)):
+        return value
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(str(k), v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = [_freeze(name, v) for v in value]
+        return tuple(sorted(items, key=repr)) if isinstance(value, (set, frozenset)) else tuple(items)
+    raise _Uncacheable(f"Parameter '{name}' of type {type(value).__name__} is not cacheable")
+
+
+class ModelInstanceCache:
+    """Thread-safe LRU cache with TTL for fully constructed chat model instances.
+
+    Models are keyed by the resolved ``(provider, model, params)`` tuple. Secret values
+    (``SecretStr`` instances and string parameters whose name looks like a credential) are
+    stored as SHA-256 digests, so raw credentials never end up in the cache key.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MODEL_CACHE_MAX_SIZE,
+        ttl_seconds: float = DEFAULT_MODEL_CACHE_TTL_SECOND,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of model instances to keep. ``0`` disables caching.
+            ttl_seconds: Time-to-live of an entry in seconds. ``0`` or less disables expiry.
+
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[Tuple, Tuple[float, Any]] = OrderedDict()
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def make_key(model: str, model_provider: Optional[str] = None, **params: Any) -> Optional[Tuple]:
+        """Build a hashable cache key, or return None if the parameters cannot be cached."""
+        try:
+            frozen = tuple(sorted((k, _freeze(k, v)) for k, v in params.items()))
+        except _Uncacheable as e:
+            logger.debug(f"Skipping model cache: {e}")
+            return None
+        return (str(model_provider) if model_provider else None, model, frozen)
+
+    def get_or_create(self, key: Optional[Tuple], factory: Callable[[], T]) -> T:
+        """Return the cached instance for ``key`` or build, store and return a new one."""
+        if key is None or self.max_size <= 0:
+            with self._lock:
+                self._misses += 1
+            return factory()
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                created_at, instance = entry
+                if self.ttl_seconds <= 0 or now - created_at < self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return instance
+                del self._entries[key]
+                self._evictions += 1
+            self._misses += 1
+
+        # Build outside the lock, model construction may be slow
+        instance = factory()
+
+        with self._lock:
+            existing = self._entries.get(key)
+            if existing is not None:
+                # Another thread won the race, keep a single shared instance
+                self._entries.move_to_end(key)
+                return existing[1]
+            self._entries[key] = (now, instance)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return instance
+
+    def invalidate(self, predicate: Optional[Callable[[Tuple], bool]] = None) -> int:
+        """Drop cached instances.
+
+        Args:
+            predicate: Optional callable receiving the cache key. Only matching entries are dropped.
+                If omitted, the whole cache is cleared.
+
+        Returns:
+            Number of dropped entries
+
+        """
+        with self._lock:
+            if predicate is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+            else:
+                keys = [k for k in self._entries if predicate(k)]
+                for k in keys:
+                    del self._entries[k]
+                dropped = len(keys)
+            self._evictions += dropped
+        return dropped
+
+    def clear(self) -> None:
+        """Drop all cached instances and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> CacheStats:
+        """Return the current hit/miss statistics."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                max_size=self.max_size,
+            )
+
+    def as_dict(self) -> Dict[str, Any]:
+        stats = self.stats()
+        return {
+            "hits": stats.hits,
+            "misses": stats.misses,
+            "evictions": stats.evictions,
+            "size": stats.size,
+            "max_size": stats.max_size,
+            "hit_rate": stats.hit_rate,
+        }
+
+
+model_cache = ModelInstanceCache()
+
+
+def _cache_stat(name: str) -> Callable[[], list]:
+    return lambda: [((), getattr(model_cache.stats(), name))]
+
+
+metrics.gauge("model_cache_hits", "Chat model lookups served from the instance cache.", _cache_stat("hits"))
+metrics.gauge("model_cache_misses", "Chat model lookups that built a new instance.", _cache_stat("misses"))
+metrics.gauge("model_cache_evictions", "Chat model instances evicted from the cache.", _cache_stat("evictions"))
+metrics.gauge("model_cache_size", "Chat model instances in the cache.", _cache_stat("size"))
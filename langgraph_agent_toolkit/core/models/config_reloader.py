@@ -0,0 +1,143 @@
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from watchdog.observers import Observer
+
+from langgraph_agent_toolkit.core.models.cache import model_cache
+from langgraph_agent_toolkit.core.models.transport import http_client_registry
+from langgraph_agent_toolkit.core.settings import settings
+from langgraph_agent_toolkit.helper.logging import logger
+from langgraph_agent_toolkit.helper.metrics import metrics
+
+
+MODEL_CONFIG_RELOADS = metrics.counter(
+    "model_configs_reloads_total",
+    "Reloads of MODEL_CONFIGS from MODEL_CONFIGS_PATH.",
+    ("result",),
+)
+
+# Events caused by reading the file, which must not trigger a reload
+_READ_EVENTS = frozenset({"opened", "closed_no_write"})
+
+
+def validate_model_configs(configs: Any) -> Dict[str, Dict[str, Any]]:
+    """Check that parsed model configurations map keys to configs with a model name.
+
+    Raises:
+        ValueError: If the configurations are invalid
+
+    """
+    if not isinstance(configs, dict):
+        raise ValueError("Model configurations must be a JSON object")
+    for key, config in configs.items():
+        if not isinstance(config, dict):
+            raise ValueError(f"Model configuration '{key}' must be a JSON object")
+        if not (config.get("name") or config.get("model_name")):
+            raise ValueError(f"Model configuration '{key}' has no model name")
+    return configs
+
+
+def _invalidate_clients(old: Dict[str, Any], new: Optional[Dict[str, Any]]) -> None:
+    """Drop cached models of a replaced configuration and its HTTP pool if the endpoint changed."""
+    provider = str(old.get("provider", "openai"))
+    model_name = old.get("name") or old.get("model_name")
+    model_cache.invalidate(lambda key: key[1] == model_name)
+
+    old_base_url = http_client_registry.base_url_of(old)
+    if new is None or http_client_registry.base_url_of(new) != old_base_url:
+        http_client_registry.discard(provider, old_base_url)
+
+
+class ModelConfigsReloader(FileSystemEventHandler):
+    """Reloads `MODEL_CONFIGS` when the file at `MODEL_CONFIGS_PATH` changes.
+
+    The new configurations are validated and swapped in as a whole by replacing the
+    `settings.MODEL_CONFIGS` dict, which is never modified in place. A lookup therefore sees
+    either the old or the new configurations, never a mix. Invalid files are ignored and the
+    current configurations are kept. Cached models of changed configurations are dropped, so
+    the next request builds them from the new values.
+
+    The directory of the file is watched rather than the file itself, which also catches
+    editors and Kubernetes config maps replacing the file by a rename.
+    """
+
+    def __init__(self, path: str | Path, debounce_seconds: float = 0.5):
+        super().__init__()
+        self.path = Path(path).resolve()
+        self.debounce_seconds = debounce_seconds
+        self._digest: Optional[str] = None
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._observer: Optional[Observer] = None
+
+    def reload(self) -> bool:
+        """Load the file and swap in its configurations if they changed and are valid.
+
+        Returns:
+            Whether new configurations were applied
+
+        """
+        with self._lock:
+            try:
+                content = self.path.read_bytes()
+                digest = hashlib.sha256(content).hexdigest()
+                if digest == self._digest:
+                    return False
+                configs = validate_model_configs(json.loads(content))
+            except (OSError, ValueError) as e:
+                MODEL_CONFIG_RELOADS.inc(result="invalid")
+                logger.error(f"Keeping current model configurations, failed to load {self.path}: {e}")
+                return False
+
+            old_configs = settings.MODEL_CONFIGS
+            self._digest = digest
+            settings.MODEL_CONFIGS = configs
+
+            changed: List[str] = [key for key, old in old_configs.items() if configs.get(key) != old]
+            for key in changed:
+                _invalidate_clients(old_configs[key], configs.get(key))
+            MODEL_CONFIG_RELOADS.inc(result="applied")
+            logger.info(f"Reloaded {len(configs)} model configurations from {self.path}, changed: {changed}")
+            return True
+
+    def on_any_event(self, event: FileSystemEvent) -> None:
+        if event.event_type in _READ_EVENTS:
+            return
+        paths = {Path(str(p)).resolve() for p in (event.src_path, getattr(event, "dest_path", "")) if p}
+        # Config maps swap a symlinked data directory, so changes may not name the file itself
+        if self.path not in paths and not any(p.name.startswith("..") for p in paths):
+            return
+        # Editors write in several steps, reload once they are done
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.debounce_seconds, self.reload)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def start(self) -> None:
+        """Start watching the file, keeping the configurations already loaded from it."""
+        try:
+            self._digest = hashlib.sha256(self.path.read_bytes()).hexdigest()
+        except OSError:
+            self._digest = None
+        self._observer = Observer()
+        self._observer.schedule(self, str(self.path.parent), recursive=False)
+        self._observer.daemon = True
+        self._observer.start()
+        logger.info(f"Watching {self.path} for model configuration changes")
+
+    def stop(self) -> None:
+        """Stop watching the file."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=5)
+            self._observer = None
@@ -10,15 +10,17 @@ from typing import (
     cast,
 )
 
-from langchain.chat_models.base import _ConfigurableModel, _init_chat_model_helper
+from langchain.chat_models.base import _DECLARATIVE_METHODS, _ConfigurableModel, _init_chat_model_helper
 from langchain.embeddings.base import init_embeddings
 from langchain_core.embeddings import Embeddings
 from langchain_core.language_models import BaseChatModel
 from langchain_core.runnables import Runnable, RunnableConfig
 from typing_extensions import TypeAlias
 
+from langgraph_agent_toolkit.core.models.cache import model_cache
 from langgraph_agent_toolkit.core.models.chat_openai import ChatOpenAIPatched
 from langgraph_agent_toolkit.core.models.fake import FakeToolModel
+from langgraph_agent_toolkit.core.models.transport import http_client_registry
 from langgraph_agent_toolkit.helper.constants import (
     DEFAULT_CONFIG_PREFIX,
     DEFAULT_CONFIGURABLE_FIELDS,
@@ -31,9 +33,33 @@ ModelT: TypeAlias = FakeToolModel | _ConfigurableModel | BaseChatModel
 
 
 class _ConfigurableModelCustom(_ConfigurableModel):
+    def __getattr__(self, name: str) -> Any:
+        attr = super().__getattr__(name)
+        if name not in _DECLARATIVE_METHODS:
+            return attr
+
+        # The parent queues declarative operations (e.g. `bind_tools`) on a plain `_ConfigurableModel`,
+        # which would bypass our model construction and cache, so keep the custom class.
+        def queue(*args: Any, **kwargs: Any) -> "_ConfigurableModelCustom":
+            return _ConfigurableModelCustom._from_configurable(attr(*args, **kwargs))
+
+        return queue
+
+    def with_config(self, config: Optional[RunnableConfig] = None, **kwargs: Any) -> "_ConfigurableModelCustom":
+        return self._from_configurable(super().with_config(config, **kwargs))
+
+    @staticmethod
+    def _from_configurable(model: _ConfigurableModel) -> "_ConfigurableModelCustom":
+        return _ConfigurableModelCustom(
+            default_config=model._default_config,
+            configurable_fields=model._configurable_fields,
+            config_prefix=model._config_prefix,
+            queued_declarative_operations=model._queued_declarative_operations,
+        )
+
     def _model(self, config: Optional[RunnableConfig] = None) -> Runnable:
         params = {**self._default_config, **self._model_params(config)}
-        model = CompletionModelFactory._init_chat_model_helper(**params)
+        model = CompletionModelFactory.get_or_create_chat_model(**params)
         for name, args, kwargs in self._queued_declarative_operations:
             model = getattr(model, name)(*args, **kwargs)
         return model
@@ -44,11 +70,30 @@ class CompletionModelFactory:
 
     @staticmethod
     def _init_chat_model_helper(model: str, *, model_provider: Optional[str] = None, **kwargs: Any) -> BaseChatModel:
+        kwargs = http_client_registry.inject(model_provider, kwargs)
         if model_provider == "openai":
             return ChatOpenAIPatched(model_name=model, **kwargs)
         else:
             return _init_chat_model_helper(model, model_provider=model_provider, **kwargs)
 
+    @staticmethod
+    def get_or_create_chat_model(model: str, *, model_provider: Optional[str] = None, **kwargs: Any) -> BaseChatModel:
+        """Return a cached chat model instance for the resolved parameters, creating it on a cache miss.
+
+        Args:
+            model: The name of the model
+            model_provider: The model provider
+            **kwargs: Additional keyword arguments to pass to the model
+
+        Returns:
+            A shared BaseChatModel instance
+
+        """
+        return model_cache.get_or_create(
+            model_cache.make_key(model, model_provider=model_provider, **kwargs),
+            lambda: CompletionModelFactory._init_chat_model_helper(model, model_provider=model_provider, **kwargs),
+        )
+
     @staticmethod
     def init_chat_model(
         model: Optional[str] = None,
@@ -221,6 +266,7 @@ class EmbeddingModelFactory:
 
         # Get provider string from enum if needed
         provider_str = model_provider.value if isinstance(model_provider, ModelProvider) else str(model_provider)
+        _model_parameter_values = http_client_registry.inject(provider_str, _model_parameter_values)
 
         return init_embeddings(
             model=model_name,
@@ -0,0 +1,253 @@
+import importlib.util
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from langgraph_agent_toolkit.core.models.cache import model_cache
+from langgraph_agent_toolkit.core.settings import settings
+from langgraph_agent_toolkit.helper.logging import logger
+from langgraph_agent_toolkit.helper.metrics import metrics
+
+
+# Providers whose LangChain integrations accept `http_client` / `http_async_client`
+HTTP_CLIENT_PROVIDERS = frozenset({"openai", "azure_openai", "deepseek", "groq"})
+
+_BASE_URL_PARAMS = ("base_url", "openai_api_base", "api_base", "azure_endpoint")
+_DEFAULT_BASE_URL = "default"
+
+PoolKey = Tuple[str, str]
+
+
+@dataclass
+class PoolStats:
+    """Counters for a single outbound HTTP pool."""
+
+    requests: int = 0
+    responses: int = 0
+    errors: int = 0
+    status_codes: Dict[int, int] = field(default_factory=dict)
+    # Hooks of sync clients run in any thread
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def record_response(self, status_code: int) -> None:
+        with self._lock:
+            self.responses += 1
+            self.status_codes[status_code] = self.status_codes.get(status_code, 0) + 1
+            if status_code >= 500:
+                self.errors += 1
+
+    def snapshot(self) -> "PoolStats":
+        """Return a consistent copy of the counters."""
+        with self._lock:
+            return PoolStats(self.requests, self.responses, self.errors, dict(self.status_codes))
+
+
+@dataclass
+class _Pool:
+    sync_client: Optional[httpx.Client] = None
+    async_client: Optional[httpx.AsyncClient] = None
+    stats: PoolStats = field(default_factory=PoolStats)
+
+
+class HttpClientRegistry:
+    """Process-wide registry of pooled httpx clients, keyed by provider and base URL.
+
+    Every LLM and embedding model created through the factories shares the pool that matches its
+    provider and endpoint, so agents reuse warm keep-alive connections instead of opening new sockets
+    on every node call. Clients are created lazily on first use.
+    """
+
+    def __init__(self):
+        self._pools: Dict[PoolKey, _Pool] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _limits() -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=settings.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+        )
+
+    @staticmethod
+    def _http2_enabled() -> bool:
+        if not settings.HTTP_HTTP2:
+            return False
+        if importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP_HTTP2 is enabled but the `h2` package is not installed, falling back to HTTP/1.1")
+            return False
+        return True
+
+    @staticmethod
+    def _event_hooks(stats: PoolStats, is_async: bool) -> Dict[str, list]:
+        def on_request(request: httpx.Request) -> None:
+            stats.record_request()
+
+        def on_response(response: httpx.Response) -> None:
+            stats.record_response(response.status_code)
+
+        if not is_async:
+            return {"request": [on_request], "response": [on_response]}
+
+        async def aon_request(request: httpx.Request) -> None:
+            on_request(request)
+
+        async def aon_response(response: httpx.Response) -> None:
+            on_response(response)
+
+        return {"request": [aon_request], "response": [aon_response]}
+
+    def _get_pool(self, provider: str, base_url: Optional[str]) -> _Pool:
+        key = (str(provider), (base_url or _DEFAULT_BASE_URL).rstrip("/"))
+        pool = self._pools.get(key)
+        if pool is None:
+            with self._lock:
+                pool = self._pools.setdefault(key, _Pool())
+        return pool
+
+    def get_client(self, provider: str, base_url: Optional[str] = None) -> httpx.Client:
+        """Get the shared synchronous client for a provider endpoint."""
+        pool = self._get_pool(provider, base_url)
+        if pool.sync_client is None or pool.sync_client.is_closed:
+            with self._lock:
+                if pool.sync_client is None or pool.sync_client.is_closed:
+                    pool.sync_client = httpx.Client(
+                        limits=self._limits(),
+                        http2=self._http2_enabled(),
+                        event_hooks=self._event_hooks(pool.stats, is_async=False),
+                    )
+                    logger.debug(f"Created shared HTTP client for {provider} ({base_url or _DEFAULT_BASE_URL})")
+        return pool.sync_client
+
+    def get_async_client(self, provider: str, base_url: Optional[str] = None) -> httpx.AsyncClient:
+        """Get the shared asynchronous client for a provider endpoint."""
+        pool = self._get_pool(provider, base_url)
+        if pool.async_client is None or pool.async_client.is_closed:
+            with self._lock:
+                if pool.async_client is None or pool.async_client.is_closed:
+                    pool.async_client = httpx.AsyncClient(
+                        limits=self._limits(),
+                        http2=self._http2_enabled(),
+                        event_hooks=self._event_hooks(pool.stats, is_async=True),
+                    )
+                    logger.debug(f"Created shared async HTTP client for {provider} ({base_url or _DEFAULT_BASE_URL})")
+        return pool.async_client
+
+    def inject(self, provider: Optional[str], params: Dict[str, Any]) -> Dict[str, Any]:
+        """Return model parameters with shared clients added for supported providers.
+
+        Explicitly passed `http_client` / `http_async_client` values are never overridden.
+
+        Args:
+            provider: The model provider
+            params: The keyword arguments that will be passed to the model
+
+        Returns:
+            A copy of the parameters including the shared clients
+
+        """
+        if not settings.HTTP_SHARED_CLIENTS or str(provider) not in HTTP_CLIENT_PROVIDERS:
+            return params
+
+        base_url = self.base_url_of(params)
+        params = dict(params)
+        if params.get("http_client") is None:
+            params["http_client"] = self.get_client(provider, base_url)
+        if params.get("http_async_client") is None:
+            params["http_async_client"] = self.get_async_client(provider, base_url)
+        return params
+
+    def stats(self) -> Dict[PoolKey, PoolStats]:
+        """Return a snapshot of the per-pool request counters."""
+        with self._lock:
+            pools = dict(self._pools)
+        return {key: pool.stats.snapshot() for key, pool in pools.items()}
+
+    def discard(self, provider: str, base_url: Optional[str] = None) -> bool:
+        """Forget the pool of a provider endpoint without closing its clients.
+
+        Requests still running on the old clients complete, models created afterwards get a new pool.
+
+        Returns:
+            Whether a pool was dropped
+
+        """
+        key = (str(provider), (base_url or _DEFAULT_BASE_URL).rstrip("/"))
+        with self._lock:
+            return self._pools.pop(key, None) is not None
+
+    @staticmethod
+    def base_url_of(params: Dict[str, Any]) -> Optional[str]:
+        """Return the endpoint configured in model parameters, if any."""
+        return next((str(params[p]) for p in _BASE_URL_PARAMS if params.get(p)), None)
+
+    def reset(self) -> None:
+        """Forget all pools without closing them.
+
+        Intended for forked worker processes, which must not reuse sockets inherited from the parent.
+        Cached model instances holding the old clients are dropped as well.
+        """
+        with self._lock:
+            self._pools = {}
+        model_cache.invalidate()
+
+    def close(self) -> None:
+        """Close all synchronous clients and drop all pools."""
+        with self._lock:
+            pools, self._pools = self._pools, {}
+        model_cache.invalidate()
+        for pool in pools.values():
+            if pool.sync_client is not None:
+                pool.sync_client.close()
+
+    async def aclose(self) -> None:
+        """Close all clients and drop all pools."""
+        with self._lock:
+            pools, self._pools = self._pools, {}
+        model_cache.invalidate()
+        for pool in pools.values():
+            if pool.sync_client is not None:
+                pool.sync_client.close()
+            if pool.async_client is not None:
+                await pool.async_client.aclose()
+
+
+http_client_registry = HttpClientRegistry()
+
+
+def _pool_samples(counter: str) -> Callable[[], List[Tuple[PoolKey, float]]]:
+    return lambda: [(key, getattr(stats, counter)) for key, stats in http_client_registry.stats().items()]
+
+
+def _pool_status_samples() -> List[Tuple[Tuple[str, str, str], float]]:
+    return [
+        ((*key, str(status_code)), count)
+        for key, stats in http_client_registry.stats().items()
+        for status_code, count in stats.status_codes.items()
+    ]
+
+
+metrics.gauge(
+    "llm_http_pool_requests",
+    "Requests sent through the shared HTTP pool of a provider endpoint.",
+    _pool_samples("requests"),
+    ("provider", "base_url"),
+)
+metrics.gauge(
+    "llm_http_pool_errors",
+    "Responses with a 5xx status received through the shared HTTP pool of a provider endpoint.",
+    _pool_samples("errors"),
+    ("provider", "base_url"),
+)
+metrics.gauge(
+    "llm_http_pool_responses",
+    "Responses received through the shared HTTP pool of a provider endpoint, by status code.",
+    _pool_status_samples,
+    ("provider", "base_url", "status"),
+)
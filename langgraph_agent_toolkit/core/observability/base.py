@@ -30,6 +30,9 @@ class BaseObservabilityPlatform(ABC):
 
     __default_required_vars = []
 
+    # Prompts pulled ahead of time, e.g. by an agent bundle, served instead of the remote platform
+    prompt_snapshot_dir: Optional[Path] = None
+
     def __init__(self, prompts_dir: Optional[str] = None, remote_first: bool = False):
         self._required_vars = self.__default_required_vars.copy()
         self._remote_first = remote_first
@@ -80,6 +83,46 @@ class BaseObservabilityPlatform(ABC):
 
         return wrapper
 
+    @classmethod
+    def use_prompt_snapshot(cls, path: Optional[str | Path]) -> None:
+        """Serve prompts found in `path` locally on all platforms, or stop doing so if None."""
+        BaseObservabilityPlatform.prompt_snapshot_dir = Path(path) if path is not None else None
+
+    @staticmethod
+    def _has_snapshot_prompt(name: str) -> bool:
+        snapshot_dir = BaseObservabilityPlatform.prompt_snapshot_dir
+        return snapshot_dir is not None and (snapshot_dir / f"{name}.jinja2").exists()
+
+    @staticmethod
+    def serves_snapshot_prompts(func: Callable[..., T]) -> Callable[..., T]:
+        """Pull prompts found in the prompt snapshot from it instead of calling `func`."""
+
+        @functools.wraps(func)
+        def wrapper(self, name: str, *args, **kwargs):
+            if not BaseObservabilityPlatform._has_snapshot_prompt(name):
+                return func(self, name, *args, **kwargs)
+            prompt = self._local_pull_prompt(
+                name,
+                template_format=kwargs.get("template_format", "f-string"),
+                prompts_dir=BaseObservabilityPlatform.prompt_snapshot_dir,
+            )
+            return (prompt, None) if kwargs.get("return_with_prompt_object") else prompt
+
+        return wrapper
+
+    @staticmethod
+    def skips_snapshot_prompts(func: Callable[..., T]) -> Callable[..., T]:
+        """Skip pushing prompts found in the prompt snapshot, which were pushed when it was built."""
+
+        @functools.wraps(func)
+        def wrapper(self, name: str, *args, **kwargs):
+            if BaseObservabilityPlatform._has_snapshot_prompt(name):
+                logger.debug(f"Using prompt '{name}' from the prompt snapshot, skipping push")
+                return None
+            return func(self, name, *args, **kwargs)
+
+        return wrapper
+
     @abstractmethod
     def get_callback_handler(self, **kwargs) -> Any:
         pass
@@ -250,9 +293,12 @@ class BaseObservabilityPlatform(ABC):
                 return prompt_obj.template
             return str(prompt_obj)
 
-    def _local_pull_prompt(self, name: str, template_format: str = "f-string", **kwargs) -> PromptReturnType:
+    def _local_pull_prompt(
+        self, name: str, template_format: str = "f-string", prompts_dir: Optional[Path] = None, **kwargs
+    ) -> PromptReturnType:
         """Local implementation of pull_prompt that reads from the file system."""
-        file_path = self._prompts_dir / f"{name}.jinja2"
+        prompts_dir = prompts_dir or self._prompts_dir
+        file_path = prompts_dir / f"{name}.jinja2"
 
         if not file_path.exists():
             raise ValueError(f"Prompt '{name}' not found at {file_path}")
@@ -260,7 +306,7 @@ class BaseObservabilityPlatform(ABC):
         with open(file_path, "r", encoding="utf-8") as f:
             template_content = f.read()
 
-        metadata_path = self._prompts_dir / f"{name}.metadata.joblib"
+        metadata_path = prompts_dir / f"{name}.metadata.joblib"
 
         if metadata_path.exists():
             try:
@@ -273,6 +319,7 @@ class BaseObservabilityPlatform(ABC):
 
         return ChatPromptTemplate.from_template(template_content, template_format=template_format)
 
+    @serves_snapshot_prompts
     def pull_prompt(
         self,
         name: str,
@@ -74,6 +74,7 @@ class LangfuseObservability(BaseObservabilityPlatform):
 
         return hashlib.md5(content_to_hash.encode("utf-8")).hexdigest()
 
+    @BaseObservabilityPlatform.skips_snapshot_prompts
     @BaseObservabilityPlatform.requires_env_vars
     def push_prompt(
         self,
@@ -170,6 +171,7 @@ class LangfuseObservability(BaseObservabilityPlatform):
 
         super().push_prompt(name, prompt_template, full_metadata, force_create_new_version)
 
+    @BaseObservabilityPlatform.serves_snapshot_prompts
     @BaseObservabilityPlatform.requires_env_vars
     def pull_prompt(
         self,
@@ -49,6 +49,7 @@ class LangsmithObservability(BaseObservabilityPlatform):
             **kwargs,
         )
 
+    @BaseObservabilityPlatform.skips_snapshot_prompts
     @BaseObservabilityPlatform.requires_env_vars
     def push_prompt(
         self,
@@ -123,6 +124,7 @@ class LangsmithObservability(BaseObservabilityPlatform):
         template_str = self._extract_template_string(prompt_template, prompt_obj)
         super().push_prompt(name, template_str, full_metadata)
 
+    @BaseObservabilityPlatform.serves_snapshot_prompts
     @BaseObservabilityPlatform.requires_env_vars
     def pull_prompt(
         self,
@@ -0,0 +1,50 @@
+from abc import ABC, abstractmethod
+
+from langgraph_agent_toolkit.core.queue.types import RunRecord
+
+
+class BaseRunQueue(ABC):
+    """Base class for run queue backends.
+
+    A queue stores run records and hands pending runs to workers. Backends shared between
+    processes allow API front-ends and workers to be scaled independently.
+    """
+
+    @abstractmethod
+    async def enqueue(self, record: RunRecord) -> None:
+        """Store a new pending run and make it available to workers.
+
+        Raises:
+            RateLimitError: If the queue cannot accept more runs
+
+        """
+        pass
+
+    @abstractmethod
+    async def dequeue(self) -> RunRecord:
+        """Wait for the next pending run.
+
+        Returns:
+            The record of the run to execute
+
+        """
+        pass
+
+    @abstractmethod
+    async def get(self, run_id: str) -> RunRecord | None:
+        """Get a run record by its ID.
+
+        Returns:
+            The record, or None if the run is unknown or expired
+
+        """
+        pass
+
+    @abstractmethod
+    async def update(self, record: RunRecord) -> None:
+        """Persist a changed run record, e.g. a status change or the result of the run."""
+        pass
+
+    async def close(self) -> None:
+        """Release resources held by the queue."""
+        pass
@@ -0,0 +1,27 @@
+from langgraph_agent_toolkit.core.queue.base import BaseRunQueue
+from langgraph_agent_toolkit.core.queue.memory import InMemoryRunQueue
+from langgraph_agent_toolkit.core.queue.types import RunQueueBackends
+
+
+class RunQueueFactory:
+    """Factory for creating run queue instances."""
+
+    @staticmethod
+    def create(backend: RunQueueBackends) -> BaseRunQueue:
+        """Create and return a run queue instance.
+
+        Args:
+            backend: The run queue backend to create
+
+        Returns:
+            An instance of the requested run queue
+
+        Raises:
+            ValueError: If the requested backend is not supported
+
+        """
+        match backend:
+            case RunQueueBackends.MEMORY:
+                return InMemoryRunQueue()
+            case _:
+                raise ValueError(f"Unsupported run queue backend: {backend}")
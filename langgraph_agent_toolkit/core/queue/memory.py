@@ -0,0 +1,64 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Dict
+
+from langgraph_agent_toolkit.core.queue.base import BaseRunQueue
+from langgraph_agent_toolkit.core.queue.types import RunRecord
+from langgraph_agent_toolkit.core.settings import settings
+from langgraph_agent_toolkit.helper.exceptions import RateLimitError
+
+
+class InMemoryRunQueue(BaseRunQueue):
+    """In-process implementation of the run queue.
+
+    Runs are only visible to the process that accepted them, so this backend is meant for
+    a single API process running its own workers. Finished runs are kept for `result_ttl` seconds.
+
+    Finished runs are tracked in the order they finished, so expired results are dropped from
+    the head of that order without scanning all stored runs.
+    """
+
+    def __init__(self, max_size: int | None = None, result_ttl: float | None = None):
+        self.max_size = settings.RUN_QUEUE_MAX_SIZE if max_size is None else max_size
+        self.result_ttl = settings.RUN_RESULT_TTL if result_ttl is None else result_ttl
+        self._pending: asyncio.Queue[str] = asyncio.Queue(maxsize=self.max_size)
+        self._records: Dict[str, RunRecord] = {}
+        # Finish times of finished runs, oldest first
+        self._finished: OrderedDict[str, float] = OrderedDict()
+
+    def _prune(self) -> None:
+        """Drop finished runs whose results expired."""
+        if self.result_ttl <= 0:
+            return
+        deadline = time.time() - self.result_ttl
+        while self._finished:
+            run_id, finished_at = next(iter(self._finished.items()))
+            if finished_at >= deadline:
+                break
+            del self._finished[run_id]
+            self._records.pop(run_id, None)
+
+    async def enqueue(self, record: RunRecord) -> None:
+        self._prune()
+        try:
+            self._pending.put_nowait(record.run_id)
+        except asyncio.QueueFull:
+            raise RateLimitError(resource="run queue", limit=self.max_size)
+        self._records[record.run_id] = record
+
+    async def dequeue(self) -> RunRecord:
+        while True:
+            run_id = await self._pending.get()
+            record = self._records.get(run_id)
+            if record is not None:
+                return record
+
+    async def get(self, run_id: str) -> RunRecord | None:
+        self._prune()
+        return self._records.get(run_id)
+
+    async def update(self, record: RunRecord) -> None:
+        self._records[record.run_id] = record
+        if record.status.is_finished and record.run_id not in self._finished:
+            self._finished[record.run_id] = record.finished_at or time.time()
@@ -0,0 +1,38 @@
+import time
+from enum import StrEnum, auto
+from typing import Any, Dict
+
+from pydantic import BaseModel, Field
+
+
+class RunQueueBackends(StrEnum):
+    MEMORY = auto()
+
+
+class RunStatus(StrEnum):
+    PENDING = auto()
+    RUNNING = auto()
+    SUCCESS = auto()
+    ERROR = auto()
+
+    @property
+    def is_finished(self) -> bool:
+        return self in (RunStatus.SUCCESS, RunStatus.ERROR)
+
+
+class RunRecord(BaseModel):
+    """State of a queued agent run.
+
+    Records only hold JSON-serializable data, so queue backends backed by external
+    storage (e.g. Redis or Postgres) can persist them as they are.
+    """
+
+    run_id: str
+    agent_id: str
+    input: Dict[str, Any] = Field(description="Serialized `UserInput` of the run.")
+    status: RunStatus = RunStatus.PENDING
+    output: Dict[str, Any] | None = Field(default=None, description="Serialized `ChatMessage` of a successful run.")
+    error: str | None = None
+    created_at: float = Field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
@@ -0,0 +1,119 @@
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, List, Optional
+
+from langgraph_agent_toolkit.core.queue.base import BaseRunQueue
+from langgraph_agent_toolkit.core.queue.types import RunRecord, RunStatus
+from langgraph_agent_toolkit.helper.exceptions import RateLimitError
+from langgraph_agent_toolkit.helper.logging import logger
+from langgraph_agent_toolkit.schema import UserInput
+
+
+if TYPE_CHECKING:
+    from langgraph_agent_toolkit.agents.agent_executor import AgentExecutor
+
+
+class RunWorkerPool:
+    """Pool of background tasks executing queued runs with an AgentExecutor.
+
+    Workers run in the event loop of the current process. With a shared queue backend,
+    processes with workers and processes serving the API can be scaled separately.
+
+    With `admit`, e.g. `AdmissionController.acquire`, every run takes an admission ticket before it
+    starts and releases it once finished, so queued runs count towards the same concurrency limits
+    as direct ones. A run that is rejected stays pending and is admitted again after `retry_after`.
+    """
+
+    def __init__(
+        self,
+        queue: BaseRunQueue,
+        executor: "AgentExecutor",
+        size: int,
+        admit: Optional[Callable[[str], Awaitable[Any]]] = None,
+    ):
+        self.queue = queue
+        self.executor = executor
+        self.size = size
+        self.admit = admit
+        self._tasks: List[asyncio.Task] = []
+
+    @property
+    def running(self) -> bool:
+        """Whether worker tasks are running."""
+        return any(not task.done() for task in self._tasks)
+
+    def start(self) -> None:
+        """Start the worker tasks."""
+        if self._tasks:
+            return
+        self._tasks = [asyncio.create_task(self._work(), name=f"run-worker-{i}") for i in range(self.size)]
+        logger.info(f"Started {self.size} run workers")
+
+    async def stop(self) -> None:
+        """Cancel the worker tasks. Runs in progress are marked as failed."""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _work(self) -> None:
+        while True:
+            record = await self.queue.dequeue()
+            ticket = await self._admit(record.agent_id)
+            try:
+                await self.process(record)
+            finally:
+                if ticket is not None:
+                    ticket.release()
+
+    async def _admit(self, agent_id: str) -> Optional[Any]:
+        """Wait until a run of the agent is admitted, retrying while it is rejected."""
+        if self.admit is None:
+            return None
+        while True:
+            try:
+                return await self.admit(agent_id)
+            except RateLimitError as e:
+                await asyncio.sleep(e.retry_after or 1.0)
+
+    async def process(self, record: RunRecord) -> RunRecord:
+        """Execute a single run and store its result in the queue.
+
+        Args:
+            record: The pending run
+
+        Returns:
+            RunRecord: The finished run
+
+        """
+        record = record.model_copy(update={"status": RunStatus.RUNNING, "started_at": time.time()})
+        await self.queue.update(record)
+
+        try:
+            user_input = UserInput.model_validate(record.input)
+            output = await self.executor.invoke(
+                agent_id=record.agent_id,
+                input=user_input.input,
+                thread_id=user_input.thread_id,
+                user_id=user_input.user_id,
+                model_name=user_input.model_name,
+                model_provider=user_input.model_provider,
+                model_config_key=user_input.model_config_key,
+                agent_config=user_input.agent_config,
+                recursion_limit=user_input.recursion_limit,
+                resume=user_input.resume,
+            )
+            record = record.model_copy(update={"status": RunStatus.SUCCESS, "output": output.model_dump()})
+        except asyncio.CancelledError:
+            record = record.model_copy(
+                update={"status": RunStatus.ERROR, "error": "Run cancelled", "finished_at": time.time()}
+            )
+            await self.queue.update(record)
+            raise
+        except Exception as e:
+            logger.error(f"Run {record.run_id} failed: {e}")
+            record = record.model_copy(update={"status": RunStatus.ERROR, "error": f"{type(e).__name__}: {e}"})
+
+        record = record.model_copy(update={"finished_at": time.time()})
+        await self.queue.update(record)
+        return record
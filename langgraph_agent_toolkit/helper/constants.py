@@ -27,5 +27,13 @@ DEFAULT_MODEL_PARAMETER_VALUES = dict(
     streaming=True,
 )
 DEFAULT_CACHE_TTL_SECOND = os.getenv("DEFAULT_CACHE_TTL_SECOND", 60 * 10)  # 10 minutes
+DEFAULT_MODEL_CACHE_MAX_SIZE = int(os.getenv("DEFAULT_MODEL_CACHE_MAX_SIZE", 128))
+DEFAULT_MODEL_CACHE_TTL_SECOND = float(os.getenv("DEFAULT_MODEL_CACHE_TTL_SECOND", 60 * 60))  # 1 hour
+DEFAULT_INTERRUPT_INDEX_MAX_SIZE = int(os.getenv("DEFAULT_INTERRUPT_INDEX_MAX_SIZE", 10_000))
+DEFAULT_INTERRUPT_INDEX_TTL_SECOND = float(os.getenv("DEFAULT_INTERRUPT_INDEX_TTL_SECOND", 60 * 5))  # 5 minutes
+DEFAULT_BATCH_MAX_SIZE = int(os.getenv("DEFAULT_BATCH_MAX_SIZE", 1000))
+DEFAULT_BATCH_MAX_CONCURRENCY = int(os.getenv("DEFAULT_BATCH_MAX_CONCURRENCY", 8))
+DEFAULT_IMPORT_MAX_LINE_BYTES = int(os.getenv("DEFAULT_IMPORT_MAX_LINE_BYTES", 10 * 1024 * 1024))  # 10 MiB
+DEFAULT_IMPORT_PROGRESS_INTERVAL = int(os.getenv("DEFAULT_IMPORT_PROGRESS_INTERVAL", 1000))
 
 DEFAULT_STREAMLIT_USER_ID = os.getenv("DEFAULT_STREAMLIT_USER_ID", "streamlit-user")
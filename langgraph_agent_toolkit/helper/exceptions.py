@@ -238,13 +238,14 @@ class AuthorizationError(AgentToolkitError):
 class RateLimitError(AgentToolkitError):
     """Raised when rate limits are exceeded."""
 
-    def __init__(self, resource: str, limit: int, reset_time: float = None):
+    def __init__(self, resource: str, limit: int, reset_time: float = None, retry_after: float = None):
         """Initialize with rate limit information.
 
         Args:
             resource: The resource that hit the rate limit
             limit: The rate limit that was exceeded
             reset_time: Optional time when the limit resets
+            retry_after: Optional number of seconds to wait before retrying
 
         """
         message = f"Rate limit exceeded for {resource} (limit: {limit})"
@@ -254,6 +255,7 @@ class RateLimitError(AgentToolkitError):
         self.resource = resource
         self.limit = limit
         self.reset_time = reset_time
+        self.retry_after = retry_after
 
 
 class NetworkError(AgentToolkitError):
@@ -0,0 +1,308 @@
+import math
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, ContextManager, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Counter:
+    """Monotonically increasing counter with labels."""
+
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = tuple(str(labels.get(n, "")) for n in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(tuple(str(labels.get(n, "")) for n in self.labelnames), 0.0)
+
+    def samples(self) -> Iterator[str]:
+        with self._lock:
+            values = dict(self._values)
+        for key, value in values.items():
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class Histogram:
+    """Cumulative histogram with fixed buckets and labels."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        # Per label set: bucket counts, sum and count
+        self._values: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(str(labels.get(n, "")) for n in self.labelnames)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = ([0] * len(self.buckets), [0.0, 0.0])
+            counts, totals = entry
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            totals[0] += value
+            totals[1] += 1
+
+    def count(self, **labels: str) -> int:
+        entry = self._values.get(tuple(str(labels.get(n, "")) for n in self.labelnames))
+        return int(entry[1][1]) if entry else 0
+
+    def total(self, **labels: str) -> float:
+        entry = self._values.get(tuple(str(labels.get(n, "")) for n in self.labelnames))
+        return entry[1][0] if entry else 0.0
+
+    def samples(self) -> Iterator[str]:
+        with self._lock:
+            values = {key: (list(counts), list(totals)) for key, (counts, totals) in self._values.items()}
+        for key, (counts, (total, count)) in values.items():
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                yield f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}"
+            yield f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(total)}"
+            yield f"{self.name}_count{_format_labels(self.labelnames, key)} {_format_value(count)}"
+
+
+class Gauge:
+    """Gauge whose values are read from a callback whenever the metrics are rendered.
+
+    Suited to state kept elsewhere, e.g. cache or pool statistics, which would otherwise have
+    to be mirrored into a counter on every change.
+    """
+
+    type = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        collect: Callable[[], Iterable[Tuple[LabelValues, float]]],
+        labelnames: Sequence[str] = (),
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._collect = collect
+
+    def samples(self) -> Iterator[str]:
+        for key, value in self._collect():
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class MetricsRegistry:
+    """In-process metrics registry rendered in the Prometheus text exposition format."""
+
+    def __init__(self):
+        self._metrics: Dict[str, Counter | Histogram | Gauge] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: Counter | Histogram | Gauge) -> Any:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric):
+                    raise ValueError(f"Metric '{metric.name}' is already registered as a {existing.type}")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Get or create a counter."""
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram."""
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        collect: Callable[[], Iterable[Tuple[LabelValues, float]]],
+        labelnames: Sequence[str] = (),
+    ) -> Gauge:
+        """Get or create a gauge reading its `(label values, value)` samples from `collect`."""
+        return self._register(Gauge(name, documentation, collect, labelnames))
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text format."""
+        lines = []
+        for metric in list(self._metrics.values()):
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+STAGE_DURATION = metrics.histogram(
+    "agent_stage_duration_seconds",
+    "Duration of the stages of agent requests.",
+    ("stage",),
+)
+HTTP_REQUEST_DURATION = metrics.histogram(
+    "http_request_duration_seconds",
+    "Duration of HTTP requests until the response was fully sent.",
+    ("method", "route", "status"),
+)
+
+
+# Stage timings of the current request, as (stage, seconds) in completion order.
+# The list is shared with tasks spawned by the request, since they copy the context.
+_stage_timings: ContextVar[Optional[List[Tuple[str, float]]]] = ContextVar("stage_timings", default=None)
+
+
+def start_stage_timings() -> List[Tuple[str, float]]:
+    """Start collecting stage timings for the current request and return the collected list."""
+    timings: List[Tuple[str, float]] = []
+    _stage_timings.set(timings)
+    return timings
+
+
+def record_stage(name: str, seconds: float) -> None:
+    """Record the duration of a stage for the current request and the stage histogram."""
+    STAGE_DURATION.observe(seconds, stage=name)
+    timings = _stage_timings.get()
+    if timings is not None:
+        timings.append((name, seconds))
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time the enclosed block as a stage."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_stage(name, time.perf_counter() - start)
+
+
+@contextmanager
+def timed_enter(name: str, context_manager: ContextManager[Any]) -> Iterator[Any]:
+    """Enter a context manager and time only the enter as a stage."""
+    start = time.perf_counter()
+    with context_manager as value:
+        record_stage(name, time.perf_counter() - start)
+        yield value
+
+
+def format_server_timing(timings: List[Tuple[str, float]]) -> str:
+    """Format stage timings as a `Server-Timing` header value, summing repeated stages."""
+    totals: Dict[str, List[float]] = {}
+    for name, seconds in timings:
+        entry = totals.setdefault(name, [0.0, 0])
+        entry[0] += seconds
+        entry[1] += 1
+    parts = []
+    for name, (seconds, count) in totals.items():
+        part = f"{name};dur={seconds * 1000:.1f}"
+        if count > 1:
+            part += f';desc="{count} calls"'
+        parts.append(part)
+    return ", ".join(parts)
+
+
+class StageTimingCallbackHandler(BaseCallbackHandler):
+    """Callback handler recording LLM calls, the first LLM token and tool calls of a run as stages."""
+
+    run_inline = True
+
+    def __init__(self):
+        self._llm_starts: Dict[UUID, float] = {}
+        self._tool_starts: Dict[UUID, float] = {}
+        self._first_token_seen: set[UUID] = set()
+
+    def on_chat_model_start(self, serialized: Any, messages: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._llm_starts[run_id] = time.perf_counter()
+
+    def on_llm_start(self, serialized: Any, prompts: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._llm_starts[run_id] = time.perf_counter()
+
+    def on_llm_new_token(self, token: str, *, run_id: UUID, **kwargs: Any) -> None:
+        start = self._llm_starts.get(run_id)
+        if start is not None and run_id not in self._first_token_seen:
+            self._first_token_seen.add(run_id)
+            record_stage("llm_first_token", time.perf_counter() - start)
+
+    def _end_llm(self, run_id: UUID) -> None:
+        self._first_token_seen.discard(run_id)
+        start = self._llm_starts.pop(run_id, None)
+        if start is not None:
+            record_stage("llm", time.perf_counter() - start)
+
+    def on_llm_end(self, response: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._end_llm(run_id)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._end_llm(run_id)
+
+    def on_tool_start(self, serialized: Any, input_str: str, *, run_id: UUID, **kwargs: Any) -> None:
+        self._tool_starts[run_id] = time.perf_counter()
+
+    def _end_tool(self, run_id: UUID) -> None:
+        start = self._tool_starts.pop(run_id, None)
+        if start is not None:
+            record_stage("tool", time.perf_counter() - start)
+
+    def on_tool_end(self, output: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._end_tool(run_id)
+
+    def on_tool_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._end_tool(run_id)
@@ -0,0 +1,148 @@
+import json
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncContextManager, Callable, Dict, List, Sequence, Tuple
+
+from fastapi import FastAPI
+
+
+IMPORT_MARKER = "--startup-profile-marker--"
+SERVICE_MODULE = "langgraph_agent_toolkit.service.handler"
+LIFESPAN_STEPS = ("observability", "agents", "checkpointer", "startup")
+
+
+@dataclass(frozen=True)
+class ImportTime:
+    """A module import reported by `python -X importtime`, times in milliseconds."""
+
+    module: str
+    self_ms: float
+    cumulative_ms: float
+    depth: int
+
+
+@dataclass(frozen=True)
+class BudgetViolation:
+    """A measurement above its budget."""
+
+    key: str
+    measured_ms: float
+    budget_ms: float
+
+    def __str__(self) -> str:
+        return f"{self.key}: {self.measured_ms:.1f}ms exceeds budget of {self.budget_ms:.1f}ms"
+
+
+def parse_importtime(output: str) -> List[ImportTime]:
+    """Parse the `-X importtime` lines written to stderr after the marker line, if any."""
+    lines = output.splitlines()
+    if IMPORT_MARKER in lines:
+        lines = lines[lines.index(IMPORT_MARKER) + 1 :]
+
+    imports = []
+    for line in lines:
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|", 2)
+        module = name.lstrip()
+        imports.append(
+            ImportTime(
+                module=module,
+                self_ms=int(self_us) / 1000,
+                cumulative_ms=int(cumulative_us) / 1000,
+                depth=(len(name) - len(module) - 1) // 2,
+            )
+        )
+    return imports
+
+
+def measure_imports(module: str, preload: Sequence[str] = ()) -> List[ImportTime]:
+    """Import `module` in a fresh interpreter and report the modules it imported.
+
+    Modules in `preload` are imported first and left out of the report, which measures
+    the cost a module adds on top of them.
+    """
+    code = "".join(f"import {name}\n" for name in preload)
+    code += f"import sys\nprint({IMPORT_MARKER!r}, file=sys.stderr, flush=True)\nimport {module}\n"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        error = result.stderr.strip().splitlines()[-1:] or ["unknown error"]
+        raise RuntimeError(f"Importing '{module}' failed: {error[0]}")
+    return parse_importtime(result.stderr)
+
+
+def total_import_ms(imports: Sequence[ImportTime]) -> float:
+    """Total import time of the modules imported at the top level."""
+    return sum(i.cumulative_ms for i in imports if i.depth == 0)
+
+
+def self_time_by_package(imports: Sequence[ImportTime]) -> Dict[str, float]:
+    """Sum the import time of the modules of each top-level package, slowest first."""
+    totals: Dict[str, float] = {}
+    for i in imports:
+        package = i.module.split(".", 1)[0]
+        totals[package] = totals.get(package, 0.0) + i.self_ms
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+def agent_import_targets(agent_paths: Sequence[str]) -> List[Tuple[str, str]]:
+    """Map `AGENT_PATHS` entries to (agent ID or object name, module) pairs."""
+    targets = []
+    for import_str in agent_paths:
+        agent_id, is_lazy, target = import_str.partition("=")
+        module, _, object_name = (target if is_lazy else import_str).strip().partition(":")
+        targets.append((agent_id.strip() if is_lazy else object_name, module))
+    return targets
+
+
+async def measure_lifespan(
+    app: FastAPI,
+    lifespan: Callable[[FastAPI], AsyncContextManager[None]],
+    step_seconds: Callable[[str], float],
+) -> Dict[str, float]:
+    """Run the startup of a lifespan and report the duration of its steps in milliseconds.
+
+    Args:
+        app: The app passed to the lifespan
+        lifespan: The lifespan context manager factory
+        step_seconds: Returns the total recorded duration of a step, read before and after startup
+
+    """
+    before = {step: step_seconds(step) for step in LIFESPAN_STEPS}
+    started_at = time.perf_counter()
+    async with lifespan(app):
+        elapsed = time.perf_counter() - started_at
+    timings = {step: (step_seconds(step) - before[step]) * 1000 for step in LIFESPAN_STEPS}
+    timings["total"] = elapsed * 1000
+    return timings
+
+
+def load_budget(path: Path) -> Dict[str, float]:
+    """Load a budget file mapping measurement keys to milliseconds, empty if it does not exist."""
+    if not path.exists():
+        return {}
+    return {key: float(value) for key, value in json.loads(path.read_text()).items()}
+
+
+def save_budget(path: Path, measurements: Dict[str, float], headroom: float) -> Dict[str, float]:
+    """Write the measurements times `headroom` as the new budget."""
+    budget = {key: round(value * headroom, 1) for key, value in sorted(measurements.items())}
+    path.write_text(json.dumps(budget, indent=2) + "\n")
+    return budget
+
+
+def check_budget(measurements: Dict[str, float], budget: Dict[str, float]) -> List[BudgetViolation]:
+    """Compare the measurements with the budget; keys without a budget are not checked."""
+    return [
+        BudgetViolation(key=key, measured_ms=measurements[key], budget_ms=limit)
+        for key, limit in budget.items()
+        if key in measurements and measurements[key] > limit
+    ]
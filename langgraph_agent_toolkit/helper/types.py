@@ -5,3 +5,20 @@ class EnvironmentMode(StrEnum):
     PRODUCTION = auto()
     STAGING = auto()
     DEVELOPMENT = auto()
+
+
+class StreamBufferPolicy(StrEnum):
+    """What a full stream buffer does with new events while the client reads slowly."""
+
+    BLOCK = auto()
+    MERGE_TOKENS = auto()
+    DROP_TOKENS = auto()
+
+
+class StreamProfile(StrEnum):
+    """Events sent by a stream and the LangGraph stream modes needed for them."""
+
+    FULL = auto()
+    TOKENS_ONLY = auto()
+    MESSAGES_ONLY = auto()
+    DELTAS = auto()
@@ -0,0 +1,31 @@
+from typing import List, Optional
+
+import fire
+from dotenv import load_dotenv
+
+
+def build_bundle(
+    path: str = "agent_bundle",
+    agent_paths: Optional[List[str]] = None,
+    prompt_names: Optional[List[str]] = None,
+    template_format: str = "f-string",
+) -> None:
+    """Build an agent bundle to serve with `AGENT_BUNDLE_PATH`, e.g. on AWS Lambda.
+
+    Args:
+        path (str): Directory of the bundle.
+        agent_paths (Optional[List[str]]): Agents to bundle, defaults to `AGENT_PATHS`.
+        prompt_names (Optional[List[str]]): Prompts pulled from `OBSERVABILITY_BACKEND` into the bundle.
+        template_format (str): Template format of the pulled prompts.
+
+    """
+    from langgraph_agent_toolkit.agents.bundle import build_bundle as _build_bundle
+
+    manifest = _build_bundle(path, agent_paths, prompt_names or (), template_format=template_format)
+    print(f"Built bundle {path}: agents {list(manifest.agents)}, prompts {manifest.prompts}")
+
+
+if __name__ == "__main__":
+    load_dotenv(override=True)
+
+    fire.Fire(build_bundle)
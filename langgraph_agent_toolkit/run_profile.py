@@ -0,0 +1,101 @@
+import asyncio
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import fire
+from dotenv import load_dotenv
+
+
+def profile_startup(
+    budget: str = "configs/startup_budget.json",
+    agent_paths: Optional[List[str]] = None,
+    lifespan: bool = True,
+    warmup: bool = False,
+    top: int = 10,
+    update_budget: bool = False,
+    headroom: float = 1.5,
+) -> None:
+    """Profile the startup of the service and compare it against a budget.
+
+    Reports the import time of the service modules by package, the import time every
+    agent adds on top of them and the duration of the lifespan steps. Exits with status 1
+    if a measurement exceeds its budget.
+
+    Args:
+        budget (str): Path of the JSON budget file mapping measurement keys to milliseconds.
+        agent_paths (Optional[List[str]]): Agents to profile, defaults to `AGENT_PATHS`.
+        lifespan (bool): Whether to run the startup of the lifespan.
+        warmup (bool): Whether the lifespan imports lazily registered agents.
+        top (int): Number of packages reported.
+        update_budget (bool): Write the measurements times `headroom` as the new budget.
+        headroom (float): Factor applied to the measurements when updating the budget.
+
+    """
+    from langgraph_agent_toolkit.core.settings import settings
+    from langgraph_agent_toolkit.helper.startup_profile import (
+        SERVICE_MODULE,
+        agent_import_targets,
+        check_budget,
+        load_budget,
+        measure_imports,
+        save_budget,
+        self_time_by_package,
+        total_import_ms,
+    )
+
+    measurements: Dict[str, float] = {}
+
+    service_imports = measure_imports(SERVICE_MODULE)
+    measurements["import:service"] = total_import_ms(service_imports)
+    print(f"Import of {SERVICE_MODULE}: {measurements['import:service']:.1f}ms")
+    for package, ms in list(self_time_by_package(service_imports).items())[:top]:
+        measurements[f"package:{package}"] = ms
+        print(f"  {package:<40} {ms:>10.1f}ms")
+
+    print("Agent imports on top of the service:")
+    for agent_id, module in agent_import_targets(agent_paths or settings.AGENT_PATHS):
+        try:
+            measurements[f"agent:{agent_id}"] = total_import_ms(measure_imports(module, preload=[SERVICE_MODULE]))
+            print(f"  {agent_id:<40} {measurements[f'agent:{agent_id}']:>10.1f}ms")
+        except RuntimeError as e:
+            print(f"  {agent_id:<40} {e}")
+
+    if lifespan:
+        from langgraph_agent_toolkit.helper.startup_profile import measure_lifespan
+        from langgraph_agent_toolkit.service import handler
+
+        if agent_paths:
+            settings.AGENT_PATHS = agent_paths
+        if warmup:
+            settings.AGENT_WARMUP = ["*"]
+        step_timings = asyncio.run(
+            measure_lifespan(
+                handler.create_app(),
+                handler.lifespan,
+                lambda step: handler.STARTUP_STEP_DURATION.total(step=step),
+            )
+        )
+        print("Lifespan steps:")
+        for step, ms in step_timings.items():
+            measurements[f"lifespan:{step}"] = ms
+            print(f"  {step:<40} {ms:>10.1f}ms")
+
+    budget_path = Path(budget)
+    if update_budget:
+        save_budget(budget_path, measurements, headroom)
+        print(f"Updated budget {budget_path}")
+        return
+
+    violations = check_budget(measurements, load_budget(budget_path))
+    for violation in violations:
+        print(f"Budget exceeded - {violation}")
+    if violations:
+        sys.exit(1)
+    print(f"All measurements within budget {budget_path}")
+
+
+if __name__ == "__main__":
+    load_dotenv(override=True)
+
+    fire.Fire(profile_startup)
@@ -24,12 +24,12 @@ def run_service(
     service = ServiceRunner(
         custom_settings=dict(
             AGENT_PATHS=[
-                "langgraph_agent_toolkit.agents.blueprints.react.agent:react_agent",
-                "langgraph_agent_toolkit.agents.blueprints.react_so.agent:react_agent_so",
-                "langgraph_agent_toolkit.agents.blueprints.react_new.agent:react_agent",
+                "react-agent=langgraph_agent_toolkit.agents.blueprints.react.agent:react_agent",
+                "react-agent-so=langgraph_agent_toolkit.agents.blueprints.react_so.agent:react_agent_so",
+                "react-agent-new=langgraph_agent_toolkit.agents.blueprints.react_new.agent:react_agent",
                 # "langgraph_agent_toolkit.agents.blueprints.supervisor_agent.agent:supervisor_agent",
-                "langgraph_agent_toolkit.agents.blueprints.chatbot.agent:chatbot_agent",
-                "langgraph_agent_toolkit.agents.blueprints.interrupt_agent.agent:interrupt_agent",
+                "chatbot-agent=langgraph_agent_toolkit.agents.blueprints.chatbot.agent:chatbot_agent",
+                "interrupt-agent=langgraph_agent_toolkit.agents.blueprints.interrupt_agent.agent:interrupt_agent",
             ]
         ),
     )
@@ -2,15 +2,23 @@ from langgraph_agent_toolkit.schema.schema import (
     AddMessagesInput,
     AddMessagesResponse,
     AgentInfo,
+    BatchInput,
+    BatchItemResult,
+    BatchResponse,
     ChatHistory,
     ChatHistoryInput,
     ChatMessage,
     ClearHistoryInput,
     ClearHistoryResponse,
+    DeleteThreadsInput,
+    DeleteThreadsResponse,
     Feedback,
     FeedbackResponse,
     HealthCheck,
+    HistoryImportEvent,
+    HistoryImportRecord,
     MessageInput,
+    RunResponse,
     ServiceMetadata,
     StreamInput,
     UserComplexInput,
@@ -22,11 +30,16 @@ __all__ = [
     "AddMessagesInput",
     "AddMessagesResponse",
     "AgentInfo",
+    "BatchInput",
+    "BatchItemResult",
+    "BatchResponse",
     "UserComplexInput",
     "UserInput",
     "ChatMessage",
     "ClearHistoryInput",
     "ClearHistoryResponse",
+    "DeleteThreadsInput",
+    "DeleteThreadsResponse",
     "ServiceMetadata",
     "StreamInput",
     "Feedback",
@@ -34,5 +47,8 @@ __all__ = [
     "ChatHistoryInput",
     "ChatHistory",
     "HealthCheck",
+    "HistoryImportEvent",
+    "HistoryImportRecord",
     "MessageInput",
+    "RunResponse",
 ]
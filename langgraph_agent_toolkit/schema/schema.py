@@ -4,10 +4,13 @@ from pydantic import BaseModel, Field
 from typing_extensions import TypedDict
 
 from langgraph_agent_toolkit.helper.constants import (
+    DEFAULT_BATCH_MAX_CONCURRENCY,
+    DEFAULT_BATCH_MAX_SIZE,
     DEFAULT_MODEL_PARAMETER_VALUES,
     DEFAULT_RECURSION_LIMIT,
     get_default_agent,
 )
+from langgraph_agent_toolkit.helper.types import StreamProfile
 
 
 class AgentInfo(BaseModel):
@@ -103,6 +106,13 @@ class UserInput(BaseModel):
         default=None,
         examples=[DEFAULT_RECURSION_LIMIT],
     )
+    resume: bool | None = Field(
+        description=(
+            "Whether the input resumes a pending interrupt of the thread. "
+            "If not set, the server detects pending interrupts itself."
+        ),
+        default=None,
+    )
 
 
 class StreamInput(UserInput):
@@ -112,6 +122,30 @@ class StreamInput(UserInput):
         description="Whether to stream LLM tokens to the client.",
         default=True,
     )
+    stream_profile: StreamProfile | None = Field(
+        description=(
+            "Events to stream: 'full' (tokens, messages and custom events), 'tokens_only' (tokens and interrupts), "
+            "'messages_only' (complete messages without tokens) or 'deltas' (tokens, without repeating the "
+            "streamed AI messages). Overrides `stream_tokens` if set."
+        ),
+        default=None,
+        examples=["deltas"],
+    )
+    coalesce_ms: int | None = Field(
+        description=(
+            "Window in milliseconds to merge consecutive tokens into a single event. "
+            "0 sends every token immediately. If not set, the server default is used."
+        ),
+        default=None,
+        ge=0,
+        examples=[0, 20],
+    )
+    coalesce_bytes: int | None = Field(
+        description="Flush merged tokens once they reach this many characters. If not set, the server default is used.",
+        default=None,
+        ge=0,
+        examples=[4096],
+    )
 
 
 class ToolCall(TypedDict):
@@ -146,6 +180,11 @@ class ChatMessage(BaseModel):
         default=None,
         examples=["call_Jja7J89XsjrOLA5r!MEOW!SL"],
     )
+    id: str | None = Field(
+        description="ID of the message in the thread, used as cursor of the chat history.",
+        default=None,
+        examples=["run-847c6285-8fc9-4560-a83f-4e6285809254"],
+    )
     run_id: str | None = Field(
         description="Run ID of the message.",
         default=None,
@@ -174,6 +213,105 @@ class ChatMessage(BaseModel):
         print(self.pretty_repr())  # noqa: T201
 
 
+class BatchInput(BaseModel):
+    """Independent user inputs to run through the agent in a single request."""
+
+    inputs: list[UserInput] = Field(
+        description="User inputs to invoke the agent with. Results are returned in the same order.",
+        min_length=1,
+        max_length=DEFAULT_BATCH_MAX_SIZE,
+        examples=[
+            [
+                {"input": {"message": "What is the weather in Tokyo?"}},
+                {"input": {"message": "What is the weather in Paris?"}},
+            ]
+        ],
+    )
+    max_concurrency: int | None = Field(
+        description=(
+            f"Maximum number of inputs processed at the same time. Capped at {DEFAULT_BATCH_MAX_CONCURRENCY}."
+        ),
+        default=None,
+        ge=1,
+        examples=[4],
+    )
+
+
+class BatchItemResult(BaseModel):
+    """Result of a single input of a batch."""
+
+    index: int = Field(
+        description="Position of the input in the batch.",
+        examples=[0],
+    )
+    status: Literal["success", "error"] = Field(
+        description="Whether the input was processed successfully.",
+        examples=["success", "error"],
+    )
+    output: ChatMessage | None = Field(
+        description="Final response of the agent, if the input succeeded.",
+        default=None,
+    )
+    error: str | None = Field(
+        description="Error message, if the input failed.",
+        default=None,
+        examples=["GraphRecursionError: Recursion limit of 64 reached"],
+    )
+
+
+class BatchResponse(BaseModel):
+    """Response of a batch invocation."""
+
+    results: list[BatchItemResult] = Field(
+        description="Per-input results in the order of the request.",
+    )
+    succeeded: int = Field(
+        description="Number of inputs processed successfully.",
+        examples=[2],
+    )
+    failed: int = Field(
+        description="Number of inputs that failed.",
+        examples=[0],
+    )
+
+
+class RunResponse(BaseModel):
+    """Status and result of a run submitted for background execution."""
+
+    run_id: str = Field(
+        description="ID of the submitted run.",
+        examples=["847c6285-8fc9-4560-a83f-4e6285809254"],
+    )
+    agent_id: str = Field(
+        description="Agent executing the run.",
+        examples=[get_default_agent()],
+    )
+    status: Literal["pending", "running", "success", "error"] = Field(
+        description="Current status of the run.",
+        examples=["pending", "success"],
+    )
+    output: ChatMessage | None = Field(
+        description="Final response of the agent, once the run succeeded.",
+        default=None,
+    )
+    error: str | None = Field(
+        description="Error message, if the run failed.",
+        default=None,
+    )
+    created_at: float = Field(
+        description="Unix timestamp of the submission.",
+        examples=[1760659200.0],
+    )
+    started_at: float | None = Field(
+        description="Unix timestamp of the start of the execution.",
+        default=None,
+    )
+    finished_at: float | None = Field(
+        description="Unix timestamp of the end of the execution.",
+        default=None,
+    )
+
+
 class Feedback(BaseModel):
     """Feedback for a run, to record to LangSmith."""
 
@@ -278,6 +416,56 @@ class AddMessagesResponse(BaseModel):
     )
 
 
+class HistoryImportRecord(BaseModel):
+    """A conversation to import, one per line of an NDJSON import."""
+
+    thread_id: str = Field(
+        description="Thread ID the messages are appended to.",
+        examples=["847c6285-8fc9-4560-a83f-4e6285809254"],
+    )
+    user_id: str | None = Field(
+        description="User ID associated with the conversation.",
+        default=None,
+        examples=["521c0a60-ea75-43fa-a793-a4cf11e013ae"],
+    )
+    messages: list[MessageInput] = Field(
+        description="Messages to append to the thread, in order.",
+        min_length=1,
+    )
+
+
+class HistoryImportEvent(BaseModel):
+    """Progress of an NDJSON import, streamed back one event per line."""
+
+    type: Literal["progress", "error", "summary"] = Field(
+        description="'error' for a failed record, 'progress' periodically and 'summary' once the import is done.",
+    )
+    line: int | None = Field(
+        description="Line number of the failed record.",
+        default=None,
+    )
+    thread_id: str | None = Field(
+        description="Thread ID of the failed record, if it could be parsed.",
+        default=None,
+    )
+    error: str | None = Field(
+        description="Reason the record failed.",
+        default=None,
+    )
+    processed: int | None = Field(
+        description="Number of records read so far.",
+        default=None,
+    )
+    imported: int | None = Field(
+        description="Number of records written so far.",
+        default=None,
+    )
+    failed: int | None = Field(
+        description="Number of failed records so far.",
+        default=None,
+    )
+
+
 class ClearHistoryInput(BaseModel):
     """Input for clearing messages from the chat history."""
 
@@ -291,6 +479,13 @@ class ClearHistoryInput(BaseModel):
         default=None,
         examples=["521c0a60-ea75-43fa-a793-a4cf11e013ae"],
     )
+    delete_thread: bool = Field(
+        description=(
+            "Delete all checkpoints of the thread in a single operation instead of removing its messages "
+            "in a new checkpoint. Requires thread_id."
+        ),
+        default=False,
+    )
 
 
 class ClearHistoryResponse(BaseModel):
@@ -313,6 +508,31 @@ class ClearHistoryResponse(BaseModel):
     )
 
 
+class DeleteThreadsInput(BaseModel):
+    """Threads to delete with all their checkpoints."""
+
+    thread_ids: list[str] = Field(
+        description="IDs of the threads to delete.",
+        min_length=1,
+        max_length=DEFAULT_BATCH_MAX_SIZE,
+        examples=[["847c6285-8fc9-4560-a83f-4e6285809254"]],
+    )
+
+
+class DeleteThreadsResponse(BaseModel):
+    """Response after deleting threads."""
+
+    status: Literal["success"] = "success"
+    deleted: int = Field(
+        description="Number of distinct threads deleted.",
+        examples=[1],
+    )
+    message: str = Field(
+        description="Descriptive message about the operation.",
+        default="Threads deleted successfully.",
+    )
+
+
 class ChatHistoryInput(BaseModel):
     """Input for retrieving chat history."""
 
@@ -326,10 +546,28 @@ class ChatHistoryInput(BaseModel):
         default=None,
         examples=["521c0a60-ea75-43fa-a793-a4cf11e013ae"],
     )
+    limit: int | None = Field(
+        description="Maximum number of messages to return. Without a cursor, the latest messages are returned.",
+        default=None,
+        ge=1,
+        examples=[50],
+    )
+    before: str | None = Field(
+        description="Return only messages before the message with this ID.",
+        default=None,
+    )
+    after: str | None = Field(
+        description="Return only messages after the message with this ID.",
+        default=None,
+    )
 
 
 class ChatHistory(BaseModel):
     messages: list[ChatMessage]
+    has_more: bool = Field(
+        description="Whether the thread has more messages beyond this page, in the direction of the cursor.",
+        default=False,
+    )
 
 
 class HealthCheck(BaseModel):
@@ -0,0 +1,162 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional
+
+from langgraph_agent_toolkit.helper.exceptions import RateLimitError
+from langgraph_agent_toolkit.helper.metrics import metrics
+
+
+ADMISSION_REJECTED = metrics.counter(
+    "admission_rejected_total",
+    "Agent runs rejected by admission control.",
+    ("scope", "reason"),
+)
+ADMISSION_WAIT = metrics.histogram(
+    "admission_wait_seconds",
+    "Time agent runs waited for a free concurrency slot.",
+    ("scope",),
+)
+
+
+class ConcurrencyLimiter:
+    """Semaphore with a bounded number of waiters and a wait timeout."""
+
+    def __init__(self, name: str, limit: int, max_waiting: int, timeout: float, retry_after: float):
+        self.name = name
+        self.limit = limit
+        self.max_waiting = max_waiting
+        self.timeout = timeout
+        self.retry_after = retry_after
+        self.waiting = 0
+        self._semaphore = asyncio.Semaphore(limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self.limit - self._semaphore._value
+
+    def _reject(self, reason: str) -> RateLimitError:
+        ADMISSION_REJECTED.inc(scope=self.name, reason=reason)
+        return RateLimitError(resource=self.name, limit=self.limit, retry_after=self.retry_after)
+
+    async def acquire(self) -> None:
+        """Take a slot, waiting in the bounded queue when all slots are busy.
+
+        Raises:
+            RateLimitError: If the wait queue is full or no slot was freed in time
+
+        """
+        if not self._semaphore.locked():
+            await self._semaphore.acquire()
+            return
+        if self.waiting >= self.max_waiting:
+            raise self._reject("queue_full")
+
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            raise self._reject("timeout") from None
+        finally:
+            self.waiting -= 1
+        ADMISSION_WAIT.observe(loop.time() - started_at, scope=self.name)
+
+    def release(self) -> None:
+        self._semaphore.release()
+
+
+class AdmissionTicket:
+    """Concurrency slots held by a single agent run, released exactly once."""
+
+    def __init__(self, limiters: List[ConcurrencyLimiter]):
+        self._limiters = limiters
+
+    def release(self) -> None:
+        limiters, self._limiters = self._limiters, []
+        for limiter in reversed(limiters):
+            limiter.release()
+
+
+class AdmissionController:
+    """Global and per-agent limits on agent runs in flight.
+
+    A run first takes a slot of its agent, then a global one, so runs waiting for a busy
+    agent do not hold global slots. When all slots are taken, up to `max_waiting` runs wait
+    for at most `timeout` seconds; beyond that they are rejected with a `RateLimitError`.
+    A limit of 0 disables the corresponding check.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 0,
+        max_concurrency_per_agent: int = 0,
+        agent_limits: Optional[Dict[str, int]] = None,
+        max_waiting: int = 100,
+        timeout: float = 10.0,
+        retry_after: float = 1.0,
+    ):
+        """Initialize the controller.
+
+        Args:
+            max_concurrency: Maximum runs in flight across all agents
+            max_concurrency_per_agent: Default maximum runs in flight per agent
+            agent_limits: Per-agent overrides of `max_concurrency_per_agent`
+            max_waiting: Maximum runs waiting for a slot, per limit
+            timeout: Maximum seconds a run waits for a slot
+            retry_after: Seconds clients are asked to wait before retrying a rejected run
+
+        """
+        self.max_concurrency_per_agent = max_concurrency_per_agent
+        self.agent_limits = dict(agent_limits or {})
+        self.max_waiting = max_waiting
+        self.timeout = timeout
+        self.retry_after = retry_after
+        self._global = self._create_limiter("all agents", max_concurrency)
+        self._agents: Dict[str, ConcurrencyLimiter] = {}
+
+    @property
+    def limits_agents(self) -> bool:
+        """Whether runs are limited per agent."""
+        return self.max_concurrency_per_agent > 0 or any(limit > 0 for limit in self.agent_limits.values())
+
+    def _create_limiter(self, name: str, limit: int) -> Optional[ConcurrencyLimiter]:
+        if limit <= 0:
+            return None
+        return ConcurrencyLimiter(name, limit, self.max_waiting, self.timeout, self.retry_after)
+
+    def _agent_limiter(self, agent_id: str) -> Optional[ConcurrencyLimiter]:
+        limiter = self._agents.get(agent_id)
+        if limiter is None:
+            limit = self.agent_limits.get(agent_id, self.max_concurrency_per_agent)
+            limiter = self._create_limiter(f"agent '{agent_id}'", limit)
+            if limiter is not None:
+                self._agents[agent_id] = limiter
+        return limiter
+
+    async def acquire(self, agent_id: str) -> AdmissionTicket:
+        """Admit a run of an agent, waiting for free slots if needed.
+
+        Raises:
+            RateLimitError: If the run cannot be admitted
+
+        """
+        acquired: List[ConcurrencyLimiter] = []
+        try:
+            for limiter in (self._agent_limiter(agent_id), self._global):
+                if limiter is not None:
+                    await limiter.acquire()
+                    acquired.append(limiter)
+        except BaseException:
+            AdmissionTicket(acquired).release()
+            raise
+        return AdmissionTicket(acquired)
+
+    @asynccontextmanager
+    async def admit(self, agent_id: str) -> AsyncIterator[None]:
+        """Hold slots for a run of an agent for the duration of the block."""
+        ticket = await self.acquire(agent_id)
+        try:
+            yield
+        finally:
+            ticket.release()
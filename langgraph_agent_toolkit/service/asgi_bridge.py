@@ -0,0 +1,205 @@
+import asyncio
+from typing import Any, AsyncIterable, AsyncIterator, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+
+from starlette.types import ASGIApp, Message
+
+from langgraph_agent_toolkit.helper.logging import logger
+
+
+# Response chunks buffered while the client is slower than the app
+DEFAULT_MAX_PENDING_CHUNKS = 16
+# Seconds the app gets to stop on its own after a disconnect before it is cancelled
+DISCONNECT_GRACE_PERIOD = 1.0
+
+RawHeaders = List[Tuple[bytes, bytes]]
+
+
+def http_scope(method: str, url: Any, headers: Mapping[str, str]) -> Dict[str, Any]:
+    """Build the ASGI scope of an HTTP request from its method, URL and headers.
+
+    `url` is either a URL string or an object with `path` and `query` attributes.
+    """
+    if isinstance(url, str):
+        url = urlsplit(url)
+    scheme = getattr(url, "scheme", None)
+    return {
+        "type": "http",
+        # Disconnects are reported through `receive`, which spec versions before 2.4 rely on
+        "asgi": {"version": "3.0", "spec_version": "2.3"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": scheme if isinstance(scheme, str) and scheme else "https",
+        "path": url.path,
+        "raw_path": url.path.encode(),
+        "root_path": "",
+        "query_string": (url.query or "").encode(),
+        "headers": [(k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in headers.items()],
+    }
+
+
+class ASGIRequestBridge:
+    """Runs an ASGI app for a single HTTP request and exposes the response as it is sent.
+
+    The request body is passed to the app chunk by chunk with `more_body`. Once it is consumed,
+    `receive` waits until the response is complete or the client is gone and then reports a
+    disconnect. Response chunks go through a bounded queue, so a slow client holds back the
+    app instead of the response being buffered in memory.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        scope: Dict[str, Any],
+        body: AsyncIterable[bytes],
+        max_pending_chunks: int = DEFAULT_MAX_PENDING_CHUNKS,
+    ):
+        self.app = app
+        self.scope = scope
+        self._body = body.__aiter__()
+        self._next_chunk: Optional[bytes] = None
+        self._request_complete = False
+        self._chunks: asyncio.Queue[Optional[bytes]] = asyncio.Queue(maxsize=max(max_pending_chunks, 1))
+        self._response_start: Optional[asyncio.Future] = None
+        self._response_complete = False
+        self._disconnected = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    async def _read_chunk(self) -> Optional[bytes]:
+        try:
+            return await self._body.__anext__()
+        except StopAsyncIteration:
+            return None
+
+    async def _receive(self) -> Message:
+        if not self._request_complete:
+            # Read one chunk ahead to mark the last one with `more_body: False`
+            chunk = self._next_chunk if self._next_chunk is not None else await self._read_chunk()
+            self._next_chunk = await self._read_chunk() if chunk is not None else None
+            self._request_complete = self._next_chunk is None
+            return {"type": "http.request", "body": chunk or b"", "more_body": not self._request_complete}
+
+        await self._disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def _send(self, message: Message) -> None:
+        if self._disconnected.is_set():
+            raise OSError("Client disconnected")
+        if message["type"] == "http.response.start":
+            self._response_start.set_result((message["status"], list(message.get("headers", []))))
+        elif message["type"] == "http.response.body" and not self._response_complete:
+            body = message.get("body", b"")
+            if body:
+                await self._chunks.put(body)
+            if not message.get("more_body", False):
+                self._response_complete = True
+                await self._chunks.put(None)
+
+    async def _run(self) -> None:
+        try:
+            await self.app(self.scope, self._receive, self._send)
+        except Exception as e:
+            if not self._response_start.done():
+                self._response_start.set_exception(e)
+                return
+            if not self._disconnected.is_set():
+                logger.error(f"ASGI app failed after sending the response start: {e}")
+        if not self._response_start.done():
+            self._response_start.set_exception(RuntimeError("ASGI app returned without sending a response"))
+        elif not self._response_complete and not self._disconnected.is_set():
+            self._response_complete = True
+            await self._chunks.put(None)
+
+    async def start(self) -> Tuple[int, RawHeaders]:
+        """Run the app until it sends the response start.
+
+        Returns:
+            The status code and raw headers of the response
+
+        """
+        self._response_start = asyncio.get_running_loop().create_future()
+        self._task = asyncio.create_task(self._run())
+        return await self._response_start
+
+    async def iter_body(self) -> AsyncIterator[bytes]:
+        """Yield the response body chunks as the app sends them.
+
+        Closing the iterator early, e.g. when the client disconnects, reports a disconnect to
+        the app, see `close`.
+        """
+        try:
+            while (chunk := await self._chunks.get()) is not None:
+                yield chunk
+        finally:
+            await self.close()
+
+    async def read_body(self) -> bytes:
+        """Read the whole response body, without copying it if it was sent in one chunk."""
+        chunks = [chunk async for chunk in self.iter_body()]
+        return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
+    async def close(self) -> None:
+        """Report a disconnect to the app and cancel it if it does not stop within the grace period."""
+        self._disconnected.set()
+        if self._task is None or self._task.done():
+            return
+        # Unblock a pending send, so the app can see the disconnect
+        while not self._chunks.empty():
+            self._chunks.get_nowait()
+        await asyncio.wait({self._task}, timeout=DISCONNECT_GRACE_PERIOD)
+        if not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+
+class LifespanRunner:
+    """Runs the lifespan of an ASGI app on hosts that do not, e.g. Azure Functions."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._messages: asyncio.Queue[Message] = asyncio.Queue()
+        self._startup: Optional[asyncio.Future] = None
+        self._shutdown: Optional[asyncio.Future] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def _receive(self) -> Message:
+        return await self._messages.get()
+
+    async def _send(self, message: Message) -> None:
+        future = self._startup if message["type"].startswith("lifespan.startup") else self._shutdown
+        if future is None or future.done():
+            return
+        if message["type"].endswith(".failed"):
+            future.set_exception(RuntimeError(message.get("message") or message["type"]))
+        else:
+            future.set_result(None)
+
+    async def _run(self) -> None:
+        try:
+            await self.app({"type": "lifespan", "asgi": {"version": "3.0"}, "state": {}}, self._receive, self._send)
+        except Exception as e:
+            logger.error(f"Lifespan failed: {e}")
+        for future in (self._startup, self._shutdown):
+            if future is not None and not future.done():
+                future.set_result(None)
+
+    async def startup(self) -> None:
+        """Start the lifespan once and wait until startup is complete."""
+        if self._startup is None:
+            loop = asyncio.get_running_loop()
+            self._startup = loop.create_future()
+            self._shutdown = loop.create_future()
+            self._task = asyncio.create_task(self._run())
+            await self._messages.put({"type": "lifespan.startup"})
+        await asyncio.shield(self._startup)
+
+    async def shutdown(self) -> None:
+        """Run the shutdown of a started lifespan."""
+        if self._startup is None:
+            return
+        await self._messages.put({"type": "lifespan.shutdown"})
+        await self._shutdown
+        await self._task
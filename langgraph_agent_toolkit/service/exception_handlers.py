@@ -1,3 +1,4 @@
+import math
 import os
 import sys
 import traceback
@@ -133,7 +134,11 @@ def register_exception_handlers(app: FastAPI) -> None:
             content["error_code"] = exc.error_code
         if exc.reset_time:
             content["reset_time"] = exc.reset_time
-        return JSONResponse(status_code=status.HTTP_429_TOO_MANY_REQUESTS, content=content)
+        headers = None
+        if exc.retry_after is not None:
+            content["retry_after"] = exc.retry_after
+            headers = {"Retry-After": str(max(1, math.ceil(exc.retry_after)))}
+        return JSONResponse(status_code=status.HTTP_429_TOO_MANY_REQUESTS, content=content, headers=headers)
 
     @app.exception_handler(ServiceUnavailableError)
     async def service_unavailable_handler(request: Request, exc: ServiceUnavailableError) -> JSONResponse:
@@ -1,18 +1,53 @@
 import asyncio
+import gc
 import json
 import os
 import sys
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from fastapi import FastAPI
 
 from langgraph_agent_toolkit.core import settings as base_settings
+from langgraph_agent_toolkit.core.idempotency.types import IdempotencyBackends
+from langgraph_agent_toolkit.core.models.transport import http_client_registry
+from langgraph_agent_toolkit.core.queue.types import RunQueueBackends
 from langgraph_agent_toolkit.helper.logging import logger
-from langgraph_agent_toolkit.service.handler import create_app
+from langgraph_agent_toolkit.service.asgi_bridge import ASGIRequestBridge, LifespanRunner, http_scope
+from langgraph_agent_toolkit.service.handler import create_app, preload_agents
 from langgraph_agent_toolkit.service.types import RunnerType
 from langgraph_agent_toolkit.service.utils import setup_logging
 
 
+def default_worker_count() -> int:
+    """Return one worker per CPU available to this process."""
+    try:
+        # Respects CPU affinity, e.g. when the container is pinned to some CPUs
+        return max(len(os.sched_getaffinity(0)), 1)
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def process_local_state() -> List[str]:
+    """Return the enabled features whose state is kept in each process instead of being shared by workers."""
+    features = []
+    if base_settings.RUN_QUEUE_BACKEND == RunQueueBackends.MEMORY:
+        features.append("in-memory run queue (RUN_QUEUE_BACKEND=memory)")
+    if base_settings.IDEMPOTENCY_BACKEND == IdempotencyBackends.MEMORY:
+        features.append("in-memory idempotency store (IDEMPOTENCY_BACKEND=memory)")
+    if (
+        base_settings.MAX_CONCURRENT_RUNS > 0
+        or base_settings.MAX_CONCURRENT_RUNS_PER_AGENT > 0
+        or any(limit > 0 for limit in base_settings.AGENT_CONCURRENCY_LIMITS.values())
+    ):
+        features.append("admission limits (MAX_CONCURRENT_RUNS*)")
+    return features
+
+
+def _post_fork(server: Any, worker: Any) -> None:
+    """Drop HTTP clients inherited from the master, so workers open their own connections."""
+    http_client_registry.reset()
+
+
 class ServiceRunner:
     """A factory class to run the API service in different ways.
 
@@ -115,6 +150,13 @@ class ServiceRunner:
     def run_gunicorn(self, **kwargs):
         """Run the API service with gunicorn.
 
+        With `GUNICORN_PRELOAD` the agents are imported and compiled in the master process and
+        the heap is frozen before forking, so workers share these pages instead of copying them
+        on the first garbage collection. Per-worker resources (checkpointer, database pools,
+        HTTP clients) are still opened after the fork. `GUNICORN_WORKERS=0` starts one worker
+        per available CPU. Run queue, idempotency and admission state in memory is per worker,
+        which is logged as a warning when several workers are started.
+
         Args:
             **kwargs: Additional arguments to pass to gunicorn
 
@@ -138,29 +180,78 @@ class ServiceRunner:
             options = {
                 "bind": f"{base_settings.HOST}:{base_settings.PORT}",
                 "worker_class": "uvicorn.workers.UvicornWorker",
+                "workers": base_settings.GUNICORN_WORKERS or default_worker_count(),
             } | kwargs
 
+            local_state = process_local_state()
+            if int(options["workers"]) > 1 and local_state:
+                logger.warning(
+                    f"Starting {options['workers']} gunicorn workers with per-worker state: {', '.join(local_state)}. "
+                    "Queued runs are only visible to the worker that accepted them, duplicate idempotent requests "
+                    "may run more than once and limits apply per worker."
+                )
+
+            if base_settings.GUNICORN_PRELOAD:
+                preload_agents(self.app)
+                options.setdefault("post_fork", _post_fork)
+                # Keep the preloaded objects out of the collector, whose passes would otherwise
+                # write to every tracked object and copy the shared pages into each worker
+                gc.collect()
+                gc.freeze()
+                logger.info(f"Preloaded agents before forking {options['workers']} workers")
+
             GunicornApp(self.app, options).run()
         except ImportError:
             logger.error("Gunicorn not installed. Install it with 'pip install gunicorn'")
             sys.exit(1)
 
     def run_aws_lambda(self, **kwargs):
-        """Prepare the API service for AWS Lambda."""
+        """Prepare the API service for AWS Lambda.
+
+        With `AGENT_BUNDLE_PATH`, the agents are registered from the bundle during init and
+        each one is imported on its first request.
+        """
         try:
             from mangum import Mangum
 
+            if base_settings.AGENT_BUNDLE_PATH:
+                preload_agents(self.app, warmup=False)
             return Mangum(self.app, **kwargs)
         except ImportError:
             logger.error("Mangum not installed. Install it with 'pip install mangum'")
             sys.exit(1)
 
-    def run_azure_functions(self, **kwargs):
-        """Prepare the API service for Azure Functions."""
+    def run_azure_functions(self, streaming: bool = False, **kwargs):
+        """Prepare the API service for Azure Functions.
+
+        The returned function handles `func.HttpRequest`s and returns the whole response. With
+        `streaming`, it handles requests of the Azure Functions HTTP streams extension
+        (`azurefunctions-extensions-http-fastapi`) and sends response chunks as the app produces
+        them, e.g. the events of `/stream`. The lifespan of the app runs on the first request.
+        """
+        lifespan = LifespanRunner(self.app)
+
+        if streaming:
+            try:
+                from azurefunctions.extensions.http.fastapi import Request, StreamingResponse
+
+                async def stream(req: Request) -> StreamingResponse:
+                    await lifespan.startup()
+                    return await self._stream_azure_request(self.app, req)
+
+                return stream
+            except ImportError:
+                logger.error(
+                    "Azure Functions HTTP streams extension not installed. "
+                    "Install with 'pip install azurefunctions-extensions-http-fastapi'"
+                )
+                sys.exit(1)
+
         try:
             import azure.functions as func
 
             async def main(req: func.HttpRequest) -> func.HttpResponse:
+                await lifespan.startup()
                 # Process the request through ASGI app
                 return await self._handle_azure_request(self.app, req)
 
@@ -174,46 +265,33 @@ class ServiceRunner:
         """Handle Azure Functions HTTP request."""
         import azure.functions as func
 
-        # Convert request to ASGI format
-        scope = {
-            "type": "http",
-            "http_version": "1.1",
-            "method": req.method,
-            "path": req.url.path,
-            "query_string": req.url.query.encode(),
-            "headers": [(k.encode(), v.encode()) for k, v in req.headers.items()],
-        }
-
-        # Create response container
-        response_body = []
-        response_status = None
-        response_headers = []
-
-        async def receive():
-            return {"type": "http.request", "body": req.get_body() or b""}
+        async def request_body():
+            # The platform hands over the request body as a single buffer
+            yield req.get_body() or b""
 
-        async def send(message):
-            nonlocal response_status, response_headers
-
-            if message["type"] == "http.response.start":
-                response_status = message["status"]
-                response_headers = message["headers"]
-            elif message["type"] == "http.response.body":
-                response_body.append(message["body"])
-
-        # Process the request through ASGI app
-        await app(scope, receive, send)
-
-        # Build Azure Functions response
-        headers = {k.decode(): v.decode() for k, v in response_headers}
-        body = b"".join(response_body)
+        bridge = ASGIRequestBridge(app, http_scope(req.method, req.url, req.headers), request_body())
+        status_code, raw_headers = await bridge.start()
+        body = await bridge.read_body()
 
         return func.HttpResponse(
             body=body,
-            status_code=response_status,
-            headers=headers,
+            status_code=status_code,
+            headers={k.decode("latin-1"): v.decode("latin-1") for k, v in raw_headers},
         )
 
+    @staticmethod
+    async def _stream_azure_request(app: FastAPI, req: "Request") -> "StreamingResponse":
+        """Handle a request of the Azure Functions HTTP streams extension, streaming both bodies."""
+        from azurefunctions.extensions.http.fastapi import StreamingResponse
+
+        bridge = ASGIRequestBridge(app, http_scope(req.method, req.url, req.headers), req.stream())
+        status_code, raw_headers = await bridge.start()
+
+        response = StreamingResponse(bridge.iter_body(), status_code=status_code)
+        # Keeps repeated headers such as set-cookie
+        response.raw_headers = raw_headers
+        return response
+
     def run(self, runner_type: RunnerType = RunnerType.UVICORN, **kwargs):
         """Run the API service with the specified runner type.
 
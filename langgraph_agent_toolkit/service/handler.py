@@ -1,27 +1,65 @@
+import asyncio
+import os
+import time
 import warnings
-from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
-from typing import Any, Optional
+from collections.abc import AsyncGenerator, Awaitable
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, Optional, Tuple, TypeVar
 
 from fastapi import Depends, FastAPI
 from langchain_core._api import LangChainBetaWarning
 
 from langgraph_agent_toolkit import __version__
+from langgraph_agent_toolkit.agents.agent import Agent
 from langgraph_agent_toolkit.agents.agent_executor import AgentExecutor
+from langgraph_agent_toolkit.agents.bundle import load_bundle
+from langgraph_agent_toolkit.core.idempotency.factory import IdempotencyStoreFactory
+from langgraph_agent_toolkit.core.idempotency.types import IdempotencyBackends
+from langgraph_agent_toolkit.core.memory.base import BaseMemoryBackend
 from langgraph_agent_toolkit.core.memory.factory import MemoryFactory
+from langgraph_agent_toolkit.core.models.config_reloader import ModelConfigsReloader
+from langgraph_agent_toolkit.core.models.transport import http_client_registry
 from langgraph_agent_toolkit.core.observability.empty import BaseObservabilityPlatform, EmptyObservability
 from langgraph_agent_toolkit.core.observability.factory import ObservabilityFactory
 from langgraph_agent_toolkit.core.observability.types import ObservabilityBackend
+from langgraph_agent_toolkit.core.queue.factory import RunQueueFactory
+from langgraph_agent_toolkit.core.queue.worker import RunWorkerPool
 from langgraph_agent_toolkit.core.settings import settings
 from langgraph_agent_toolkit.helper.logging import logger
+from langgraph_agent_toolkit.helper.metrics import metrics
+from langgraph_agent_toolkit.service.admission import AdmissionController
 from langgraph_agent_toolkit.service.exception_handlers import register_exception_handlers
-from langgraph_agent_toolkit.service.middleware import LoggingMiddleware
+from langgraph_agent_toolkit.service.idempotency import IdempotencyManager
+from langgraph_agent_toolkit.service.middleware import CompressionMiddleware, LoggingMiddleware, ServerTimingMiddleware
 from langgraph_agent_toolkit.service.routes import private_router, public_router
 from langgraph_agent_toolkit.service.utils import verify_bearer
 
 
 warnings.filterwarnings("ignore", category=LangChainBetaWarning)
 
+T = TypeVar("T")
+
+
+STARTUP_STEP_DURATION = metrics.histogram(
+    "startup_step_duration_seconds",
+    "Duration of the initialization steps of the service.",
+    ("step",),
+)
+
+
+def _log_step(name: str, seconds: float) -> None:
+    STARTUP_STEP_DURATION.observe(seconds, step=name)
+    logger.info(f"Startup step '{name}' took {seconds * 1000:.1f}ms")
+
+
+async def _timed_step(name: str, step: Awaitable[T]) -> T:
+    """Await an initialization step and log its duration."""
+    started_at = time.perf_counter()
+    try:
+        return await step
+    finally:
+        _log_step(name, time.perf_counter() - started_at)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -34,38 +72,143 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         observability: BaseObservabilityPlatform,
         checkpointer: Optional[Any] = None,
     ):
-        agents = executor.get_all_agent_info()
-        if not agents:
-            logger.warning("No agents found in the executor.")
-        for a in agents:
+        def setup_agent(agent: Agent) -> None:
             try:
-                agent = executor.get_agent(a.key)
-
                 if checkpointer and not agent.graph.checkpointer:
                     agent.graph.checkpointer = checkpointer
 
                 if not agent.observability:
                     agent.observability = observability
 
-                initialized_agents.append(a.key)
-                logger.info(f"Successfully initialized agent: {a.key}")
+                initialized_agents.append(agent.name)
+                logger.info(f"Successfully initialized agent: {agent.name}")
             except Exception as e:
-                logger.error(f"Error setting up agent {a.key}: {e}")
+                logger.error(f"Error setting up agent {agent.name}: {e}")
+
+        if not executor.agent_ids:
+            logger.warning("No agents found in the executor.")
+        # Lazily registered agents are set up when they are loaded
+        executor.add_agent_initializer(setup_agent)
         if initialized_agents:
             logger.info(f"Successfully initialized {len(initialized_agents)} agents")
-        else:
+        elif executor.agents:
             logger.warning("No agents were successfully initialized")
 
-    try:
-        # Initialize observability platform
+    @asynccontextmanager
+    async def run_workers(executor: AgentExecutor) -> AsyncGenerator[None, None]:
+        """Serve queued runs in the background while the app is running."""
+        try:
+            run_queue = RunQueueFactory.create(settings.RUN_QUEUE_BACKEND)
+            app.state.run_queue = run_queue
+        except Exception as e:
+            logger.error(f"Failed to initialize run queue: {e}")
+            yield
+            return
+
+        # Queued runs count towards the same concurrency limits as direct ones
+        controller: Optional[AdmissionController] = getattr(app.state, "admission_controller", None)
+        worker_pool = RunWorkerPool(
+            run_queue, executor, size=settings.RUN_WORKERS, admit=controller.acquire if controller else None
+        )
+        worker_pool.start()
+        app.state.run_worker_pool = worker_pool
+        try:
+            yield
+        finally:
+            # Stop the workers before the checkpointer they use is closed
+            await worker_pool.stop()
+            await run_queue.close()
+
+    @asynccontextmanager
+    async def use_idempotency_store(memory_backend: Optional[BaseMemoryBackend]) -> AsyncGenerator[None, None]:
+        """Keep idempotent responses in the store of the memory backend if configured."""
+        if settings.IDEMPOTENCY_BACKEND != IdempotencyBackends.STORE:
+            yield
+            return
+        if memory_backend is None:
+            logger.warning("Idempotency store backend requires a memory backend, keeping responses in memory")
+            yield
+            return
+
+        async with AsyncExitStack() as stack:
+            try:
+                store = await stack.enter_async_context(memory_backend.get_memory_store())
+                await store.setup()
+                manager: IdempotencyManager = app.state.idempotency
+                manager.store = IdempotencyStoreFactory.create(IdempotencyBackends.STORE, store=store)
+                logger.info("Keeping idempotent responses in the memory backend store")
+            except Exception as e:
+                logger.error(f"Failed to initialize idempotency store, keeping responses in memory: {e}")
+            yield
+
+    @asynccontextmanager
+    async def watch_model_configs() -> AsyncGenerator[None, None]:
+        """Reload the model configurations while the app is running if they come from a file."""
+        # MODEL_CONFIGS and MODEL_CONFIGS_BASE64 take precedence over the file
+        from_file = not (os.environ.get("MODEL_CONFIGS") or os.environ.get("MODEL_CONFIGS_BASE64"))
+        if not (settings.MODEL_CONFIGS_PATH and settings.MODEL_CONFIGS_WATCH and from_file):
+            yield
+            return
+
+        reloader = ModelConfigsReloader(settings.MODEL_CONFIGS_PATH)
         try:
-            observability = ObservabilityFactory.create(settings.OBSERVABILITY_BACKEND or ObservabilityBackend.EMPTY)
+            reloader.start()
+        except Exception as e:
+            logger.error(f"Failed to watch model configurations: {e}")
+            yield
+            return
+        try:
+            yield
+        finally:
+            reloader.stop()
+
+    async def create_observability() -> BaseObservabilityPlatform:
+        try:
+            platform = await asyncio.to_thread(
+                ObservabilityFactory.create, settings.OBSERVABILITY_BACKEND or ObservabilityBackend.EMPTY
+            )
             logger.info(f"Initialized observability backend: {settings.OBSERVABILITY_BACKEND}")
+            return platform
         except Exception as e:
             logger.error(f"Failed to initialize observability backend: {e}")
-            observability = EmptyObservability()
+            return EmptyObservability()
 
-        # Initialize memory backend
+    async def load_agents() -> Optional[AgentExecutor]:
+        # Agents preloaded before forking workers are reused
+        executor = getattr(app.state, "agent_executor", None)
+        if executor is not None:
+            return executor
+        try:
+            # Importing the agents is blocking, keep the event loop free for the other steps
+            executor = await asyncio.to_thread(create_agent_executor)
+        except Exception as e:
+            logger.error(f"Failed to initialize AgentExecutor: {e}")
+            return None
+        logger.info(f"Initialized AgentExecutor: {executor.agent_ids}")
+        app.state.agent_executor = executor
+        if settings.AGENT_WARMUP:
+            warmup_ids = None if "*" in settings.AGENT_WARMUP else settings.AGENT_WARMUP
+            await executor.awarmup(warmup_ids)
+        return executor
+
+    async def open_checkpointer(
+        stack: AsyncExitStack, memory_backend: Optional[BaseMemoryBackend]
+    ) -> Tuple[bool, Optional[Any]]:
+        if memory_backend is None:
+            return True, None
+        try:
+            saver = await stack.enter_async_context(memory_backend.get_checkpoint_saver())
+            if saver is not None:
+                await saver.setup()
+            return True, saver
+        except Exception as e:
+            logger.error(f"Error during database setup: {e}")
+            return False, None
+
+    try:
+        started_at = time.perf_counter()
+
+        # Initialize memory backend, which only validates the settings
         try:
             memory_backend = MemoryFactory.create(settings.MEMORY_BACKEND) if settings.MEMORY_BACKEND else None
 
@@ -78,30 +221,22 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             yield
             return
 
-        # Initialize agent executor
-        try:
-            executor = AgentExecutor(*settings.AGENT_PATHS)
-            logger.info(f"Initialized AgentExecutor: {settings.AGENT_PATHS}")
-            app.state.agent_executor = executor
-        except Exception as e:
-            logger.error(f"Failed to initialize AgentExecutor: {e}")
-            yield
-            return
+        async with AsyncExitStack() as stack:
+            # The steps are independent, so they run concurrently
+            observability, executor, (checkpointer_ready, saver) = await asyncio.gather(
+                _timed_step("observability", create_observability()),
+                _timed_step("agents", load_agents()),
+                _timed_step("checkpointer", open_checkpointer(stack, memory_backend)),
+            )
+            _log_step("startup", time.perf_counter() - started_at)
 
-        if memory_backend:
-            checkpoint = memory_backend.get_checkpoint_saver()
-            async with checkpoint as saver:
-                try:
-                    if saver is not None:
-                        await saver.setup()
-                    initialize_agents(executor, observability, checkpointer=saver)
-                    yield
-                except Exception as e:
-                    logger.error(f"Error during database setup: {e}")
-                    yield
-        else:
-            initialize_agents(executor, observability)
-            yield
+            if executor is None or not checkpointer_ready:
+                yield
+                return
+
+            initialize_agents(executor, observability, checkpointer=saver)
+            async with run_workers(executor), use_idempotency_store(memory_backend), watch_model_configs():
+                yield
     except Exception as e:
         logger.error(f"Error during initialization: {e}")
         yield
@@ -112,6 +247,35 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
                 observability.before_shutdown()
             except Exception as e:
                 logger.error(f"Error closing observability: {e}")
+        try:
+            # Pooled connections of the models are closed, the next lifespan opens new ones
+            await http_client_registry.aclose()
+        except Exception as e:
+            logger.error(f"Error closing HTTP clients: {e}")
+
+
+def create_agent_executor() -> AgentExecutor:
+    """Create the AgentExecutor from the agent bundle if configured, otherwise from `AGENT_PATHS`."""
+    if settings.AGENT_BUNDLE_PATH:
+        return load_bundle(settings.AGENT_BUNDLE_PATH)
+    return AgentExecutor(*settings.AGENT_PATHS)
+
+
+def preload_agents(app: FastAPI, warmup: bool = True) -> AgentExecutor:
+    """Import the agents and compile their graphs ahead of the lifespan.
+
+    Called in the master process of a pre-forking server, so workers share the imported
+    modules and compiled graphs copy-on-write instead of each importing them. The lifespan
+    of every worker reuses the executor and still opens its own checkpointer and pools.
+    Without `warmup`, lazily registered agents are still imported on first use.
+    """
+    executor = create_agent_executor()
+    if warmup:
+        # Lazily registered agents are loaded too, otherwise every worker would import them on its own
+        executor.warmup()
+    logger.info(f"Preloaded AgentExecutor: {executor.agent_ids}")
+    app.state.agent_executor = executor
+    return executor
 
 
 def create_app() -> FastAPI:
@@ -125,7 +289,27 @@ def create_app() -> FastAPI:
         version=__version__,
     )
 
+    app.state.admission_controller = AdmissionController(
+        max_concurrency=settings.MAX_CONCURRENT_RUNS,
+        max_concurrency_per_agent=settings.MAX_CONCURRENT_RUNS_PER_AGENT,
+        agent_limits=settings.AGENT_CONCURRENCY_LIMITS,
+        max_waiting=settings.ADMISSION_MAX_WAITING,
+        timeout=settings.ADMISSION_TIMEOUT,
+        retry_after=settings.ADMISSION_RETRY_AFTER,
+    )
+
+    app.state.idempotency = IdempotencyManager(
+        IdempotencyStoreFactory.create(IdempotencyBackends.MEMORY), ttl=settings.IDEMPOTENCY_TTL
+    )
+
     # add middleware
+    if settings.COMPRESSION_ENABLED:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.COMPRESSION_MIN_SIZE,
+            encodings=settings.COMPRESSION_ENCODINGS,
+        )
+    app.add_middleware(ServerTimingMiddleware)
     app.add_middleware(LoggingMiddleware)
 
     # Register exception handlers
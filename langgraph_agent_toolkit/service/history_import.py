@@ -0,0 +1,169 @@
+import asyncio
+from typing import AsyncGenerator, AsyncIterator, Callable, Dict, List, Optional, Set, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.graph import START
+from pydantic import ValidationError
+from starlette.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+from langgraph_agent_toolkit.agents.agent import Agent
+from langgraph_agent_toolkit.helper.constants import (
+    DEFAULT_IMPORT_MAX_LINE_BYTES,
+    DEFAULT_IMPORT_PROGRESS_INTERVAL,
+)
+from langgraph_agent_toolkit.helper.logging import logger
+from langgraph_agent_toolkit.schema import HistoryImportEvent, HistoryImportRecord
+
+
+class NDJSONStreamingResponse(StreamingResponse):
+    """Streaming NDJSON response that leaves the request body to the response content.
+
+    `StreamingResponse` listens for a client disconnect on older ASGI servers, which would
+    consume the request body still being read by the content generator.
+    """
+
+    media_type = "application/x-ndjson"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+class LineTooLongError(ValueError):
+    """Raised when an NDJSON line exceeds the maximum size."""
+
+
+async def iter_ndjson_lines(
+    chunks: AsyncIterator[bytes],
+    max_line_bytes: int = DEFAULT_IMPORT_MAX_LINE_BYTES,
+) -> AsyncGenerator[bytes | LineTooLongError, None]:
+    """Split a byte stream into NDJSON lines without reading it fully.
+
+    Lines longer than `max_line_bytes` are skipped and reported as a `LineTooLongError`
+    in their place, so a single broken record does not stop the import. Blank lines are
+    yielded as empty bytes to keep line numbers aligned.
+    """
+    buffer = bytearray()
+    skipping = False
+    async for chunk in chunks:
+        start = 0
+        while (end := chunk.find(b"\n", start)) != -1:
+            if not skipping:
+                buffer += chunk[start:end]
+            if skipping or len(buffer) > max_line_bytes:
+                yield LineTooLongError(f"Line exceeds {max_line_bytes} bytes")
+            else:
+                yield bytes(buffer)
+            skipping = False
+            buffer.clear()
+            start = end + 1
+        if not skipping:
+            buffer += chunk[start:]
+            if len(buffer) > max_line_bytes:
+                skipping = True
+                buffer.clear()
+    if skipping:
+        yield LineTooLongError(f"Line exceeds {max_line_bytes} bytes")
+    elif buffer:
+        yield bytes(buffer)
+
+
+async def import_history(
+    agent: Agent,
+    lines: AsyncIterator[bytes | LineTooLongError],
+    max_concurrency: int,
+    progress_interval: int = DEFAULT_IMPORT_PROGRESS_INTERVAL,
+    on_thread_updated: Optional[Callable[[str], None]] = None,
+) -> AsyncGenerator[HistoryImportEvent, None]:
+    """Write NDJSON conversation records to the thread history of an agent.
+
+    Every record is parsed as soon as its line is complete and appended to its thread with
+    `aupdate_state` through the agent's checkpointer. At most `max_concurrency` records are
+    written at once; reading further lines waits for a free slot, so memory use does not
+    depend on the size of the import. Records of the same thread are written one after another
+    in the order of their lines, since concurrent updates of a thread would branch from the same
+    checkpoint and drop each other's messages. Records are written as graph input, like the first
+    update of a thread, so appending to a thread does not depend on which node wrote it last.
+    `on_thread_updated` is called with the thread ID after every write, e.g. to drop cached state.
+
+    Yields:
+        An error event for every failed record, a progress event every `progress_interval`
+        records and a final summary event
+
+    """
+    semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+    tasks: Set[asyncio.Task] = set()
+    events: List[HistoryImportEvent] = []
+    # Lock of every thread with records being written and the number of those records
+    thread_locks: Dict[str, Tuple[asyncio.Lock, int]] = {}
+    processed = imported = failed = 0
+
+    def fail(line_number: int, thread_id: str | None, error: str) -> None:
+        nonlocal failed
+        failed += 1
+        events.append(HistoryImportEvent(type="error", line=line_number, thread_id=thread_id, error=error))
+
+    async def write(line_number: int, record: HistoryImportRecord, lock: asyncio.Lock) -> None:
+        nonlocal imported
+        try:
+            async with lock:
+                await agent.graph.aupdate_state(
+                    config=RunnableConfig(configurable={"thread_id": record.thread_id, "user_id": record.user_id}),
+                    values={"messages": [{"type": m.type, "content": m.content} for m in record.messages]},
+                    as_node=START,
+                )
+                if on_thread_updated is not None:
+                    on_thread_updated(record.thread_id)
+            imported += 1
+        except Exception as e:
+            fail(line_number, record.thread_id, f"{type(e).__name__}: {e}")
+        finally:
+            lock, writers = thread_locks[record.thread_id]
+            if writers == 1:
+                del thread_locks[record.thread_id]
+            else:
+                thread_locks[record.thread_id] = (lock, writers - 1)
+            semaphore.release()
+
+    def progress(event_type: str) -> HistoryImportEvent:
+        return HistoryImportEvent(type=event_type, processed=processed, imported=imported, failed=failed)
+
+    try:
+        line_number = 0
+        async for line in lines:
+            line_number += 1
+            if isinstance(line, bytes) and not line.strip():
+                continue
+
+            processed += 1
+            if isinstance(line, LineTooLongError):
+                fail(line_number, None, str(line))
+            else:
+                try:
+                    record = HistoryImportRecord.model_validate_json(line)
+                except ValidationError as e:
+                    fail(line_number, None, f"Invalid record: {e.errors(include_url=False, include_input=False)}")
+                else:
+                    await semaphore.acquire()
+                    lock, writers = thread_locks.get(record.thread_id, (None, 0))
+                    lock = lock or asyncio.Lock()
+                    thread_locks[record.thread_id] = (lock, writers + 1)
+                    task = asyncio.create_task(write(line_number, record, lock))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+
+            if processed % progress_interval == 0:
+                events.append(progress("progress"))
+                logger.info(f"History import: {processed} records processed, {failed} failed")
+            while events:
+                yield events.pop(0)
+
+        await asyncio.gather(*tasks)
+        while events:
+            yield events.pop(0)
+        yield progress("summary")
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,106 @@
+import asyncio
+import hashlib
+import time
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+from fastapi import HTTPException, status
+from fastapi.encoders import jsonable_encoder
+
+from langgraph_agent_toolkit.core.idempotency.base import BaseIdempotencyStore
+from langgraph_agent_toolkit.core.idempotency.types import IdempotencyRecord
+from langgraph_agent_toolkit.helper.metrics import metrics
+
+
+IDEMPOTENT_REPLAYS = metrics.counter(
+    "idempotent_replays_total",
+    "Requests answered with the response of an earlier request with the same idempotency key.",
+    ("source",),
+)
+
+
+def fingerprint(payload: str | bytes) -> str:
+    """Hash a request payload to detect keys reused with a different request."""
+    if isinstance(payload, str):
+        payload = payload.encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+class IdempotencyManager:
+    """Runs requests with the same idempotency key only once.
+
+    While a request is running, duplicates in the same process wait for its response.
+    Successful responses are stored for `ttl` seconds and returned to later duplicates.
+    Failures are not stored, so a retry after a failure runs the request again.
+    """
+
+    def __init__(self, store: BaseIdempotencyStore, ttl: float):
+        self.store = store
+        self.ttl = ttl
+        self._in_flight: Dict[str, Tuple[str, asyncio.Future]] = {}
+
+    @staticmethod
+    def _check_fingerprint(key: str, expected: str, actual: str) -> None:
+        if expected != actual:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                detail=f"Idempotency key '{key}' was already used with a different request",
+            )
+
+    async def run(
+        self, key: str, request_fingerprint: str, call: Callable[[], Awaitable[Any]]
+    ) -> Tuple[Dict[str, Any], bool]:
+        """Run `call` unless a request with the same key ran or is running.
+
+        Args:
+            key: Idempotency key, scoped by the caller to the endpoint and agent
+            request_fingerprint: Hash of the request payload
+            call: Runs the request and returns its response
+
+        Returns:
+            The JSON-compatible response and whether it was replayed from an earlier request
+
+        Raises:
+            HTTPException: If the key was used with a different request
+
+        """
+        if key in self._in_flight:
+            expected, future = self._in_flight[key]
+            self._check_fingerprint(key, expected, request_fingerprint)
+            response = await asyncio.shield(future)
+            IDEMPOTENT_REPLAYS.inc(source="in_flight")
+            return response, True
+
+        # Claim the key before awaiting the store, so concurrent duplicates wait for this request
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = (request_fingerprint, future)
+        try:
+            record = await self.store.get(key)
+            if record is not None:
+                self._check_fingerprint(key, record.fingerprint, request_fingerprint)
+                IDEMPOTENT_REPLAYS.inc(source="store")
+                future.set_result(record.response)
+                return record.response, True
+
+            response = jsonable_encoder(await call())
+            now = time.time()
+            await self.store.put(
+                IdempotencyRecord(
+                    key=key,
+                    fingerprint=request_fingerprint,
+                    response=response,
+                    created_at=now,
+                    expires_at=now + self.ttl,
+                )
+            )
+            future.set_result(response)
+            return response, False
+        except BaseException as e:
+            if not future.done():
+                if not isinstance(e, Exception):
+                    e = RuntimeError(f"Request with idempotency key '{key}' was cancelled")
+                future.set_exception(e)
+                # Waiting duplicates re-raise it, mark it as retrieved for requests without duplicates
+                future.exception()
+            raise
+        finally:
+            del self._in_flight[key]
@@ -1,28 +1,351 @@
 import os
+import random
+import time
+import zlib
 from http.client import responses
+from typing import Callable, Dict, Iterable, Optional, Protocol
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware, DispatchFunction
-from starlette.types import ASGIApp
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from langgraph_agent_toolkit.core.settings import settings
 from langgraph_agent_toolkit.helper.logging import logger
+from langgraph_agent_toolkit.helper.metrics import (
+    HTTP_REQUEST_DURATION,
+    format_server_timing,
+    metrics,
+    start_stage_timings,
+)
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware to log incoming requests and outgoing responses."""
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is an optional encoding
+    brotli = None
 
-    def __init__(self, app: ASGIApp, dispatch: DispatchFunction | None = None):
-        super().__init__(app=app, dispatch=dispatch)
-        self.skip_redirection_logging = os.getenv("SKIP_REDIRECTION_LOGGING", "true").lower() == "true"
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - zstandard is an optional encoding
+    zstandard = None
 
-    async def dispatch(self, request: Request, call_next):
-        logger.info(f"HTTP Request: {request.method} {request.url}")
-        response = await call_next(request)
 
-        if self.skip_redirection_logging and 300 <= response.status_code < 400:
-            return response
+COMPRESSION_BYTES = metrics.counter(
+    "http_compression_bytes_total",
+    "Response body bytes before and after compression.",
+    ("encoding", "stage"),
+)
 
-        logger.info(
-            f'HTTP Response: {request.method} {request.url} "{response.status_code} {responses[response.status_code]}"'
+
+class LoggingMiddleware:
+    """Pure ASGI middleware logging every response with its duration and time to first byte.
+
+    Unlike `BaseHTTPMiddleware` it does not wrap the response in a separate task and memory
+    stream, so streaming responses are passed through untouched. A single line is logged per
+    request. Successful requests can be sampled, server errors are always logged.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_rate: float | None = None,
+        exclude_paths: Iterable[str] | None = None,
+        skip_redirection_logging: bool | None = None,
+    ):
+        """Initialize the middleware.
+
+        Args:
+            app: The ASGI application
+            sample_rate: Share of requests to log, between 0 and 1. Defaults to `REQUEST_LOG_SAMPLE_RATE`.
+            exclude_paths: Paths that are never logged. Defaults to `REQUEST_LOG_EXCLUDE_PATHS`.
+            skip_redirection_logging: Whether to skip 3xx responses. Defaults to `SKIP_REDIRECTION_LOGGING` or True.
+
+        """
+        self.app = app
+        self.sample_rate = settings.REQUEST_LOG_SAMPLE_RATE if sample_rate is None else float(sample_rate)
+        self.exclude_paths = frozenset(settings.REQUEST_LOG_EXCLUDE_PATHS if exclude_paths is None else exclude_paths)
+        self.skip_redirection_logging = (
+            os.getenv("SKIP_REDIRECTION_LOGGING", "true").lower() == "true"
+            if skip_redirection_logging is None
+            else skip_redirection_logging
         )
-        return response
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+        first_byte_at: float | None = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, first_byte_at
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif first_byte_at is None and message["type"] == "http.response.body" and message.get("body"):
+                first_byte_at = time.perf_counter()
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self._log(scope, status_code, start, first_byte_at)
+
+    def _log(self, scope: Scope, status_code: int, start: float, first_byte_at: float | None) -> None:
+        if status_code < 500:
+            if self.skip_redirection_logging and 300 <= status_code < 400:
+                return
+            if self.sample_rate < 1 and random.random() >= self.sample_rate:
+                return
+
+        duration_ms = (time.perf_counter() - start) * 1000
+        ttfb_ms = (first_byte_at - start) * 1000 if first_byte_at is not None else duration_ms
+        logger.log(
+            "WARNING" if status_code >= 500 else "INFO",
+            'HTTP {} {} "{} {}" duration={:.1f}ms ttfb={:.1f}ms',
+            scope["method"],
+            scope["path"],
+            status_code,
+            responses.get(status_code, ""),
+            duration_ms,
+            ttfb_ms,
+        )
+
+
+class ServerTimingMiddleware:
+    """Pure ASGI middleware collecting per-stage timings of a request.
+
+    Stages recorded while the response headers are not yet sent are reported in a `Server-Timing`
+    header. For streaming responses this covers the stages before the first byte, later stages
+    are only aggregated into the stage histogram. The total request duration is observed in the
+    request histogram, labelled with the route template to keep the cardinality bounded.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        timings = start_stage_timings()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                timings.append(("app", time.perf_counter() - start))
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", format_server_timing(timings))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = getattr(scope.get("route"), "path", "unmatched")
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - start,
+                method=scope["method"],
+                route=route,
+                status=str(status_code),
+            )
+
+
+class _Encoder(Protocol):
+    def compress(self, data: bytes, flush: bool = False) -> bytes: ...
+
+    def finish(self) -> bytes: ...
+
+
+class _GzipEncoder:
+    def __init__(self):
+        self._compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes, flush: bool = False) -> bytes:
+        output = self._compressor.compress(data)
+        return output + self._compressor.flush(zlib.Z_SYNC_FLUSH) if flush else output
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _BrotliEncoder:
+    def __init__(self):
+        self._compressor = brotli.Compressor(quality=4)
+
+    def compress(self, data: bytes, flush: bool = False) -> bytes:
+        output = self._compressor.process(data)
+        return output + self._compressor.flush() if flush else output
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class _ZstdEncoder:
+    def __init__(self):
+        self._compressor = zstandard.ZstdCompressor(level=3).compressobj()
+
+    def compress(self, data: bytes, flush: bool = False) -> bytes:
+        output = self._compressor.compress(data)
+        return output + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK) if flush else output
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+ENCODERS: Dict[str, Callable[[], _Encoder]] = {"gzip": _GzipEncoder}
+if brotli is not None:
+    ENCODERS["br"] = _BrotliEncoder
+if zstandard is not None:
+    ENCODERS["zstd"] = _ZstdEncoder
+
+COMPRESSIBLE_TYPES = frozenset(
+    {
+        "application/json",
+        "application/x-ndjson",
+        "application/javascript",
+        "application/xml",
+        "image/svg+xml",
+    }
+)
+
+
+def negotiate_encoding(accept_encoding: str, preferred: Iterable[str]) -> Optional[str]:
+    """Pick the first of the `preferred` encodings accepted by the client.
+
+    Encodings with `q=0` are refused, `*` accepts every encoding not listed explicitly.
+    """
+    accepted: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if name:
+            accepted[name.strip().lower()] = quality
+
+    for encoding in preferred:
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+class CompressionMiddleware:
+    """Pure ASGI middleware compressing responses with the encoding negotiated from `Accept-Encoding`.
+
+    Responses sent in a single body message are compressed when they reach `minimum_size`.
+    Streamed responses are compressed chunk by chunk and flushed after every chunk, so each
+    event reaches the client without waiting for more data. Server-sent events are only
+    compressed when the request opts in with the `X-Stream-Compression: true` header, as
+    proxies and browsers may hold back compressed event streams.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, encodings: Iterable[str] = ("zstd", "br", "gzip")):
+        """Initialize the middleware.
+
+        Args:
+            app: The ASGI application
+            minimum_size: Minimum body size in bytes of a non-streamed response to compress
+            encodings: Encodings in order of preference, those whose library is not installed are skipped
+
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encodings = [encoding for encoding in encodings if encoding in ENCODERS]
+        unavailable = [encoding for encoding in encodings if encoding not in ENCODERS]
+        if unavailable:
+            logger.warning(f"Response compression encodings not available: {', '.join(unavailable)}")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        encoding = negotiate_encoding(request_headers.get("accept-encoding", ""), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        allow_event_stream = request_headers.get("x-stream-compression", "").lower() in ("1", "true", "yes")
+        start_message: Message | None = None
+        encoder: _Encoder | None = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message, encoder, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if not self._is_compressible(message["status"], headers, allow_event_stream):
+                    passthrough = True
+                    await send(message)
+                else:
+                    start_message = message
+                return
+
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if encoder is None:
+                if not more_body and len(body) < self.minimum_size:
+                    passthrough = True
+                    MutableHeaders(scope=start_message).add_vary_header("Accept-Encoding")
+                    await send(start_message)
+                    await send(message)
+                    return
+
+                encoder = ENCODERS[encoding]()
+                headers = MutableHeaders(scope=start_message)
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                if (etag := headers.get("etag")) and not etag.startswith("W/"):
+                    # The compressed representation is not byte-identical to the original one
+                    headers["ETag"] = f"W/{etag}"
+                if more_body:
+                    del headers["Content-Length"]
+                    await send(start_message)
+                else:
+                    compressed = encoder.compress(body) + encoder.finish()
+                    headers["Content-Length"] = str(len(compressed))
+                    self._observe(encoding, len(body), len(compressed))
+                    await send(start_message)
+                    await send({"type": "http.response.body", "body": compressed})
+                    return
+
+            compressed = (
+                encoder.compress(body, flush=bool(body)) if more_body else encoder.compress(body) + encoder.finish()
+            )
+            self._observe(encoding, len(body), len(compressed))
+            if compressed or not more_body:
+                await send({"type": "http.response.body", "body": compressed, "more_body": more_body})
+
+        await self.app(scope, receive, send_wrapper)
+
+    @staticmethod
+    def _is_compressible(status_code: int, headers: Headers, allow_event_stream: bool) -> bool:
+        if status_code < 200 or status_code in (204, 304) or "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "").partition(";")[0].strip().lower()
+        if content_type == "text/event-stream":
+            return allow_event_stream
+        return content_type.startswith("text/") or content_type in COMPRESSIBLE_TYPES or content_type.endswith("+json")
+
+    @staticmethod
+    def _observe(encoding: str, raw: int, compressed: int) -> None:
+        COMPRESSION_BYTES.inc(raw, encoding=encoding, stage="raw")
+        COMPRESSION_BYTES.inc(compressed, encoding=encoding, stage="compressed")
@@ -1,34 +1,57 @@
-from fastapi import APIRouter, Depends, HTTPException, Request, status
-from fastapi.responses import RedirectResponse, StreamingResponse
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from uuid import uuid4
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import PlainTextResponse, RedirectResponse, StreamingResponse
 from langchain_core.messages import AnyMessage, RemoveMessage
 from langchain_core.runnables import RunnableConfig
+from starlette.background import BackgroundTask
 
 from langgraph_agent_toolkit import __version__
 from langgraph_agent_toolkit.agents.agent import Agent
-from langgraph_agent_toolkit.helper.constants import get_default_agent
+from langgraph_agent_toolkit.core.queue.types import RunRecord
+from langgraph_agent_toolkit.helper.constants import DEFAULT_BATCH_MAX_CONCURRENCY, get_default_agent
+from langgraph_agent_toolkit.helper.metrics import metrics as metrics_registry
 from langgraph_agent_toolkit.helper.utils import langchain_to_chat_message
 from langgraph_agent_toolkit.schema import (
     AddMessagesInput,
     AddMessagesResponse,
+    BatchInput,
+    BatchItemResult,
+    BatchResponse,
     ChatHistory,
     ChatHistoryInput,
     ChatMessage,
     ClearHistoryInput,
     ClearHistoryResponse,
+    DeleteThreadsInput,
+    DeleteThreadsResponse,
     Feedback,
     FeedbackResponse,
     HealthCheck,
+    RunResponse,
     ServiceMetadata,
     StreamInput,
     UserInput,
 )
+from langgraph_agent_toolkit.service import history_import
+from langgraph_agent_toolkit.service.history_import import NDJSONStreamingResponse
 from langgraph_agent_toolkit.service.utils import (
+    IdempotencyKey,
     _sse_response_example,
     _validate_thread_or_user_id,
+    admit_run,
+    ensure_run_workers,
     get_agent,
     get_agent_executor,
     get_all_agent_info,
+    get_run_queue,
     message_generator,
+    paginate_messages,
+    read_thread_messages,
+    run_idempotent,
+    verify_metrics_access,
 )
 
 
@@ -65,33 +88,187 @@ async def info(request: Request) -> ServiceMetadata:
     summary="Invoke an agent to get a response",
     description="Invoke an agent with user input to retrieve a final response.",
 )
-async def invoke(user_input: UserInput, agent_id: str = None, request: Request = None) -> ChatMessage:
+async def invoke(
+    user_input: UserInput,
+    agent_id: str = None,
+    request: Request = None,
+    response: Response = None,
+    idempotency_key: IdempotencyKey = None,
+) -> ChatMessage:
     """Invoke an agent with user input to retrieve a final response.
 
     If agent_id is not provided, the default agent will be used.
     Use thread_id to persist and continue a multi-turn conversation. run_id kwarg
-    is also attached to messages for recording feedback.
+    is also attached to messages for recording feedback. Retries sent with the same
+    `Idempotency-Key` header get the response of the first request instead of running again.
     """
     executor = get_agent_executor(request)
 
     if agent_id is None:
         agent_id = get_default_agent()
 
-    try:
-        return await executor.invoke(
+    async def run() -> ChatMessage:
+        ticket = await admit_run(request, agent_id)
+        try:
+            return await executor.invoke(
+                agent_id=agent_id,
+                input=user_input.input,
+                thread_id=user_input.thread_id,
+                user_id=user_input.user_id,
+                model_name=user_input.model_name,
+                model_provider=user_input.model_provider,
+                model_config_key=user_input.model_config_key,
+                agent_config=user_input.agent_config,
+                recursion_limit=user_input.recursion_limit,
+                resume=user_input.resume,
+            )
+        except Exception:
+            # Let the global exception handler deal with all exceptions
+            raise
+        finally:
+            ticket.release()
+
+    return await run_idempotent(request, response, idempotency_key, f"invoke:{agent_id}", user_input, run)
+
+
+@private_router.post(
+    "/{agent_id}/batch",
+    status_code=status.HTTP_200_OK,
+    tags=["agent"],
+    summary="Invoke a specific agent with a batch of inputs",
+    description="Invoke a specified agent with many independent user inputs and return the results in order.",
+)
+@private_router.post(
+    "/batch",
+    status_code=status.HTTP_200_OK,
+    tags=["agent"],
+    summary="Invoke an agent with a batch of inputs",
+    description="Invoke an agent with many independent user inputs and return the results in order.",
+)
+async def batch(
+    batch_input: BatchInput,
+    agent_id: str | None = None,
+    request: Request = None,
+    response: Response = None,
+    idempotency_key: IdempotencyKey = None,
+) -> BatchResponse:
+    """Invoke an agent with a batch of independent user inputs.
+
+    If agent_id is not provided, the default agent will be used.
+    Inputs run concurrently, bounded by `max_concurrency`, and every input is admitted like a
+    single run. A failing or rejected input is reported in its own result and does not fail
+    the whole batch. Retries sent with the same
+    `Idempotency-Key` header get the response of the first request instead of running again.
+    """
+    executor = get_agent_executor(request)
+
+    if agent_id is None:
+        agent_id = get_default_agent()
+
+    # Fail fast for unknown agents instead of reporting the same error for every input
+    await get_agent(request, agent_id)
+
+    @asynccontextmanager
+    async def admit_item() -> AsyncIterator[None]:
+        ticket = await admit_run(request, agent_id)
+        try:
+            yield
+        finally:
+            ticket.release()
+
+    async def run() -> BatchResponse:
+        outputs = await executor.batch(
             agent_id=agent_id,
-            input=user_input.input,
-            thread_id=user_input.thread_id,
-            user_id=user_input.user_id,
-            model_name=user_input.model_name,
-            model_provider=user_input.model_provider,
-            model_config_key=user_input.model_config_key,
-            agent_config=user_input.agent_config,
-            recursion_limit=user_input.recursion_limit,
+            inputs=[
+                dict(
+                    input=user_input.input,
+                    thread_id=user_input.thread_id,
+                    user_id=user_input.user_id,
+                    model_name=user_input.model_name,
+                    model_provider=user_input.model_provider,
+                    model_config_key=user_input.model_config_key,
+                    agent_config=user_input.agent_config,
+                    recursion_limit=user_input.recursion_limit,
+                    resume=user_input.resume,
+                )
+                for user_input in batch_input.inputs
+            ],
+            max_concurrency=batch_input.max_concurrency,
+            admit=admit_item,
         )
-    except Exception:
-        # Let the global exception handler deal with all exceptions
-        raise
+
+        results = [
+            BatchItemResult(index=i, status="error", error=f"{type(output).__name__}: {output}")
+            if isinstance(output, Exception)
+            else BatchItemResult(index=i, status="success", output=output)
+            for i, output in enumerate(outputs)
+        ]
+        failed = sum(result.status == "error" for result in results)
+        return BatchResponse(results=results, succeeded=len(results) - failed, failed=failed)
+
+    return await run_idempotent(request, response, idempotency_key, f"batch:{agent_id}", batch_input, run)
+
+
+def _run_response(record: RunRecord) -> RunResponse:
+    return RunResponse(
+        run_id=record.run_id,
+        agent_id=record.agent_id,
+        status=record.status.value,
+        output=ChatMessage.model_validate(record.output) if record.output else None,
+        error=record.error,
+        created_at=record.created_at,
+        started_at=record.started_at,
+        finished_at=record.finished_at,
+    )
+
+
+@private_router.post(
+    "/{agent_id}/runs",
+    status_code=status.HTTP_202_ACCEPTED,
+    tags=["runs"],
+    summary="Submit a run of a specific agent",
+    description="Queue a run of a specified agent for background execution and return its ID immediately.",
+)
+@private_router.post(
+    "/runs",
+    status_code=status.HTTP_202_ACCEPTED,
+    tags=["runs"],
+    summary="Submit a run",
+    description="Queue a run of an agent for background execution and return its ID immediately.",
+)
+async def create_run(user_input: UserInput, agent_id: str | None = None, request: Request = None) -> RunResponse:
+    """Queue a run for background execution.
+
+    If agent_id is not provided, the default agent will be used.
+    Poll `GET /runs/{run_id}` for the status and the result of the run. Runs are admitted
+    by the same concurrency limits as `/invoke` once a worker picks them up.
+    """
+    if agent_id is None:
+        agent_id = get_default_agent()
+
+    # Without workers a queued run would stay pending forever
+    ensure_run_workers(request)
+    # Reject unknown agents before the run is queued
+    await get_agent(request, agent_id)
+
+    record = RunRecord(run_id=str(uuid4()), agent_id=agent_id, input=user_input.model_dump())
+    await get_run_queue(request).enqueue(record)
+    return _run_response(record)
+
+
+@private_router.get(
+    "/runs/{run_id}",
+    status_code=status.HTTP_200_OK,
+    tags=["runs"],
+    summary="Get a run",
+    description="Get the status and, once finished, the result of a submitted run.",
+)
+async def get_run(run_id: str, request: Request = None) -> RunResponse:
+    """Get the status and result of a submitted run."""
+    record = await get_run_queue(request).get(run_id)
+    if record is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Run '{run_id}' not found")
+    return _run_response(record)
 
 
 @private_router.post(
@@ -124,9 +301,13 @@ async def stream(user_input: StreamInput, agent_id: str | None = None, request:
     if agent_id is None:
         agent_id = get_default_agent()
 
+    # Admit before the response starts, so rejected runs get a 429 instead of an error event.
+    # The ticket is also released as a background task in case the stream never starts.
+    ticket = await admit_run(request, agent_id)
     return StreamingResponse(
-        message_generator(user_input, request, agent_id),
+        message_generator(user_input, request, agent_id, admission_ticket=ticket),
         media_type="text/event-stream",
+        background=BackgroundTask(ticket.release),
     )
 
 
@@ -153,7 +334,7 @@ async def feedback(feedback: Feedback, agent_id: str | None = None, request: Req
         if agent_id is None:
             agent_id = get_default_agent()
 
-        agent = get_agent(request, agent_id)
+        agent = await get_agent(request, agent_id)
         agent.observability.record_feedback(
             run_id=feedback.run_id,
             key=feedback.key,
@@ -191,26 +372,46 @@ async def history(
     input: ChatHistoryInput = Depends(),
     agent_id: str | None = None,
     request: Request = None,
+    response: Response = None,
 ) -> ChatHistory:
-    """Get chat history."""
+    """Get chat history.
+
+    Use `limit` with the `before`/`after` message ID cursors to page through long threads.
+    The response carries an ETag of the latest checkpoint, so a request with a matching
+    `If-None-Match` header is answered with 304 while the thread is unchanged.
+    """
     _validate_thread_or_user_id(input.thread_id, input.user_id)
 
     if agent_id is None:
         agent_id = get_default_agent()
 
-    agent: Agent = get_agent(request, agent_id)
+    agent: Agent = await get_agent(request, agent_id)
     try:
-        state_snapshot = await agent.graph.aget_state(
+        checkpoint_id, messages = await read_thread_messages(
+            agent,
             config=RunnableConfig(
                 configurable={
                     "thread_id": input.thread_id,
                     "user_id": input.user_id,
                 }
-            )
+            ),
         )
-        messages: list[AnyMessage] = state_snapshot.values["messages"]
-        chat_messages: list[ChatMessage] = [langchain_to_chat_message(m) for m in messages]
-        return ChatHistory(messages=chat_messages)
+        if checkpoint_id is not None:
+            etag = f'"{checkpoint_id}"'
+            if_none_match = {
+                tag.strip().removeprefix("W/") for tag in request.headers.get("if-none-match", "").split(",")
+            }
+            if etag in if_none_match or "*" in if_none_match:
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+            response.headers["ETag"] = etag
+
+        page, has_more = paginate_messages(messages, limit=input.limit, before=input.before, after=input.after)
+        chat_messages: list[ChatMessage] = []
+        for m in page:
+            chat_message = langchain_to_chat_message(m)
+            chat_message.id = m.id
+            chat_messages.append(chat_message)
+        return ChatHistory(messages=chat_messages, has_more=has_more)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception:
@@ -237,13 +438,36 @@ async def clear_history(
     agent_id: str | None = None,
     request: Request = None,
 ) -> ClearHistoryResponse:
-    """Clear chat history."""
+    """Clear chat history.
+
+    With `delete_thread`, all checkpoints of the thread are deleted in a single operation
+    of the checkpoint saver. Otherwise the messages are removed in a new checkpoint.
+    """
     _validate_thread_or_user_id(input.thread_id, input.user_id)
 
     if agent_id is None:
         agent_id = get_default_agent()
 
-    agent: Agent = get_agent(request, agent_id)
+    executor = get_agent_executor(request)
+    if input.delete_thread:
+        if input.thread_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="thread_id must be provided to delete a thread.",
+            )
+        await get_agent(request, agent_id)
+        try:
+            await executor.delete_threads(agent_id, [input.thread_id])
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        return ClearHistoryResponse(
+            status="success",
+            thread_id=input.thread_id,
+            user_id=input.user_id,
+            message=f"Deleted thread {input.thread_id}.",
+        )
+
+    agent: Agent = await get_agent(request, agent_id)
     try:
         state_snapshot = await agent.graph.aget_state(
             config=RunnableConfig(
@@ -274,6 +498,97 @@ async def clear_history(
     except Exception:
         # Let the global exception handler deal with all exceptions
         raise
+    finally:
+        # The cached interrupt flag no longer matches the updated state
+        if input.thread_id:
+            executor.interrupt_index.invalidate(agent_id, input.thread_id)
+
+
+@private_router.post(
+    "/history/import",
+    status_code=status.HTTP_200_OK,
+    response_class=NDJSONStreamingResponse,
+    tags=["chat"],
+    summary="Import chat histories",
+    description="Import conversations of many threads from an NDJSON stream of {thread_id, messages} records.",
+)
+@private_router.post(
+    "/{agent_id}/history/import",
+    status_code=status.HTTP_200_OK,
+    response_class=NDJSONStreamingResponse,
+    tags=["chat"],
+    summary="Import chat histories for a specific agent",
+    description=(
+        "Import conversations of many threads from an NDJSON stream of {thread_id, messages} records "
+        "with a specific agent."
+    ),
+)
+async def import_history(
+    agent_id: str | None = None,
+    max_concurrency: int | None = Query(
+        default=None,
+        ge=1,
+        description=f"Maximum number of records written at the same time. Capped at {DEFAULT_BATCH_MAX_CONCURRENCY}.",
+    ),
+    request: Request = None,
+) -> NDJSONStreamingResponse:
+    """Import conversations from an NDJSON request body, one `HistoryImportRecord` per line.
+
+    The body is parsed while it is received and the records are appended to their threads
+    with bounded concurrency. The response streams a `HistoryImportEvent` per line: an error
+    event for every failed record, periodic progress events and a final summary.
+    """
+    if agent_id is None:
+        agent_id = get_default_agent()
+
+    executor = get_agent_executor(request)
+    agent: Agent = await get_agent(request, agent_id)
+    limit = min(max_concurrency or DEFAULT_BATCH_MAX_CONCURRENCY, DEFAULT_BATCH_MAX_CONCURRENCY)
+
+    async def events():
+        async for event in history_import.import_history(
+            agent,
+            history_import.iter_ndjson_lines(request.stream()),
+            max_concurrency=limit,
+            on_thread_updated=lambda thread_id: executor.interrupt_index.invalidate(agent_id, thread_id),
+        ):
+            yield event.model_dump_json(exclude_none=True).encode("utf-8") + b"\n"
+
+    return NDJSONStreamingResponse(events())
+
+
+@private_router.delete(
+    "/threads",
+    status_code=status.HTTP_200_OK,
+    tags=["chat"],
+    summary="Delete threads",
+    description="Delete many threads with all their checkpoints.",
+)
+@private_router.delete(
+    "/{agent_id}/threads",
+    status_code=status.HTTP_200_OK,
+    tags=["chat"],
+    summary="Delete threads of a specific agent",
+    description="Delete many threads with all their checkpoints from the checkpoint saver of a specific agent.",
+)
+async def delete_threads(
+    input: DeleteThreadsInput,
+    agent_id: str | None = None,
+    request: Request = None,
+) -> DeleteThreadsResponse:
+    """Delete threads with all their checkpoints, one saver operation per thread."""
+    executor = get_agent_executor(request)
+
+    if agent_id is None:
+        agent_id = get_default_agent()
+
+    await get_agent(request, agent_id)
+    try:
+        deleted = await executor.delete_threads(agent_id, input.thread_ids)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return DeleteThreadsResponse(status="success", deleted=deleted, message=f"Deleted {deleted} threads.")
 
 
 @private_router.post(
@@ -301,7 +616,8 @@ async def add_messages(
     if agent_id is None:
         agent_id = get_default_agent()
 
-    agent: Agent = get_agent(request, agent_id)
+    executor = get_agent_executor(request)
+    agent: Agent = await get_agent(request, agent_id)
     try:
         await agent.graph.aupdate_state(
             config=RunnableConfig(
@@ -322,6 +638,10 @@ async def add_messages(
     except Exception:
         # Let the global exception handler deal with all exceptions
         raise
+    finally:
+        # The cached interrupt flag no longer matches the updated state
+        if input.thread_id:
+            executor.interrupt_index.invalidate(agent_id, input.thread_id)
 
 
 @public_router.get(
@@ -348,3 +668,16 @@ async def health_check() -> HealthCheck:
         content="healthy",
         version=__version__,
     )
+
+
+@public_router.get(
+    "/metrics",
+    tags=["healthcheck"],
+    summary="Metrics",
+    description="Request and per-stage latency histograms in the Prometheus text format.",
+    response_class=PlainTextResponse,
+    dependencies=[Depends(verify_metrics_access)],
+)
+async def metrics() -> PlainTextResponse:
+    """Prometheus metrics endpoint."""
+    return PlainTextResponse(metrics_registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -0,0 +1,277 @@
+import asyncio
+import json
+import math
+import time
+from collections import deque
+from typing import Any, AsyncGenerator, AsyncIterator, Awaitable, Callable, List, Optional
+
+from langgraph_agent_toolkit.helper.metrics import metrics, record_stage
+from langgraph_agent_toolkit.helper.types import StreamBufferPolicy
+from langgraph_agent_toolkit.schema import ChatMessage
+
+
+try:
+    import orjson
+
+    def _dumps(value: Any) -> bytes:
+        return orjson.dumps(value)
+
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+
+    def _dumps(value: Any) -> bytes:
+        return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+SSE_DONE = b"data: [DONE]\n\n"
+
+_TOKEN_PREFIX = b'data: {"type":"token","content":'
+_MESSAGE_PREFIX = b'data: {"type":"message","content":'
+_ERROR_PREFIX = b'data: {"type":"error","content":'
+_SUFFIX = b"}\n\n"
+
+# Sentinel marking the end of the source stream in the stream buffer
+_END = object()
+
+BUFFER_MAX_DEPTH = metrics.histogram(
+    "sse_buffer_max_depth",
+    "Highest number of events waiting in the buffer of a stream.",
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024),
+)
+BUFFER_OVERFLOW = metrics.counter(
+    "sse_buffer_overflow_total",
+    "Events arriving at a full stream buffer, by the action taken.",
+    ("action",),
+)
+
+
+def encode_token(token: str) -> bytes:
+    """Encode a token chunk as an SSE frame."""
+    return _TOKEN_PREFIX + _dumps(token) + _SUFFIX
+
+
+def encode_message(message: ChatMessage) -> bytes:
+    """Encode a complete message as an SSE frame, serialized directly by pydantic."""
+    return _MESSAGE_PREFIX + message.model_dump_json().encode("utf-8") + _SUFFIX
+
+
+def encode_error(error: str) -> bytes:
+    """Encode an error as an SSE frame."""
+    return _ERROR_PREFIX + _dumps(error) + _SUFFIX
+
+
+def encode_event(event: str | ChatMessage) -> bytes:
+    """Encode a stream event of `AgentExecutor.stream` as an SSE frame."""
+    if isinstance(event, str):
+        return encode_token(event)
+    if isinstance(event, ChatMessage):
+        return encode_message(event)
+    return b""
+
+
+class StreamBuffer:
+    """Buffer of stream events between the agent and a slow client.
+
+    The buffer holds at most `max_size` events, 0 means unbounded. When it is full, the policy
+    decides: `block` pauses the agent until the client catches up, `merge_tokens` appends a token
+    to a buffered token right before it, and `drop_tokens` drops new tokens and evicts buffered
+    ones to make room for messages, which carry the complete content anyway. Whenever an event
+    cannot be merged or dropped, the agent is paused. The end of the stream and errors are
+    always accepted. It supports a single producer and a single consumer.
+    """
+
+    def __init__(self, max_size: int = 0, policy: StreamBufferPolicy = StreamBufferPolicy.BLOCK):
+        self.max_size = max_size
+        self.policy = StreamBufferPolicy(policy)
+        self.max_depth = 0
+        self._items: deque = deque()
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _full(self) -> bool:
+        return 0 < self.max_size <= len(self._items)
+
+    def _append(self, item: Any) -> None:
+        self._items.append(item)
+        self.max_depth = max(self.max_depth, len(self._items))
+        self._not_empty.set()
+
+    def _overflow(self, event: str | ChatMessage) -> bool:
+        """Try to accept an event without growing the full buffer."""
+        if self.policy == StreamBufferPolicy.MERGE_TOKENS:
+            if isinstance(event, str) and isinstance(self._items[-1], str):
+                self._items[-1] += event
+                BUFFER_OVERFLOW.inc(action="merged")
+                return True
+        elif self.policy == StreamBufferPolicy.DROP_TOKENS:
+            if isinstance(event, str):
+                BUFFER_OVERFLOW.inc(action="dropped")
+                return True
+            kept = deque(item for item in self._items if not isinstance(item, str))
+            if len(kept) < len(self._items):
+                BUFFER_OVERFLOW.inc(len(self._items) - len(kept), action="dropped")
+                self._items = kept
+                self._append(event)
+                return True
+        return False
+
+    async def put(self, event: str | ChatMessage) -> None:
+        """Add an event, waiting for free space if the policy cannot handle a full buffer."""
+        blocked = False
+        while self._full():
+            if self._overflow(event):
+                return
+            if not blocked:
+                blocked = True
+                BUFFER_OVERFLOW.inc(action="blocked")
+            self._not_full.clear()
+            await self._not_full.wait()
+        self._append(event)
+
+    def put_final(self, item: Any) -> None:
+        """Add the end of the stream or an error, regardless of the size limit."""
+        self._append(item)
+
+    async def get(self) -> Any:
+        """Remove and return the oldest event, waiting for one if the buffer is empty."""
+        while not self._items:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        item = self._items.popleft()
+        self._not_full.set()
+        return item
+
+
+async def encode_stream(
+    events: AsyncIterator[str | ChatMessage],
+    coalesce_ms: int = 0,
+    coalesce_bytes: int = 0,
+    is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None,
+    disconnect_check_interval: float = 0.5,
+    buffer_size: int = 0,
+    buffer_policy: StreamBufferPolicy = StreamBufferPolicy.BLOCK,
+) -> AsyncGenerator[bytes, None]:
+    """Encode stream events as SSE frames, optionally coalescing tokens.
+
+    Without a coalescing window every event becomes its own chunk. With a window, consecutive
+    tokens are merged into a single token frame that is flushed when the window elapses, when the
+    buffered tokens reach `coalesce_bytes`, or right before the next message. A message is sent in
+    the same chunk as the tokens preceding it, so each flush results in a single ASGI send.
+
+    When `is_disconnected` is given, it is polled every `disconnect_check_interval` seconds, also
+    while the source is idle, e.g. during a long tool call. Once it returns True the source is
+    cancelled and the stream ends without further chunks. The source is also cancelled whenever
+    the stream is closed early.
+
+    In these cases the source runs ahead of the client, with events held in a `StreamBuffer`
+    of `buffer_size` events and `buffer_policy`. A non-blocking policy also lets the source run
+    ahead on its own. Otherwise the source is only advanced when the client reads.
+
+    Args:
+        events: Tokens and messages produced by `AgentExecutor.stream`
+        coalesce_ms: Maximum time in milliseconds a token is held back. 0 disables coalescing.
+        coalesce_bytes: Flush buffered tokens once they reach this size. 0 disables the limit.
+        is_disconnected: Optional check whether the client has gone away
+        disconnect_check_interval: Seconds between two disconnection checks
+        buffer_size: Maximum number of events held for a slow client. 0 means unbounded.
+        buffer_policy: Policy of a full buffer, see `StreamBuffer`
+
+    Yields:
+        Encoded SSE chunks
+
+    """
+    encode_seconds = 0.0
+
+    def encode(event: str | ChatMessage) -> bytes:
+        nonlocal encode_seconds
+        started_at = time.perf_counter()
+        chunk = encode_event(event)
+        encode_seconds += time.perf_counter() - started_at
+        return chunk
+
+    if coalesce_ms <= 0 and is_disconnected is None and buffer_policy == StreamBufferPolicy.BLOCK:
+        try:
+            async for event in events:
+                yield encode(event)
+        finally:
+            record_stage("sse_encode", encode_seconds)
+        return
+
+    # The source runs in a single producer task, so context variables set inside it
+    # (e.g. by tracing context managers) stay consistent across iterations, and it can
+    # be cancelled while the consumer waits.
+    buffer = StreamBuffer(buffer_size, buffer_policy)
+
+    async def produce() -> None:
+        try:
+            async for event in events:
+                await buffer.put(event)
+        except BaseException as e:
+            buffer.put_final(e)
+            raise
+        finally:
+            buffer.put_final(_END)
+
+    loop = asyncio.get_running_loop()
+    producer = asyncio.create_task(produce())
+    window = coalesce_ms / 1000
+    tokens: List[str] = []
+    size = 0
+    deadline = math.inf
+    next_check = loop.time() + disconnect_check_interval if is_disconnected is not None else math.inf
+
+    def flush() -> bytes:
+        nonlocal size, deadline
+        chunk = encode("".join(tokens))
+        tokens.clear()
+        size = 0
+        deadline = math.inf
+        return chunk
+
+    try:
+        while True:
+            now = loop.time()
+            if now >= next_check:
+                if await is_disconnected():
+                    return
+                next_check = now + disconnect_check_interval
+            if tokens and now >= deadline:
+                yield flush()
+                continue
+
+            wake_at = min(deadline, next_check)
+            try:
+                if math.isinf(wake_at):
+                    event = await buffer.get()
+                else:
+                    event = await asyncio.wait_for(buffer.get(), timeout=max(wake_at - now, 0))
+            except asyncio.TimeoutError:
+                continue
+
+            if event is _END:
+                break
+            if isinstance(event, BaseException):
+                if tokens:
+                    yield flush()
+                raise event
+
+            if isinstance(event, str) and window > 0:
+                if not tokens:
+                    deadline = loop.time() + window
+                tokens.append(event)
+                size += len(event)
+                if coalesce_bytes > 0 and size >= coalesce_bytes:
+                    yield flush()
+            else:
+                yield (flush() if tokens else b"") + encode(event)
+
+        if tokens:
+            yield flush()
+    finally:
+        record_stage("sse_encode", encode_seconds)
+        BUFFER_MAX_DEPTH.observe(buffer.max_depth)
+        if not producer.done():
+            producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
@@ -1,19 +1,45 @@
-import json
 import logging
 import secrets
 import traceback
 import warnings
-from typing import Annotated, Any, AsyncGenerator, Optional
+from typing import Annotated, Any, AsyncGenerator, Awaitable, Callable, List, Optional, Tuple
 
-from fastapi import Depends, HTTPException, Request, status
+from fastapi import Depends, Header, HTTPException, Request, Response, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from langchain_core._api import LangChainBetaWarning
+from langchain_core.messages import AnyMessage
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from pydantic import BaseModel
 
 from langgraph_agent_toolkit.agents.agent import Agent
 from langgraph_agent_toolkit.agents.agent_executor import AgentExecutor
 from langgraph_agent_toolkit.core import settings
+from langgraph_agent_toolkit.core.queue.base import BaseRunQueue
+from langgraph_agent_toolkit.core.queue.worker import RunWorkerPool
 from langgraph_agent_toolkit.helper.logging import InterceptHandler, logger
-from langgraph_agent_toolkit.schema import ChatMessage, StreamInput
+from langgraph_agent_toolkit.helper.metrics import metrics
+from langgraph_agent_toolkit.schema import StreamInput
+from langgraph_agent_toolkit.service.admission import AdmissionController, AdmissionTicket
+from langgraph_agent_toolkit.service.idempotency import IdempotencyManager, fingerprint
+from langgraph_agent_toolkit.service.sse import SSE_DONE, encode_error, encode_stream
+
+
+IdempotencyKey = Annotated[
+    str | None,
+    Header(
+        alias="Idempotency-Key",
+        min_length=1,
+        max_length=255,
+        description="Key identifying retries of the same request, which then run only once",
+    ),
+]
+
+STREAMS_CANCELLED = metrics.counter(
+    "sse_streams_cancelled_total",
+    "Agent streams cancelled because the client disconnected.",
+    ("agent",),
+)
 
 
 def verify_bearer(
@@ -30,6 +56,19 @@ def verify_bearer(
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
 
 
+def verify_metrics_access(
+    http_auth: Annotated[
+        HTTPAuthorizationCredentials | None,
+        Depends(HTTPBearer(description="Please provide AUTH_SECRET api key.", auto_error=False)),
+    ],
+) -> None:
+    """Require the bearer token on `/metrics` unless `METRICS_PUBLIC` is set."""
+    if settings.METRICS_PUBLIC:
+        return
+
+    verify_bearer(http_auth)
+
+
 def get_agent_executor(request: Request) -> AgentExecutor:
     """Get the AgentExecutor instance that was initialized in lifespan."""
     app = request.app
@@ -41,11 +80,83 @@ def get_agent_executor(request: Request) -> AgentExecutor:
     return app.state.agent_executor
 
 
-def get_agent(request: Request, agent_id: str) -> Agent:
-    """Get an agent by its ID from the initialized AgentExecutor."""
+def get_run_queue(request: Request) -> BaseRunQueue:
+    """Get the run queue that was initialized in lifespan."""
+    app = request.app
+    if not hasattr(app.state, "run_queue"):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Run queue not initialized. Service might be starting up.",
+        )
+    return app.state.run_queue
+
+
+def ensure_run_workers(request: Request) -> None:
+    """Check that run workers are running in this process, so queued runs are executed.
+
+    Raises:
+        HTTPException: If no run workers are running
+
+    """
+    worker_pool: RunWorkerPool | None = getattr(request.app.state, "run_worker_pool", None)
+    if worker_pool is None or not worker_pool.running:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="No run workers are running. Background runs are disabled or the service is starting up.",
+        )
+
+
+async def admit_run(request: Request, agent_id: str) -> AdmissionTicket:
+    """Admit an agent run through the admission controller initialized in `create_app`.
+
+    Raises:
+        RateLimitError: If the run exceeds the concurrency limits
+
+    """
+    controller: AdmissionController | None = getattr(request.app.state, "admission_controller", None)
+    if controller is None:
+        return AdmissionTicket([])
+    if controller.limits_agents:
+        # Only known agents get a limiter of their own
+        await get_agent(request, agent_id)
+    return await controller.acquire(agent_id)
+
+
+async def run_idempotent(
+    request: Request,
+    response: Response,
+    idempotency_key: str | None,
+    scope: str,
+    payload: BaseModel,
+    call: Callable[[], Awaitable[Any]],
+) -> Any:
+    """Run a request once per idempotency key with the manager initialized in `create_app`.
+
+    Requests without a key always run. Replayed responses are marked with an
+    `Idempotent-Replayed: true` header.
+
+    Raises:
+        HTTPException: If the key was used with a different request
+
+    """
+    manager: IdempotencyManager | None = getattr(request.app.state, "idempotency", None)
+    if idempotency_key is None or manager is None:
+        return await call()
+
+    result, replayed = await manager.run(f"{scope}:{idempotency_key}", fingerprint(payload.model_dump_json()), call)
+    if replayed:
+        response.headers["Idempotent-Replayed"] = "true"
+    return result
+
+
+async def get_agent(request: Request, agent_id: str) -> Agent:
+    """Get an agent by its ID from the initialized AgentExecutor.
+
+    Lazily registered agents are imported in a worker thread, keeping the event loop free.
+    """
     executor = get_agent_executor(request)
     try:
-        return executor.get_agent(agent_id)
+        return await executor.aget_agent(agent_id)
     except KeyError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -59,6 +170,61 @@ def get_all_agent_info(request: Request):
     return executor.get_all_agent_info()
 
 
+async def read_thread_messages(agent: Agent, config: RunnableConfig) -> Tuple[Optional[str], List[AnyMessage]]:
+    """Read the messages of the latest checkpoint of a thread and the ID of that checkpoint.
+
+    The checkpoint is read directly from the saver, which skips computing the next tasks,
+    interrupts and subgraph states of a full `aget_state`.
+    """
+    checkpointer = getattr(agent.graph, "checkpointer", None)
+    if isinstance(checkpointer, BaseCheckpointSaver):
+        checkpoint_tuple = await checkpointer.aget_tuple(config)
+        if checkpoint_tuple is None:
+            return None, []
+        checkpoint = checkpoint_tuple.checkpoint
+        return checkpoint["id"], checkpoint["channel_values"].get("messages", [])
+
+    # Graphs without an attached saver (e.g. inherited checkpointers) need the full state lookup
+    state_snapshot = await agent.graph.aget_state(config=config)
+    state_config = getattr(state_snapshot, "config", None) or {}
+    return state_config.get("configurable", {}).get("checkpoint_id"), state_snapshot.values.get("messages", [])
+
+
+def paginate_messages(
+    messages: List[AnyMessage],
+    limit: Optional[int] = None,
+    before: Optional[str] = None,
+    after: Optional[str] = None,
+) -> Tuple[List[AnyMessage], bool]:
+    """Select a page of messages between the `after` and `before` message IDs.
+
+    With `after`, the page starts right after that message, otherwise it ends right before
+    `before` or at the latest message. Returns the page and whether more messages lie beyond
+    it in the paging direction.
+
+    Raises:
+        HTTPException: If a cursor is not a message of the thread
+
+    """
+
+    def position(message_id: str) -> int:
+        for index, message in enumerate(messages):
+            if message.id == message_id:
+                return index
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Message '{message_id}' not found in the chat history.",
+        )
+
+    start = position(after) + 1 if after is not None else 0
+    end = position(before) if before is not None else len(messages)
+    if limit is None or end - start <= limit:
+        return messages[start:end], False
+    if after is not None:
+        return messages[start : start + limit], True
+    return messages[end - limit : end], True
+
+
 def _validate_thread_or_user_id(thread_id: Optional[str], user_id: Optional[str]) -> None:
     """Validate that either thread_id or user_id is provided."""
     if thread_id is None and user_id is None:
@@ -72,12 +238,22 @@ async def message_generator(
     stream_input: StreamInput,
     request: Request,
     agent_id: str,
-) -> AsyncGenerator[str, None]:
-    """Generate messages from an agent."""
+    admission_ticket: AdmissionTicket | None = None,
+) -> AsyncGenerator[bytes, None]:
+    """Generate pre-encoded SSE frames from an agent, releasing its admission ticket once done."""
     executor = get_agent_executor(request)
 
+    coalesce_ms = settings.SSE_COALESCE_MS if stream_input.coalesce_ms is None else stream_input.coalesce_ms
+    coalesce_bytes = settings.SSE_COALESCE_BYTES if stream_input.coalesce_bytes is None else stream_input.coalesce_bytes
+    disconnected = False
+
+    async def is_disconnected() -> bool:
+        nonlocal disconnected
+        disconnected = await request.is_disconnected()
+        return disconnected
+
     try:
-        async for message in executor.stream(
+        events = executor.stream(
             agent_id=agent_id,
             input=stream_input.input,
             thread_id=stream_input.thread_id,
@@ -88,20 +264,32 @@ async def message_generator(
             stream_tokens=stream_input.stream_tokens,
             agent_config=stream_input.agent_config,
             recursion_limit=stream_input.recursion_limit,
+            resume=stream_input.resume,
+            stream_profile=stream_input.stream_profile,
+        )
+        async for chunk in encode_stream(
+            events,
+            coalesce_ms=coalesce_ms,
+            coalesce_bytes=coalesce_bytes,
+            is_disconnected=is_disconnected if settings.SSE_DISCONNECT_CHECK_INTERVAL > 0 else None,
+            disconnect_check_interval=settings.SSE_DISCONNECT_CHECK_INTERVAL,
+            buffer_size=settings.SSE_BUFFER_SIZE,
+            buffer_policy=settings.SSE_BUFFER_POLICY,
         ):
-            if isinstance(message, str):
-                # Token output
-                yield f"data: {json.dumps({'type': 'token', 'content': message})}\n\n"
-            elif isinstance(message, ChatMessage):
-                # Complete message
-                yield f"data: {json.dumps({'type': 'message', 'content': message.model_dump()})}\n\n"
+            yield chunk
+        if disconnected:
+            STREAMS_CANCELLED.inc(agent=agent_id)
+            logger.info(f"Client disconnected, cancelled stream of agent '{agent_id}'")
 
     except Exception as e:
         tb_str = traceback.format_exc()
         logger.error(f"Error in message_generator: {e}\n\nFull traceback:\n{tb_str}")
-        yield f"data: {json.dumps({'type': 'error', 'content': f'Internal server error: {e}'})}\n\n"
+        yield encode_error(f"Internal server error: {e}")
     finally:
-        yield "data: [DONE]\n\n"
+        if admission_ticket is not None:
+            admission_ticket.release()
+        if not disconnected:
+            yield SSE_DONE
 
 
 def _sse_response_example() -> dict[int, Any]:
@@ -0,0 +1,100 @@
+import rootutils
+
+
+_ = rootutils.setup_root(
+    search_from=__file__,
+    indicator=".project-root",
+    pythonpath=True,
+    dotenv=False,
+)
+
+import asyncio
+import statistics
+import time
+import tracemalloc
+from typing import Any
+from uuid import uuid4
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import END, START, MessagesState, StateGraph
+
+
+# Compare the previous `AgentExecutor.invoke` behaviour (`stream_mode=["values"]`, which collects a full
+# state snapshot after every super-step) against the final-state-only path (`stream_mode="values"`)
+# on a 30-step tool loop with large tool outputs. No LLM or network access is required.
+
+TOOL_STEPS = 30
+TOOL_OUTPUT_SIZE = 20_000
+RUNS = 5
+
+
+def build_tool_loop_graph():
+    def agent(state: MessagesState) -> dict[str, Any]:
+        step = sum(isinstance(m, ToolMessage) for m in state["messages"])
+        if step >= TOOL_STEPS:
+            return {"messages": [AIMessage(content="Done.")]}
+        return {
+            "messages": [
+                AIMessage(
+                    content="",
+                    tool_calls=[{"name": "search", "args": {"query": f"q{step}"}, "id": f"call_{step}"}],
+                )
+            ]
+        }
+
+    def tools(state: MessagesState) -> dict[str, Any]:
+        call = state["messages"][-1].tool_calls[0]
+        return {"messages": [ToolMessage(content="x" * TOOL_OUTPUT_SIZE, tool_call_id=call["id"])]}
+
+    def route(state: MessagesState) -> str:
+        return "tools" if state["messages"][-1].tool_calls else END
+
+    builder = StateGraph(MessagesState)
+    builder.add_node("agent", agent)
+    builder.add_node("tools", tools)
+    builder.add_edge(START, "agent")
+    builder.add_conditional_edges("agent", route, ["tools", END])
+    builder.add_edge("tools", "agent")
+    return builder.compile(checkpointer=MemorySaver())
+
+
+def _config() -> dict[str, Any]:
+    return {"recursion_limit": 4 * TOOL_STEPS, "configurable": {"thread_id": str(uuid4())}}
+
+
+async def run_all_snapshots(graph) -> Any:
+    events = await graph.ainvoke({"messages": [HumanMessage(content="start")]}, _config(), stream_mode=["values"])
+    return events[-1][1]
+
+
+async def run_final_state(graph) -> Any:
+    return await graph.ainvoke({"messages": [HumanMessage(content="start")]}, _config(), stream_mode="values")
+
+
+async def measure(name: str, func, graph) -> None:
+    latencies, peaks = [], []
+    for _ in range(RUNS):
+        tracemalloc.start()
+        started = time.perf_counter()
+        state = await func(graph)
+        latencies.append(time.perf_counter() - started)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        assert state["messages"][-1].content == "Done."
+
+    print(
+        f"{name:<16} latency median={statistics.median(latencies) * 1000:8.1f} ms | "
+        f"peak memory median={statistics.median(peaks) / 1024 / 1024:7.2f} MiB"
+    )
+
+
+async def main():
+    graph = build_tool_loop_graph()
+    print(f"{TOOL_STEPS}-step tool loop, {TOOL_OUTPUT_SIZE} byte tool outputs, {RUNS} runs each\n")
+    await measure("all snapshots", run_all_snapshots, graph)
+    await measure("final state", run_final_state, graph)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
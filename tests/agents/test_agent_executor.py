@@ -1,16 +1,23 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 from uuid import UUID
 
 import pytest
-from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage, ToolMessage
+from langgraph.checkpoint.memory import MemorySaver
 from langgraph.errors import GraphRecursionError
-from langgraph.types import Command
+from langgraph.func import entrypoint
+from langgraph.types import Command, interrupt
 from pydantic import BaseModel
 
 from langgraph_agent_toolkit.agents.agent import Agent
 from langgraph_agent_toolkit.agents.agent_executor import AgentExecutor
+from langgraph_agent_toolkit.agents.interrupt_index import PendingInterruptIndex
 from langgraph_agent_toolkit.helper.constants import DEFAULT_AGENT
+from langgraph_agent_toolkit.helper.exceptions import AgentConfigurationError
 from langgraph_agent_toolkit.schema import ChatMessage
 
 
@@ -75,7 +82,7 @@ def agent_executor(mock_agent):
 @pytest.mark.asyncio
 async def test_invoke_basic_flow(agent_executor, mock_agent):
     """Test basic invoke flow with successful response."""
-    mock_response = [("values", {"messages": [AIMessage(content="Test response")]})]
+    mock_response = {"messages": [AIMessage(content="Test response")]}
     mock_agent.graph.ainvoke.return_value = mock_response
 
     input_obj = MockInput(message="Hello, agent!")
@@ -95,6 +102,8 @@ async def test_invoke_basic_flow(agent_executor, mock_agent):
     config = call_args["config"]
     assert config["configurable"]["thread_id"] == "test-thread"
     assert config["configurable"]["user_id"] == "test-user"
+    # Only the final state is requested, not a snapshot per super-step
+    assert call_args["stream_mode"] == "values"
 
 
 @pytest.mark.asyncio
@@ -104,11 +113,11 @@ async def test_invoke_with_interrupt_handling(agent_executor, mock_agent):
     interrupt_task.interrupts = [Mock()]
     mock_agent.graph.aget_state.return_value = MockStateSnapshot(values={"messages": []}, tasks=[interrupt_task])
 
-    mock_response = [("updates", {"__interrupt__": [Mock(value="Need more info")]})]
+    mock_response = {"messages": [], "__interrupt__": [Mock(value="Need more info")]}
     mock_agent.graph.ainvoke.return_value = mock_response
 
     user_input = MockInput(message="Continue")
-    result = await agent_executor.invoke(agent_id="test-agent", input=user_input)
+    result = await agent_executor.invoke(agent_id="test-agent", input=user_input, thread_id="test-thread")
 
     assert result.content == "Need more info"
 
@@ -117,6 +126,108 @@ async def test_invoke_with_interrupt_handling(agent_executor, mock_agent):
     assert call_args["input"].resume == user_input.model_dump()
 
 
+@pytest.mark.asyncio
+async def test_invoke_returns_final_state_of_real_graph(agent_executor, mock_agent):
+    """Test invoke against a real graph returns the final message and surfaces interrupts."""
+
+    @entrypoint(checkpointer=MemorySaver())
+    async def graph(inputs: dict, *, previous: dict | None = None):
+        if inputs["messages"][-1].content == "ask":
+            answer = interrupt("What is your name?")
+            return {"messages": [AIMessage(content=f"Hello, {answer['message']}!")]}
+        return {"messages": [AIMessage(content="Done")]}
+
+    mock_agent.graph = graph
+
+    result = await agent_executor.invoke(agent_id="test-agent", input=MockInput(message="hi"), thread_id="t1")
+    assert result.content == "Done"
+
+    result = await agent_executor.invoke(agent_id="test-agent", input=MockInput(message="ask"), thread_id="t2")
+    assert result.content == "What is your name?"
+
+    # Drop the cached flag, so the pending interrupt is read from the checkpoint
+    agent_executor.interrupt_index.clear()
+    result = await agent_executor.invoke(agent_id="test-agent", input=MockInput(message="Bob"), thread_id="t2")
+    assert result.content == "Hello, Bob!"
+    assert agent_executor.interrupt_index.get("test-agent", "t2") is False
+
+
+@pytest.mark.asyncio
+async def test_invoke_skips_interrupt_lookup(agent_executor, mock_agent):
+    """Test the checkpoint is only read for unknown threads without an explicit resume flag."""
+    mock_agent.graph.ainvoke.return_value = {"messages": [AIMessage(content="Test response")]}
+
+    # A freshly generated thread cannot have pending interrupts
+    await agent_executor.invoke(agent_id="test-agent", input=MockInput(message="Hello"))
+    mock_agent.graph.aget_state.assert_not_called()
+
+    # The first request on a known thread reads the checkpoint, follow-ups use the index
+    await agent_executor.invoke(agent_id="test-agent", input=MockInput(message="Hello"), thread_id="test-thread")
+    await agent_executor.invoke(agent_id="test-agent", input=MockInput(message="Hello"), thread_id="test-thread")
+    assert mock_agent.graph.aget_state.await_count == 1
+
+    # An explicit resume flag bypasses the lookup
+    await agent_executor.invoke(
+        agent_id="test-agent", input=MockInput(message="Yes"), thread_id="other-thread", resume=True
+    )
+    assert mock_agent.graph.aget_state.await_count == 1
+    assert isinstance(mock_agent.graph.ainvoke.call_args[1]["input"], Command)
+
+    # Failed runs drop the cached flag
+    mock_agent.graph.ainvoke.side_effect = RuntimeError("boom")
+    with pytest.raises(RuntimeError):
+        await agent_executor.invoke(agent_id="test-agent", input=MockInput(message="Hello"), thread_id="test-thread")
+    assert agent_executor.interrupt_index.get("test-agent", "test-thread") is None
+
+
+def test_pending_interrupt_index_eviction_and_ttl():
+    """Test the pending interrupt index is bounded and entries expire."""
+    index = PendingInterruptIndex(max_size=2, ttl_seconds=60)
+    index.set("agent", "t1", True)
+    index.set("agent", "t2", False)
+    index.set("agent", "t3", True)
+    assert index.get("agent", "t1") is None
+    assert index.get("agent", "t2") is False
+    assert index.get("agent", "t3") is True
+
+    with patch("langgraph_agent_toolkit.agents.interrupt_index.time.monotonic", return_value=10**9):
+        assert index.get("agent", "t3") is None
+
+
+@pytest.mark.asyncio
+async def test_batch_bounded_concurrency_and_per_item_errors(agent_executor, mock_agent):
+    """Test batch keeps the input order, limits concurrency and reports failures per item."""
+    running = 0
+    max_running = 0
+
+    async def fake_ainvoke(input, config, stream_mode):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        message = input["messages"][-1].content
+        if message == "fail":
+            raise ValueError("boom")
+        return {"messages": [AIMessage(content=f"echo {message}")]}
+
+    mock_agent.graph.ainvoke.side_effect = fake_ainvoke
+
+    messages = ["a", "b", "fail", "c", "d"]
+    results = await agent_executor.batch(
+        agent_id="test-agent",
+        inputs=[{"input": MockInput(message=m)} for m in messages],
+        max_concurrency=2,
+    )
+
+    assert max_running == 2
+    assert [r.content for r in results if isinstance(r, ChatMessage)] == ["echo a", "echo b", "echo c", "echo d"]
+    assert isinstance(results[2], ValueError)
+
+    with pytest.raises(KeyError):
+        await agent_executor.batch(agent_id="missing-agent", inputs=[{"input": MockInput(message="a")}])
+
+
 @pytest.mark.asyncio
 async def test_error_handling_with_recursion_error(agent_executor, mock_agent):
     """Test error handling decorator catches GraphRecursionError."""
@@ -157,7 +268,7 @@ async def test_setup_agent_execution_configuration(agent_executor, mock_agent):
 @pytest.mark.asyncio
 async def test_trace_context_integration(agent_executor, mock_agent):
     """Test that trace_context is properly integrated with invoke."""
-    mock_response = [("values", {"messages": [AIMessage(content="Response")]})]
+    mock_response = {"messages": [AIMessage(content="Response")]}
     mock_agent.graph.ainvoke.return_value = mock_response
 
     # Track if trace_context was called by wrapping it
@@ -185,6 +296,91 @@ async def test_trace_context_integration(agent_executor, mock_agent):
     assert trace_context_called
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("stream_profile", "expected_modes", "expected_events"),
+    [
+        (
+            "full",
+            ["updates", "messages", "custom"],
+            ["Hel", "lo", ("ai", "Hello", True), ("tool", "sunny", False), "Done", ("ai", "Done", False)],
+        ),
+        ("tokens_only", ["updates", "messages"], ["Hel", "lo", "Done"]),
+        (
+            "messages_only",
+            ["updates", "custom"],
+            [("ai", "Hello", True), ("tool", "sunny", False), ("ai", "Done", False)],
+        ),
+        (
+            "deltas",
+            ["updates", "messages", "custom"],
+            ["Hel", "lo", ("ai", "", True), ("tool", "sunny", False), "Done"],
+        ),
+    ],
+)
+async def test_stream_profiles(agent_executor, mock_agent, stream_profile, expected_modes, expected_events):
+    """Test stream profiles subscribe to their stream modes and filter the streamed events."""
+    tool_call = {"name": "weather", "args": {}, "id": "call-1"}
+    stream_modes = []
+
+    async def mock_astream(input, config, stream_mode):
+        stream_modes.append(stream_mode)
+        events = [
+            ("messages", (AIMessageChunk(content="Hel", id="m1"), {})),
+            ("messages", (AIMessageChunk(content="lo", id="m1"), {})),
+            ("updates", {"agent": {"messages": [AIMessage(content="Hello", id="m1", tool_calls=[tool_call])]}}),
+            ("updates", {"tools": {"messages": [ToolMessage(content="sunny", tool_call_id="call-1")]}}),
+            ("messages", (AIMessageChunk(content="Done", id="m2"), {})),
+            ("updates", {"agent": {"messages": [AIMessage(content="Done", id="m2")]}}),
+        ]
+        for event in events:
+            # The graph only emits the subscribed modes
+            if event[0] in stream_mode:
+                yield event
+
+    mock_agent.graph.astream = mock_astream
+
+    events = [
+        event if isinstance(event, str) else (event.type, event.content, bool(event.tool_calls))
+        async for event in agent_executor.stream(
+            agent_id="test-agent",
+            input=MockInput(message="Weather?"),
+            thread_id="test-thread",
+            stream_profile=stream_profile,
+        )
+    ]
+
+    assert stream_modes == [expected_modes]
+    assert events == expected_events
+
+
+@pytest.mark.asyncio
+async def test_delete_threads_uses_saver_thread_deletion(agent_executor, mock_agent):
+    """Test threads are deleted with one saver call each and their cached interrupt state is dropped."""
+
+    @entrypoint(checkpointer=MemorySaver())
+    async def echo(message: str) -> str:
+        return message
+
+    mock_agent.graph = echo
+    for thread_id in ["t1", "t2", "t3"]:
+        await echo.ainvoke("hi", {"configurable": {"thread_id": thread_id}})
+    agent_executor.interrupt_index.set("test-agent", "t1", True)
+
+    deleted = await agent_executor.delete_threads("test-agent", ["t1", "t2", "t1"])
+
+    assert deleted == 2
+    assert agent_executor.interrupt_index.get("test-agent", "t1") is None
+    for thread_id, exists in [("t1", False), ("t2", False), ("t3", True)]:
+        checkpoint = await echo.checkpointer.aget_tuple({"configurable": {"thread_id": thread_id}})
+        assert (checkpoint is not None) == exists
+
+    # Graphs without a saver cannot delete threads
+    mock_agent.graph = AsyncMock()
+    with pytest.raises(ValueError, match="no checkpoint saver"):
+        await agent_executor.delete_threads("test-agent", ["t3"])
+
+
 def test_agent_management_operations(mock_agent):
     """Test agent add/get operations."""
     with patch.object(AgentExecutor, "load_agents_from_imports"):
@@ -209,3 +405,65 @@ def test_agent_management_operations(mock_agent):
 
             with pytest.raises(KeyError):
                 executor.get_agent("nonexistent-agent")
+
+
+def _lazy_agent(name: str = "loaded-name") -> Agent:
+    graph = Mock()
+    graph.checkpointer = None
+    return Agent(name=name, description="Lazy agent", graph=graph)
+
+
+def test_lazy_agent_is_imported_on_first_use():
+    """Test lazily registered agents are listed without importing them and imported once under their ID."""
+    import_calls = []
+
+    def import_agent(import_str):
+        import_calls.append(import_str)
+        time.sleep(0.05)
+        return _lazy_agent()
+
+    with (
+        patch.object(AgentExecutor, "_import_agent", side_effect=import_agent),
+        patch.object(AgentExecutor, "_validate_default_agent_loaded"),
+    ):
+        executor = AgentExecutor("lazy-agent=some.module:agent")
+        initialized = []
+        executor.add_agent_initializer(lambda agent: initialized.append(agent.name))
+
+        assert [info.key for info in executor.get_all_agent_info()] == ["lazy-agent"]
+        assert import_calls == []
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            agents = list(pool.map(lambda _: executor.get_agent("lazy-agent"), range(4)))
+
+    assert import_calls == ["some.module:agent"]
+    assert initialized == ["lazy-agent"]
+    assert all(agent is agents[0] for agent in agents)
+    assert agents[0].name == "lazy-agent"
+
+
+def test_lazy_agent_import_failure_raises_configuration_error():
+    """Test a lazily registered agent that cannot be imported raises and can be retried."""
+    with (
+        patch.object(AgentExecutor, "_import_agent", side_effect=ImportError("No module")),
+        patch.object(AgentExecutor, "_validate_default_agent_loaded"),
+    ):
+        executor = AgentExecutor("lazy-agent=missing.module:agent")
+        with pytest.raises(AgentConfigurationError, match="lazy-agent"):
+            executor.get_agent("lazy-agent")
+        assert executor.warmup() == []
+
+    with patch.object(AgentExecutor, "_import_agent", return_value=_lazy_agent()):
+        assert executor.warmup(["lazy-agent", "unknown-agent"]) == ["lazy-agent"]
+
+
+@pytest.mark.asyncio
+async def test_awarmup_loads_lazy_agents():
+    """Test warming up imports the lazily registered agents in worker threads."""
+    with (
+        patch.object(AgentExecutor, "_import_agent", side_effect=lambda s: _lazy_agent(s)),
+        patch.object(AgentExecutor, "_validate_default_agent_loaded"),
+    ):
+        executor = AgentExecutor("first=a.module:agent", "second=b.module:agent")
+        assert sorted(await executor.awarmup()) == ["first", "second"]
+        assert (await executor.aget_agent("second")).name == "second"
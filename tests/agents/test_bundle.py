@@ -0,0 +1,99 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from langgraph_agent_toolkit.agents.agent_executor import AgentExecutor
+from langgraph_agent_toolkit.agents.bundle import (
+    MANIFEST_FILE,
+    apply_settings_snapshot,
+    build_bundle,
+    load_bundle,
+    read_manifest,
+)
+from langgraph_agent_toolkit.core.observability.base import BaseObservabilityPlatform
+from langgraph_agent_toolkit.core.observability.empty import EmptyObservability
+from langgraph_agent_toolkit.core.observability.langfuse import LangfuseObservability
+from langgraph_agent_toolkit.core.settings import settings
+from langgraph_agent_toolkit.helper.constants import get_default_agent, set_default_agent
+
+
+CHATBOT_PATH = "langgraph_agent_toolkit.agents.blueprints.chatbot.agent:chatbot_agent"
+
+
+@pytest.fixture(autouse=True)
+def restore_globals():
+    """Restore the default agent and prompt snapshot changed by loading bundles."""
+    default_agent = get_default_agent()
+    yield
+    set_default_agent(default_agent)
+    BaseObservabilityPlatform.use_prompt_snapshot(None)
+
+
+@pytest.fixture
+def bundle_dir(tmp_path):
+    """Build a bundle with the chatbot agent and a prompt."""
+    source = EmptyObservability(prompts_dir=str(tmp_path / "source"))
+    source.push_prompt("greeting", [{"role": "system", "content": "Be brief."}])
+    build_bundle(
+        tmp_path / "bundle",
+        agent_paths=[f"chat={CHATBOT_PATH}"],
+        prompt_names=["greeting"],
+        observability=source,
+    )
+    return tmp_path / "bundle"
+
+
+def test_build_bundle_writes_manifest_without_secrets(bundle_dir):
+    """Test the manifest records the agents, prompts and non-secret settings."""
+    manifest = read_manifest(bundle_dir)
+
+    assert manifest.agents["chat"].import_path == CHATBOT_PATH
+    assert manifest.agents["chat"].description
+    assert manifest.prompts == ["greeting"]
+    assert "RUN_WORKERS" in manifest.settings
+    assert "OPENAI_API_KEY" not in manifest.settings
+    assert "AGENT_PATHS" not in manifest.settings
+
+
+def test_load_bundle_registers_agents_lazily_and_serves_prompts(bundle_dir, tmp_path):
+    """Test loaded agents are described without importing them and bundled prompts are not pushed or pulled remotely."""
+    with patch.object(
+        AgentExecutor, "register_agent", side_effect=AgentExecutor.register_agent, autospec=True
+    ) as register_agent:
+        executor = load_bundle(bundle_dir, apply_settings=False)
+
+    # Every bundled agent is registered once
+    assert register_agent.call_count == 1
+    assert executor.agents == {}
+    assert [info.description for info in executor.get_all_agent_info()] == [
+        read_manifest(bundle_dir).agents["chat"].description
+    ]
+    assert executor.get_agent("chat").name == "chat"
+
+    prompt = EmptyObservability(prompts_dir=str(tmp_path / "other")).pull_prompt("greeting")
+    assert prompt.messages[0].content == "Be brief."
+    # Remote platforms skip prompts of the snapshot, without requiring credentials
+    assert LangfuseObservability().push_prompt("greeting", "ignored") is None
+
+
+def test_apply_settings_snapshot_keeps_environment(monkeypatch):
+    """Test bundled settings are validated and do not override environment variables."""
+    monkeypatch.setattr(settings, "RUN_WORKERS", settings.RUN_WORKERS)
+    monkeypatch.setattr(settings, "RUN_QUEUE_MAX_SIZE", settings.RUN_QUEUE_MAX_SIZE)
+    monkeypatch.setenv("RUN_QUEUE_MAX_SIZE", "5")
+
+    applied = apply_settings_snapshot({"RUN_WORKERS": "7", "RUN_QUEUE_MAX_SIZE": 9, "UNKNOWN": 1})
+
+    assert applied == ["RUN_WORKERS"]
+    assert settings.RUN_WORKERS == 7
+
+
+def test_read_manifest_rejects_unknown_format(bundle_dir):
+    """Test bundles of another format version are rejected."""
+    manifest = json.loads((bundle_dir / MANIFEST_FILE).read_text())
+    manifest["format_version"] = 99
+    (bundle_dir / MANIFEST_FILE).write_text(json.dumps(manifest))
+
+    with pytest.raises(ValueError, match="format version 99"):
+        read_manifest(bundle_dir)
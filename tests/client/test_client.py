@@ -9,11 +9,15 @@ from langgraph_agent_toolkit.client import AgentClient, AgentClientError
 from langgraph_agent_toolkit.schema import (
     AddMessagesResponse,
     AgentInfo,
+    BatchResponse,
     ChatHistory,
     ChatMessage,
     ClearHistoryResponse,
+    DeleteThreadsResponse,
     FeedbackResponse,
+    HistoryImportRecord,
     MessageInput,
+    RunResponse,
     ServiceMetadata,
 )
 
@@ -101,6 +105,89 @@ def test_invoke(agent_client):
         assert "500 Internal Server Error" in str(exc.value)
 
 
+def test_batch(agent_client):
+    """Test synchronous batch invocation."""
+    mock_request = Request("POST", "http://test/batch")
+    mock_response = Response(
+        200,
+        json={
+            "results": [
+                {"index": 0, "status": "success", "output": {"type": "ai", "content": "Sunny"}},
+                {"index": 1, "status": "error", "error": "ValueError: boom"},
+            ],
+            "succeeded": 1,
+            "failed": 1,
+        },
+        request=mock_request,
+    )
+    with patch("httpx.post", return_value=mock_response) as mock_post:
+        response = agent_client.batch(
+            [{"input": {"message": "Weather?"}, "thread_id": "test-thread"}, {"input": {"message": "Fail"}}],
+            max_concurrency=2,
+        )
+        assert isinstance(response, BatchResponse)
+        assert response.results[0].output.content == "Sunny"
+        assert response.results[1].error == "ValueError: boom"
+
+        args, kwargs = mock_post.call_args
+        assert args[0].endswith("/test-agent/batch")
+        assert kwargs["json"]["max_concurrency"] == 2
+        assert kwargs["json"]["inputs"][0]["thread_id"] == "test-thread"
+        assert kwargs["json"]["inputs"][1]["input"]["message"] == "Fail"
+
+    error_response = Response(500, text="Internal Server Error", request=mock_request)
+    with patch("httpx.post", return_value=error_response):
+        with pytest.raises(AgentClientError) as exc:
+            agent_client.batch([{"input": {"message": "Weather?"}}])
+        assert "500 Internal Server Error" in str(exc.value)
+
+
+@pytest.mark.asyncio
+async def test_abatch(agent_client):
+    """Test asynchronous batch invocation."""
+    mock_request = Request("POST", "http://test/batch")
+    mock_response = Response(
+        200,
+        json={
+            "results": [{"index": 0, "status": "success", "output": {"type": "ai", "content": "Hi"}}],
+            "succeeded": 1,
+            "failed": 0,
+        },
+        request=mock_request,
+    )
+    with patch("httpx.AsyncClient.post", return_value=mock_response) as mock_post:
+        response = await agent_client.abatch([{"input": {"message": "Hello"}}])
+        assert response.succeeded == 1
+        assert response.results[0].output.content == "Hi"
+        assert mock_post.call_args[0][0].endswith("/test-agent/batch")
+
+
+def test_runs(agent_client):
+    """Test submitting a run and polling for its result."""
+    run = {"run_id": "run-1", "agent_id": "test-agent", "status": "pending", "created_at": 1.0}
+    mock_response = Response(202, json=run, request=Request("POST", "http://test/test-agent/runs"))
+    with patch("httpx.post", return_value=mock_response) as mock_post:
+        response = agent_client.create_run({"input": {"message": "Hello"}, "thread_id": "test-thread"})
+        assert isinstance(response, RunResponse)
+        assert response.run_id == "run-1"
+        args, kwargs = mock_post.call_args
+        assert args[0].endswith("/test-agent/runs")
+        assert kwargs["json"]["thread_id"] == "test-thread"
+
+    finished = run | {"status": "success", "output": {"type": "ai", "content": "Hi"}, "finished_at": 2.0}
+    mock_response = Response(200, json=finished, request=Request("GET", "http://test/runs/run-1"))
+    with patch("httpx.get", return_value=mock_response) as mock_get:
+        response = agent_client.get_run("run-1")
+        assert response.status == "success"
+        assert response.output.content == "Hi"
+        assert mock_get.call_args[0][0].endswith("/runs/run-1")
+
+    error_response = Response(404, text="Not Found", request=Request("GET", "http://test/runs/missing"))
+    with patch("httpx.get", return_value=error_response):
+        with pytest.raises(AgentClientError):
+            agent_client.get_run("missing")
+
+
 @pytest.mark.asyncio
 async def test_ainvoke(agent_client):
     """Test asynchronous invocation."""
@@ -418,6 +505,11 @@ def test_get_history(agent_client):
         assert "thread_id" in kwargs["params"]
         assert kwargs["params"]["thread_id"] == THREAD_ID
 
+    # Pagination parameters are only sent when set
+    with patch("httpx.get", return_value=mock_response) as mock_get:
+        agent_client.get_history(THREAD_ID, limit=20, before="msg-1")
+        assert mock_get.call_args.kwargs["params"] == {"thread_id": THREAD_ID, "limit": 20, "before": "msg-1"}
+
     # Test error response
     error_response = Response(500, text="Internal Server Error", request=Request("GET", "http://test/history"))
     with patch("httpx.get", return_value=error_response):
@@ -504,6 +596,68 @@ def test_clear_history(agent_client):
         assert "500 Internal Server Error" in str(exc.value)
 
 
+def test_delete_threads(agent_client):
+    """Test bulk thread deletion."""
+    mock_response = Response(
+        200,
+        json={"status": "success", "deleted": 2, "message": "Deleted 2 threads."},
+        request=Request("DELETE", "http://test/threads"),
+    )
+    with patch("httpx.request", return_value=mock_response) as mock_request:
+        response = agent_client.delete_threads(["t1", "t2"])
+        assert isinstance(response, DeleteThreadsResponse)
+        assert response.deleted == 2
+
+        args, kwargs = mock_request.call_args
+        assert args[0] == "DELETE"
+        assert args[1].endswith("/threads")
+        assert kwargs["json"] == {"thread_ids": ["t1", "t2"]}
+
+    error_response = Response(500, text="Internal Server Error", request=Request("DELETE", "http://test/threads"))
+    with patch("httpx.request", return_value=error_response):
+        with pytest.raises(AgentClientError, match="500 Internal Server Error"):
+            agent_client.delete_threads(["t1"])
+
+
+def test_import_history(agent_client):
+    """Test records are sent as NDJSON and the streamed events are parsed."""
+    events = [
+        json.dumps({"type": "error", "line": 2, "error": "Invalid record"}),
+        "",
+        json.dumps({"type": "summary", "processed": 2, "imported": 1, "failed": 1}),
+    ]
+    mock_response = Mock()
+    mock_response.iter_lines.return_value = events
+    mock_response.__enter__ = Mock(return_value=mock_response)
+    mock_response.__exit__ = Mock(return_value=None)
+
+    records = [
+        HistoryImportRecord(thread_id="t1", messages=[MessageInput(type="human", content="hello")]),
+        {"thread_id": "t2", "messages": []},
+    ]
+    with patch("httpx.stream", return_value=mock_response) as mock_stream:
+        responses = list(agent_client.import_history(records, max_concurrency=4))
+
+        assert [event.type for event in responses] == ["error", "summary"]
+        assert responses[-1].imported == 1
+
+        args, kwargs = mock_stream.call_args
+        assert args[1].endswith("/history/import")
+        assert kwargs["params"] == {"max_concurrency": 4}
+        assert kwargs["headers"]["Content-Type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in kwargs["content"]]
+        assert lines[0]["thread_id"] == "t1"
+        assert lines[1] == {"thread_id": "t2", "messages": []}
+
+    error_response = Response(500, text="Internal Server Error", request=Request("POST", "http://test/history/import"))
+    error_response_mock = Mock()
+    error_response_mock.__enter__ = Mock(return_value=error_response)
+    error_response_mock.__exit__ = Mock(return_value=None)
+    with patch("httpx.stream", return_value=error_response_mock):
+        with pytest.raises(AgentClientError, match="500 Internal Server Error"):
+            list(agent_client.import_history(records))
+
+
 @pytest.mark.asyncio
 async def test_aclear_history(agent_client):
     """Test asynchronous history clearing."""
@@ -0,0 +1,114 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import HTTPException
+from langgraph.store.memory import InMemoryStore
+
+from langgraph_agent_toolkit.core.idempotency.factory import IdempotencyStoreFactory
+from langgraph_agent_toolkit.core.idempotency.memory import InMemoryIdempotencyStore
+from langgraph_agent_toolkit.core.idempotency.store import LangGraphIdempotencyStore
+from langgraph_agent_toolkit.core.idempotency.types import IdempotencyBackends, IdempotencyRecord
+from langgraph_agent_toolkit.service.idempotency import IdempotencyManager
+
+
+def _record(key: str, ttl: float = 60) -> IdempotencyRecord:
+    now = time.time()
+    return IdempotencyRecord(key=key, fingerprint="f", response={"key": key}, created_at=now, expires_at=now + ttl)
+
+
+def test_factory_creates_stores():
+    """Test the factory creates the in-memory store and the memory backend store."""
+    assert isinstance(IdempotencyStoreFactory.create(IdempotencyBackends.MEMORY), InMemoryIdempotencyStore)
+    assert isinstance(
+        IdempotencyStoreFactory.create(IdempotencyBackends.STORE, store=InMemoryStore()), LangGraphIdempotencyStore
+    )
+
+    with pytest.raises(ValueError, match="requires a memory backend"):
+        IdempotencyStoreFactory.create(IdempotencyBackends.STORE)
+    with pytest.raises(ValueError, match=r"Unsupported idempotency backend:"):
+        IdempotencyStoreFactory.create("UNSUPPORTED_BACKEND")
+
+
+@pytest.mark.asyncio
+async def test_memory_store_expiry_and_capacity():
+    """Test the in-memory store drops expired records and the oldest ones beyond its capacity."""
+    store = InMemoryIdempotencyStore(max_entries=2)
+    for key in ("k1", "k2", "k3"):
+        await store.put(_record(key))
+
+    assert await store.get("k1") is None
+    assert (await store.get("k3")).response == {"key": "k3"}
+
+    with patch("langgraph_agent_toolkit.core.idempotency.types.time.time", return_value=time.time() + 61):
+        assert await store.get("k2") is None
+        assert await store.get("k3") is None
+
+
+@pytest.mark.asyncio
+async def test_langgraph_store_round_trip_and_expiry():
+    """Test records are kept in the LangGraph store and expired ones are deleted on read."""
+    store = LangGraphIdempotencyStore(InMemoryStore())
+    await store.put(_record("k1"))
+    assert (await store.get("k1")).response == {"key": "k1"}
+
+    await store.put(_record("k2", ttl=-1))
+    assert await store.get("k2") is None
+    assert await store.store.aget(store.namespace, "k2") is None
+
+
+@pytest.mark.asyncio
+async def test_manager_runs_concurrent_duplicates_once():
+    """Test duplicates wait for the request in flight and later ones get the stored response."""
+    manager = IdempotencyManager(InMemoryIdempotencyStore(), ttl=60)
+    started = asyncio.Event()
+    release = asyncio.Event()
+    call = AsyncMock()
+
+    async def run():
+        await call()
+        started.set()
+        await release.wait()
+        return {"content": "done"}
+
+    first = asyncio.create_task(manager.run("key", "f", run))
+    await started.wait()
+    duplicate = asyncio.create_task(manager.run("key", "f", run))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await first == ({"content": "done"}, False)
+    assert await duplicate == ({"content": "done"}, True)
+    assert await manager.run("key", "f", run) == ({"content": "done"}, True)
+    call.assert_awaited_once()
+
+    with pytest.raises(HTTPException) as exc_info:
+        await manager.run("key", "other", run)
+    assert exc_info.value.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_manager_does_not_store_failures():
+    """Test a failed request is reported to its duplicates and runs again on the next retry."""
+    manager = IdempotencyManager(InMemoryIdempotencyStore(), ttl=60)
+    release = asyncio.Event()
+
+    async def fail():
+        await release.wait()
+        raise ValueError("boom")
+
+    first = asyncio.create_task(manager.run("key", "f", fail))
+    await asyncio.sleep(0)
+    duplicate = asyncio.create_task(manager.run("key", "f", fail))
+    await asyncio.sleep(0)
+    release.set()
+
+    for task in (first, duplicate):
+        with pytest.raises(ValueError, match="boom"):
+            await task
+
+    async def succeed():
+        return {"content": "retried"}
+
+    assert await manager.run("key", "f", succeed) == ({"content": "retried"}, False)
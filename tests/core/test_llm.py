@@ -1,10 +1,21 @@
+import json
+import time
+from unittest.mock import patch
+
+import httpx
 import pytest
 from langchain.chat_models.base import _ConfigurableModel
 from langchain_community.chat_models import FakeListChatModel
 from langchain_core.runnables import RunnableSerializable
 from langchain_openai import ChatOpenAI
+from pydantic import SecretStr
 
-from langgraph_agent_toolkit.core.models.factory import CompletionModelFactory
+from langgraph_agent_toolkit.core.models.cache import ModelInstanceCache, model_cache
+from langgraph_agent_toolkit.core.models.config_reloader import ModelConfigsReloader
+from langgraph_agent_toolkit.core.models.factory import CompletionModelFactory, _ConfigurableModelCustom
+from langgraph_agent_toolkit.core.models.transport import HttpClientRegistry, http_client_registry
+from langgraph_agent_toolkit.core.settings import settings
+from langgraph_agent_toolkit.helper.metrics import metrics
 from langgraph_agent_toolkit.schema.models import ModelProvider
 
 
@@ -38,3 +49,179 @@ def test_get_model_invalid():
         # When calling with a string, it gets converted to an enum but will fail
         # with the missing model name error first
         CompletionModelFactory.create("invalid_model", model_name=None)  # type: ignore
+
+
+def test_configurable_model_reuses_cached_instance():
+    model_cache.clear()
+    model = CompletionModelFactory.create(
+        ModelProvider.OPENAI, model_name="gpt-4", openai_api_key="test_key", openai_api_base="http://api.example.com"
+    )
+    config = {"configurable": {"agent_temperature": 0.5}}
+
+    first = model._model(config)
+    second = model._model(config)
+    other = model._model({"configurable": {"agent_temperature": 0.9}})
+
+    assert first is second
+    assert other is not first
+    stats = model_cache.stats()
+    assert stats.hits == 1
+    assert stats.misses == 2
+
+
+def test_configurable_model_keeps_cache_after_bind_tools():
+    model = CompletionModelFactory.create(
+        ModelProvider.OPENAI, model_name="gpt-4", openai_api_key="test_key", openai_api_base="http://api.example.com"
+    )
+    assert isinstance(model.bind_tools([]), _ConfigurableModelCustom)
+    assert isinstance(model.with_config(tags=["skip_stream"]), _ConfigurableModelCustom)
+
+
+def test_model_cache_key_hashes_secrets():
+    key = ModelInstanceCache.make_key(
+        "gpt-4", model_provider="openai", openai_api_key=SecretStr("sk-secret"), api_token="raw-token"
+    )
+    assert "sk-secret" not in repr(key)
+    assert "raw-token" not in repr(key)
+    assert key == ModelInstanceCache.make_key(
+        "gpt-4", model_provider="openai", openai_api_key="sk-secret", api_token=SecretStr("raw-token")
+    )
+
+
+def test_model_cache_lru_and_ttl():
+    cache = ModelInstanceCache(max_size=2, ttl_seconds=0)
+    for i in range(3):
+        cache.get_or_create(("p", f"m{i}", ()), object)
+    assert cache.stats().size == 2
+    assert cache.stats().evictions == 1
+
+    expiring = ModelInstanceCache(max_size=2, ttl_seconds=60)
+    first = expiring.get_or_create(("p", "m", ()), object)
+    with patch("langgraph_agent_toolkit.core.models.cache.time.monotonic", return_value=time.monotonic() + 120):
+        assert expiring.get_or_create(("p", "m", ()), object) is not first
+
+
+def test_model_cache_skips_uncacheable_params():
+    assert ModelInstanceCache.make_key("gpt-4", model_provider="openai", http_client=object()) is None
+
+
+def test_openai_models_share_http_clients():
+    http_client_registry.reset()
+    first = CompletionModelFactory.create(
+        ModelProvider.OPENAI, model_name="gpt-4", openai_api_key="test_key", openai_api_base="http://api.example.com"
+    )._model()
+    second = CompletionModelFactory.create(
+        ModelProvider.OPENAI, model_name="gpt-4o", openai_api_key="test_key", openai_api_base="http://api.example.com"
+    )._model()
+    other_endpoint = CompletionModelFactory.create(
+        ModelProvider.OPENAI, model_name="gpt-4", openai_api_key="test_key", openai_api_base="http://other.example.com"
+    )._model()
+
+    assert first.http_async_client is second.http_async_client
+    assert first.http_client is second.http_client
+    assert other_endpoint.http_async_client is not first.http_async_client
+    assert ("openai", "http://api.example.com") in http_client_registry.stats()
+
+
+def test_http_client_pool_stats_are_exported():
+    http_client_registry.reset()
+    model_cache.clear()
+    model = CompletionModelFactory.create(
+        ModelProvider.OPENAI, model_name="gpt-4", openai_api_key="test_key", openai_api_base="http://api.example.com"
+    )._model()
+    request = httpx.Request("POST", "http://api.example.com/chat/completions")
+    on_request, on_response = model.http_client.event_hooks["request"][0], model.http_client.event_hooks["response"][0]
+    on_request(request)
+    on_response(httpx.Response(503, request=request))
+
+    stats = http_client_registry.stats()[("openai", "http://api.example.com")]
+    assert (stats.requests, stats.responses, stats.errors, stats.status_codes) == (1, 1, 1, {503: 1})
+    output = metrics.render()
+    labels = 'provider="openai",base_url="http://api.example.com"'
+    assert f"llm_http_pool_requests{{{labels}}} 1" in output
+    assert f'llm_http_pool_responses{{{labels},status="503"}} 1' in output
+    assert f"llm_http_pool_errors{{{labels}}} 1" in output
+    assert "model_cache_misses " in output
+
+
+def test_http_client_registry_respects_explicit_clients():
+    registry = HttpClientRegistry()
+    explicit = httpx.AsyncClient()
+    params = registry.inject("openai", {"http_async_client": explicit})
+    assert params["http_async_client"] is explicit
+    assert isinstance(params["http_client"], httpx.Client)
+    assert registry.inject("anthropic", {}) == {}
+
+
+def test_http_client_registry_reset_drops_cached_models():
+    model_cache.clear()
+    model = CompletionModelFactory.create(
+        ModelProvider.OPENAI, model_name="gpt-4", openai_api_key="test_key", openai_api_base="http://api.example.com"
+    )
+    before = model._model()
+    http_client_registry.reset()
+    after = model._model()
+
+    assert after is not before
+    assert after.http_async_client is not before.http_async_client
+
+
+def test_model_configs_reloader_swaps_valid_configs(tmp_path, monkeypatch):
+    old_configs = {
+        "gpt": {"provider": "openai", "name": "gpt-4", "openai_api_base": "http://api.example.com"},
+        "mini": {"provider": "openai", "name": "gpt-4o-mini"},
+    }
+    monkeypatch.setattr(settings, "MODEL_CONFIGS", old_configs)
+    path = tmp_path / "models.json"
+    path.write_text(json.dumps(old_configs))
+    reloader = ModelConfigsReloader(path)
+
+    model_cache.clear()
+    http_client_registry.reset()
+    gpt = CompletionModelFactory.get_model_from_config(settings.get_model_config("gpt"))._model()
+    mini_key = ("openai", "gpt-4o-mini", ())
+    mini = model_cache.get_or_create(mini_key, object)
+
+    new_configs = {**old_configs, "gpt": {**old_configs["gpt"], "openai_api_base": "http://other.example.com"}}
+    path.write_text(json.dumps(new_configs))
+    assert reloader.reload() is True
+    assert settings.MODEL_CONFIGS == new_configs
+    # The old dict is replaced as a whole, never modified in place
+    assert settings.MODEL_CONFIGS is not old_configs
+    assert old_configs["gpt"]["openai_api_base"] == "http://api.example.com"
+    assert ("openai", "http://api.example.com") not in http_client_registry.stats()
+    assert model_cache.get_or_create(mini_key, object) is mini
+
+    reloaded = CompletionModelFactory.get_model_from_config(settings.get_model_config("gpt"))._model()
+    assert reloaded is not gpt
+    assert reloaded.openai_api_base == "http://other.example.com"
+    # Unchanged content is not applied again
+    assert reloader.reload() is False
+
+
+@pytest.mark.parametrize("content", ["{not json", "[]", json.dumps({"gpt": {"provider": "openai"}})])
+def test_model_configs_reloader_keeps_configs_on_invalid_file(tmp_path, monkeypatch, content):
+    configs = {"gpt": {"provider": "openai", "name": "gpt-4"}}
+    monkeypatch.setattr(settings, "MODEL_CONFIGS", configs)
+    path = tmp_path / "models.json"
+    path.write_text(content)
+
+    assert ModelConfigsReloader(path).reload() is False
+    assert settings.MODEL_CONFIGS is configs
+
+
+def test_model_configs_reloader_watches_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "MODEL_CONFIGS", {})
+    path = tmp_path / "models.json"
+    path.write_text("{}")
+    reloader = ModelConfigsReloader(path, debounce_seconds=0.05)
+    reloader.start()
+    try:
+        path.write_text(json.dumps({"gpt": {"provider": "openai", "name": "gpt-4"}}))
+        deadline = time.monotonic() + 5
+        while settings.get_model_config("gpt") is None and time.monotonic() < deadline:
+            time.sleep(0.05)
+    finally:
+        reloader.stop()
+
+    assert settings.get_model_config("gpt") == {"provider": "openai", "name": "gpt-4"}
@@ -0,0 +1,160 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from langgraph_agent_toolkit.core.queue.factory import RunQueueFactory
+from langgraph_agent_toolkit.core.queue.memory import InMemoryRunQueue
+from langgraph_agent_toolkit.core.queue.types import RunQueueBackends, RunRecord, RunStatus
+from langgraph_agent_toolkit.core.queue.worker import RunWorkerPool
+from langgraph_agent_toolkit.helper.exceptions import RateLimitError
+from langgraph_agent_toolkit.schema import ChatMessage
+
+
+def _record(run_id: str, message: str = "Hello") -> RunRecord:
+    return RunRecord(run_id=run_id, agent_id="test-agent", input={"input": {"message": message}})
+
+
+def test_factory_creates_memory_queue():
+    """Test that the factory creates the in-memory queue."""
+    assert isinstance(RunQueueFactory.create(RunQueueBackends.MEMORY), InMemoryRunQueue)
+
+    with pytest.raises(ValueError, match=r"Unsupported run queue backend:"):
+        RunQueueFactory.create("UNSUPPORTED_BACKEND")
+
+
+@pytest.mark.asyncio
+async def test_memory_queue_order_capacity_and_expiry():
+    """Test the in-memory queue is FIFO, bounded and drops expired results."""
+    queue = InMemoryRunQueue(max_size=2, result_ttl=60)
+    await queue.enqueue(_record("r1"))
+    await queue.enqueue(_record("r2"))
+
+    with pytest.raises(RateLimitError):
+        await queue.enqueue(_record("r3"))
+
+    first = await queue.dequeue()
+    assert first.run_id == "r1"
+
+    finished_at = time.time()
+    await queue.update(first.model_copy(update={"status": RunStatus.SUCCESS, "finished_at": finished_at}))
+    assert (await queue.get("r1")).status == RunStatus.SUCCESS
+
+    with patch("langgraph_agent_toolkit.core.queue.memory.time.time", return_value=finished_at + 61):
+        assert await queue.get("r1") is None
+        # Pending runs never expire
+        assert (await queue.get("r2")).status == RunStatus.PENDING
+
+
+@pytest.mark.asyncio
+async def test_memory_queue_prunes_expired_results_in_finish_order():
+    """Test expired results are dropped oldest first while newer results and pending runs are kept."""
+    queue = InMemoryRunQueue(max_size=10, result_ttl=60)
+    now = time.time()
+    for i, run_id in enumerate(["old", "newer", "pending"]):
+        await queue.enqueue(_record(run_id))
+        if run_id != "pending":
+            finished = (await queue.dequeue()).model_copy(update={"status": RunStatus.SUCCESS, "finished_at": now + i})
+            await queue.update(finished)
+            # Later updates of a finished run keep its position
+            await queue.update(finished)
+
+    with patch("langgraph_agent_toolkit.core.queue.memory.time.time", return_value=now + 60.5):
+        assert await queue.get("old") is None
+        assert (await queue.get("newer")).status == RunStatus.SUCCESS
+        assert list(queue._finished) == ["newer"]
+    with patch("langgraph_agent_toolkit.core.queue.memory.time.time", return_value=now + 62):
+        assert await queue.get("newer") is None
+        assert (await queue.get("pending")).status == RunStatus.PENDING
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_executes_runs():
+    """Test workers execute queued runs and store results and errors."""
+
+    async def fake_invoke(agent_id, input, **kwargs):
+        if input.message == "fail":
+            raise ValueError("boom")
+        return ChatMessage(type="ai", content=f"echo {input.message}")
+
+    executor = Mock()
+    executor.invoke = AsyncMock(side_effect=fake_invoke)
+
+    queue = InMemoryRunQueue(max_size=10, result_ttl=60)
+    pool = RunWorkerPool(queue, executor, size=2)
+    pool.start()
+    try:
+        await queue.enqueue(_record("ok", "hi"))
+        await queue.enqueue(_record("bad", "fail"))
+
+        for _ in range(100):
+            records = [await queue.get("ok"), await queue.get("bad")]
+            if all(r.status.is_finished for r in records):
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await pool.stop()
+
+    ok, bad = records
+    assert ok.status == RunStatus.SUCCESS
+    assert ok.output["content"] == "echo hi"
+    assert ok.started_at is not None and ok.finished_at is not None
+    assert bad.status == RunStatus.ERROR
+    assert bad.error == "ValueError: boom"
+    assert executor.invoke.call_args.kwargs["agent_id"] == "test-agent"
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_stop_marks_running_runs_as_failed():
+    """Test runs in progress are marked as failed when the workers stop."""
+    started = asyncio.Event()
+
+    async def slow_invoke(**kwargs):
+        started.set()
+        await asyncio.sleep(10)
+
+    executor = Mock()
+    executor.invoke = AsyncMock(side_effect=slow_invoke)
+
+    queue = InMemoryRunQueue(max_size=10, result_ttl=60)
+    pool = RunWorkerPool(queue, executor, size=1)
+    pool.start()
+    await queue.enqueue(_record("slow"))
+    await asyncio.wait_for(started.wait(), timeout=1)
+    await pool.stop()
+
+    record = await queue.get("slow")
+    assert record.status == RunStatus.ERROR
+    assert record.error == "Run cancelled"
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_admits_runs():
+    """Test workers take an admission ticket per run and keep rejected runs pending until admitted."""
+    executor = Mock()
+    executor.invoke = AsyncMock(return_value=ChatMessage(type="ai", content="done"))
+    ticket = Mock()
+    admit = AsyncMock(side_effect=[RateLimitError(resource="all agents", limit=1, retry_after=0.05), ticket])
+
+    queue = InMemoryRunQueue(max_size=10, result_ttl=60)
+    pool = RunWorkerPool(queue, executor, size=1, admit=admit)
+    pool.start()
+    try:
+        assert pool.running
+        await queue.enqueue(_record("run"))
+        await asyncio.sleep(0.01)
+        assert (await queue.get("run")).status == RunStatus.PENDING
+
+        for _ in range(100):
+            if (await queue.get("run")).status.is_finished:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await pool.stop()
+
+    assert (await queue.get("run")).status == RunStatus.SUCCESS
+    assert admit.await_count == 2
+    admit.assert_awaited_with("test-agent")
+    ticket.release.assert_called_once()
+    assert not pool.running
@@ -0,0 +1,101 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+
+from langgraph_agent_toolkit.helper.metrics import (
+    STAGE_DURATION,
+    MetricsRegistry,
+    StageTimingCallbackHandler,
+    format_server_timing,
+    record_stage,
+    stage,
+    start_stage_timings,
+)
+
+
+class TestMetricsRegistry:
+    """Tests for the Prometheus text rendering."""
+
+    def test_render_counter_and_histogram(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("requests_total", "Requests.", ("route",))
+        histogram = registry.histogram("latency_seconds", "Latency.", ("stage",), buckets=(0.1, 1.0))
+
+        counter.inc(route="/invoke")
+        counter.inc(2, route="/invoke")
+        histogram.observe(0.05, stage="setup")
+        histogram.observe(0.5, stage="setup")
+        histogram.observe(5, stage="setup")
+
+        output = registry.render()
+        assert "# TYPE requests_total counter" in output
+        assert 'requests_total{route="/invoke"} 3' in output
+        assert "# TYPE latency_seconds histogram" in output
+        assert 'latency_seconds_bucket{stage="setup",le="0.1"} 1' in output
+        assert 'latency_seconds_bucket{stage="setup",le="1"} 2' in output
+        assert 'latency_seconds_bucket{stage="setup",le="+Inf"} 3' in output
+        assert 'latency_seconds_sum{stage="setup"} 5.55' in output
+        assert 'latency_seconds_count{stage="setup"} 3' in output
+
+    def test_render_gauge_reads_callback(self):
+        registry = MetricsRegistry()
+        values = {"a": 1}
+        registry.gauge("pool_size", "Pool size.", lambda: [((key,), value) for key, value in values.items()], ("pool",))
+
+        assert 'pool_size{pool="a"} 1' in registry.render()
+        values["a"] = 4
+        output = registry.render()
+        assert "# TYPE pool_size gauge" in output
+        assert 'pool_size{pool="a"} 4' in output
+
+    def test_register_returns_existing_metric(self):
+        registry = MetricsRegistry()
+        assert registry.counter("a", "A.") is registry.counter("a", "A.")
+        with pytest.raises(ValueError, match="already registered"):
+            registry.histogram("a", "A.")
+
+
+class TestStageTimings:
+    """Tests for per-request stage timings."""
+
+    @pytest.mark.asyncio
+    async def test_stages_are_collected_per_request_and_in_child_tasks(self):
+        before = STAGE_DURATION.count(stage="test_stage")
+
+        async def request():
+            timings = start_stage_timings()
+            with stage("test_stage"):
+                await asyncio.sleep(0)
+            # Tasks copy the context, so they append to the same list
+            await asyncio.create_task(_record_in_task())
+            return timings
+
+        async def _record_in_task():
+            record_stage("test_stage", 0.5)
+
+        first, second = await asyncio.gather(request(), request())
+        assert [name for name, _ in first] == ["test_stage", "test_stage"]
+        assert first is not second
+        assert STAGE_DURATION.count(stage="test_stage") == before + 4
+
+    def test_format_server_timing_sums_repeated_stages(self):
+        header = format_server_timing([("setup", 0.0012), ("tool", 0.1), ("tool", 0.2)])
+        assert header == 'setup;dur=1.2, tool;dur=300.0;desc="2 calls"'
+
+    @pytest.mark.asyncio
+    async def test_callback_handler_records_llm_and_first_token(self):
+        timings = start_stage_timings()
+        model = GenericFakeChatModel(messages=iter([AIMessage(content="Hello world")]))
+        handler = StageTimingCallbackHandler()
+
+        chunks = [chunk async for chunk in model.astream("hi", config={"callbacks": [handler]})]
+
+        assert chunks
+        assert [name for name, _ in timings] == ["llm_first_token", "llm"]
+
+        handler.on_tool_start({}, "input", run_id=(run_id := uuid4()))
+        handler.on_tool_end("output", run_id=run_id)
+        assert timings[-1][0] == "tool"
@@ -0,0 +1,87 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from langgraph_agent_toolkit.helper.startup_profile import (
+    IMPORT_MARKER,
+    agent_import_targets,
+    check_budget,
+    load_budget,
+    measure_imports,
+    measure_lifespan,
+    parse_importtime,
+    save_budget,
+    self_time_by_package,
+    total_import_ms,
+)
+
+
+IMPORTTIME_OUTPUT = f"""import time: self [us] | cumulative | imported package
+import time:       100 |        100 | preloaded
+{IMPORT_MARKER}
+import time: self [us] | cumulative | imported package
+import time:       500 |        500 |     pkg.sub
+import time:      1000 |       1500 |   pkg
+import time:       250 |        250 |   other.mod
+import time:      2000 |       3750 | target
+"""
+
+
+def test_parse_importtime_after_marker():
+    """Test only imports after the marker are reported with their nesting depth."""
+    imports = parse_importtime(IMPORTTIME_OUTPUT)
+
+    assert [(i.module, i.depth) for i in imports] == [("pkg.sub", 2), ("pkg", 1), ("other.mod", 1), ("target", 0)]
+    assert total_import_ms(imports) == 3.75
+    assert self_time_by_package(imports) == {"target": 2.0, "pkg": 1.5, "other": 0.25}
+
+
+def test_measure_imports_in_fresh_interpreter():
+    """Test a module is imported in a subprocess and failures are raised."""
+    imports = measure_imports("json", preload=["os"])
+    assert "json" in [i.module for i in imports]
+    assert "os" not in [i.module for i in imports]
+
+    with pytest.raises(RuntimeError, match="missing_module_for_profile"):
+        measure_imports("missing_module_for_profile")
+
+
+def test_agent_import_targets():
+    """Test lazy entries are named by their agent ID and eager ones by their object."""
+    assert agent_import_targets(["lazy-agent=pkg.agent:agent", "pkg.other:other_agent"]) == [
+        ("lazy-agent", "pkg.agent"),
+        ("other_agent", "pkg.other"),
+    ]
+
+
+def test_budget_round_trip_and_check(tmp_path):
+    """Test measurements above their budget are reported and unbudgeted keys are ignored."""
+    path = tmp_path / "budget.json"
+    assert load_budget(path) == {}
+
+    save_budget(path, {"import:service": 100.0, "agent:a": 10.0}, headroom=1.5)
+    budget = load_budget(path)
+    assert budget == {"agent:a": 15.0, "import:service": 150.0}
+
+    violations = check_budget({"import:service": 200.0, "agent:a": 5.0, "agent:b": 1000.0}, budget)
+    assert [v.key for v in violations] == ["import:service"]
+    assert "exceeds budget of 150.0ms" in str(violations[0])
+
+
+@pytest.mark.asyncio
+async def test_measure_lifespan_reports_step_durations():
+    """Test step durations are the difference of the recorded totals during startup."""
+    totals = {"agents": 1.0}
+
+    @asynccontextmanager
+    async def lifespan(app):
+        await asyncio.sleep(0)
+        totals["agents"] += 0.25
+        yield
+
+    timings = await measure_lifespan(None, lifespan, lambda step: totals.get(step, 0.0))
+
+    assert timings["agents"] == 250.0
+    assert timings["checkpointer"] == 0.0
+    assert timings["total"] >= 0.0
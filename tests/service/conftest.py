@@ -35,7 +35,7 @@ def mock_agent_executor():
     agent_mock.graph = Mock()
 
     # Configure async methods with AsyncMock
-    agent_mock.graph.ainvoke = AsyncMock(return_value=[("values", {"messages": [AIMessage(content="Test response")]})])
+    agent_mock.graph.ainvoke = AsyncMock(return_value={"messages": [AIMessage(content="Test response")]})
 
     # Create a proper StateSnapshot for aget_state
     mock_state = MockStateSnapshot(values={"messages": []}, tasks=[])
@@ -56,6 +56,7 @@ def mock_agent_executor():
     executor = Mock(spec=AgentExecutor)
     executor.agents = {DEFAULT_AGENT: agent_mock}
     executor.get_agent = Mock(return_value=agent_mock)
+    executor.aget_agent = AsyncMock(side_effect=lambda agent_id: executor.get_agent(agent_id))
     executor.get_all_agent_info = Mock(return_value=[{"key": DEFAULT_AGENT, "description": "A mock agent for testing"}])
 
     # We'll capture all args that are passed to these methods
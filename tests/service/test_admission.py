@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+
+from langgraph_agent_toolkit.helper.exceptions import RateLimitError
+from langgraph_agent_toolkit.service.admission import AdmissionController
+
+
+@pytest.mark.asyncio
+async def test_unlimited_controller_admits_everything():
+    """Test a controller without limits never blocks."""
+    controller = AdmissionController()
+    tickets = [await controller.acquire("agent") for _ in range(100)]
+    for ticket in tickets:
+        ticket.release()
+    assert not controller.limits_agents
+
+
+@pytest.mark.asyncio
+async def test_per_agent_limit_queues_and_releases():
+    """Test runs beyond the agent limit wait for a slot and are admitted once it is released."""
+    controller = AdmissionController(max_concurrency_per_agent=1, timeout=1.0)
+    first = await controller.acquire("agent")
+
+    waiting = asyncio.create_task(controller.acquire("agent"))
+    await asyncio.sleep(0)
+    assert not waiting.done()
+
+    # Other agents have their own slots
+    (await controller.acquire("other")).release()
+
+    first.release()
+    second = await asyncio.wait_for(waiting, timeout=1.0)
+    second.release()
+    # Releasing twice has no effect
+    second.release()
+    assert controller._agents["agent"].in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_rejects_when_wait_queue_is_full():
+    """Test runs are rejected with a retry hint once the wait queue is full."""
+    controller = AdmissionController(max_concurrency=1, max_waiting=1, timeout=1.0, retry_after=2.5)
+    ticket = await controller.acquire("agent")
+    waiting = asyncio.create_task(controller.acquire("agent"))
+    await asyncio.sleep(0)
+
+    with pytest.raises(RateLimitError) as exc_info:
+        await controller.acquire("agent")
+    assert exc_info.value.limit == 1
+    assert exc_info.value.retry_after == 2.5
+
+    ticket.release()
+    (await waiting).release()
+
+
+@pytest.mark.asyncio
+async def test_rejects_after_wait_timeout_and_frees_agent_slot():
+    """Test a run timing out on the global limit gives back the agent slot it already held."""
+    controller = AdmissionController(max_concurrency=1, agent_limits={"agent": 2}, timeout=0.01)
+    ticket = await controller.acquire("other")
+
+    with pytest.raises(RateLimitError, match="all agents"):
+        await controller.acquire("agent")
+    assert controller._agents["agent"].in_flight == 0
+    assert controller._global.waiting == 0
+
+    ticket.release()
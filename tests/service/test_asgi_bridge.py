@@ -0,0 +1,121 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+
+from langgraph_agent_toolkit.service.asgi_bridge import ASGIRequestBridge, LifespanRunner, http_scope
+
+
+async def _body(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+def test_http_scope_from_url_string():
+    """Test the scope is built from a URL string with lower-cased headers."""
+    scope = http_scope("POST", "https://example.com/react-agent/stream?x=1", {"Content-Type": "application/json"})
+
+    assert (scope["method"], scope["path"], scope["query_string"]) == ("POST", "/react-agent/stream", b"x=1")
+    assert scope["headers"] == [(b"content-type", b"application/json")]
+
+
+@pytest.mark.asyncio
+async def test_response_chunks_are_streamed_before_the_app_finishes():
+    """Test the first chunk is available while the app is still producing the response."""
+    release = asyncio.Event()
+    app = FastAPI()
+
+    @app.get("/stream")
+    async def stream():
+        async def events():
+            yield b"first"
+            await release.wait()
+            yield b"second"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    bridge = ASGIRequestBridge(app, http_scope("GET", "http://test/stream", {}), _body())
+    status_code, headers = await bridge.start()
+    assert status_code == 200
+    assert (b"content-type", b"text/event-stream; charset=utf-8") in headers
+
+    chunks = bridge.iter_body()
+    assert await asyncio.wait_for(chunks.__anext__(), timeout=1.0) == b"first"
+    release.set()
+    assert [chunk async for chunk in chunks] == [b"second"]
+
+
+@pytest.mark.asyncio
+async def test_request_body_is_passed_in_chunks_and_disconnect_reported():
+    """Test request chunks are marked with `more_body` and a disconnect follows once the client is gone."""
+    messages = []
+    disconnected = asyncio.Event()
+
+    async def app(scope, receive, send):
+        while True:
+            message = await receive()
+            messages.append(message)
+            if not message.get("more_body"):
+                break
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"partial", "more_body": True})
+        if (await receive())["type"] == "http.disconnect":
+            disconnected.set()
+
+    bridge = ASGIRequestBridge(app, http_scope("POST", "http://test/import", {}), _body(b"a", b"b"))
+    await bridge.start()
+    chunks = bridge.iter_body()
+    assert await chunks.__anext__() == b"partial"
+    # The client goes away before the response is complete
+    await chunks.aclose()
+
+    assert [(m["body"], m["more_body"]) for m in messages] == [(b"a", True), (b"b", False)]
+    assert disconnected.is_set()
+
+
+@pytest.mark.asyncio
+async def test_read_body_and_startup_errors():
+    """Test a single-chunk body is returned as is and failures before the response start are raised."""
+    body = b"x" * 1024
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 201, "headers": []})
+        await send({"type": "http.response.body", "body": body})
+
+    bridge = ASGIRequestBridge(app, http_scope("GET", "http://test/", {}), _body())
+    assert (await bridge.start())[0] == 201
+    assert await bridge.read_body() is body
+
+    async def failing_app(scope, receive, send):
+        raise ValueError("broken")
+
+    with pytest.raises(ValueError, match="broken"):
+        await ASGIRequestBridge(failing_app, http_scope("GET", "http://test/", {}), _body()).start()
+
+
+@pytest.mark.asyncio
+async def test_lifespan_runner_starts_once_and_shuts_down():
+    """Test concurrent first requests wait for a single startup of the lifespan."""
+    events = []
+
+    @asynccontextmanager
+    async def lifespan(app):
+        events.append("startup")
+        await asyncio.sleep(0.01)
+        yield
+        events.append("shutdown")
+
+    app = FastAPI(lifespan=lifespan)
+
+    @app.get("/ping")
+    async def ping(request: Request):
+        return {"ok": True}
+
+    runner = LifespanRunner(app)
+    await asyncio.gather(runner.startup(), runner.startup())
+    assert events == ["startup"]
+
+    await runner.shutdown()
+    assert events == ["startup", "shutdown"]
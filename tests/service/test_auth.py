@@ -49,6 +49,19 @@ def test_auth_secret_correct(mock_settings, mock_agent_executor, test_client):
             assert response.status_code == 200
 
 
+def test_metrics_require_auth_unless_public(test_client):
+    """Test that /metrics needs the bearer token unless METRICS_PUBLIC is set."""
+    with patch("langgraph_agent_toolkit.service.utils.settings") as settings:
+        settings.AUTH_SECRET = SecretStr("test-secret")
+        settings.METRICS_PUBLIC = False
+        assert test_client.get("/metrics").status_code == 401
+        response = test_client.get("/metrics", headers={"Authorization": "Bearer test-secret"})
+        assert response.status_code == 200
+
+        settings.METRICS_PUBLIC = True
+        assert test_client.get("/metrics").status_code == 200
+
+
 def test_auth_secret_incorrect(mock_settings, mock_agent_executor, app):
     """Test that when AUTH_SECRET is set, requests with wrong token are rejected."""
     # Set the auth secret for testing
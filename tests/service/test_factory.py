@@ -1,3 +1,4 @@
+import asyncio
 import sys
 from unittest.mock import Mock, patch
 
@@ -94,6 +95,52 @@ class TestServiceRunner:
                             )
                             mock_sys.exit.assert_called_with(1)
 
+    def test_run_gunicorn_preloads_agents(self):
+        """Test agents are preloaded and the heap frozen before gunicorn forks the workers."""
+        configs = []
+
+        def run(app):
+            configs.append(app.cfg)
+
+        with patch("langgraph_agent_toolkit.service.factory.create_app"):
+            with patch("langgraph_agent_toolkit.service.factory.base_settings") as mock_settings:
+                with patch("langgraph_agent_toolkit.service.factory.preload_agents") as mock_preload:
+                    with patch("langgraph_agent_toolkit.service.factory.gc") as mock_gc:
+                        with patch("gunicorn.app.base.BaseApplication.run", run):
+                            mock_settings.HOST = "0.0.0.0"
+                            mock_settings.PORT = 8080
+                            mock_settings.GUNICORN_WORKERS = 0
+                            mock_settings.GUNICORN_PRELOAD = True
+                            mock_settings.RUN_QUEUE_BACKEND = "memory"
+                            mock_settings.IDEMPOTENCY_BACKEND = "store"
+                            mock_settings.MAX_CONCURRENT_RUNS = 0
+                            mock_settings.MAX_CONCURRENT_RUNS_PER_AGENT = 0
+                            mock_settings.AGENT_CONCURRENCY_LIMITS = {}
+
+                            service_runner = ServiceRunner()
+                            with (
+                                patch("langgraph_agent_toolkit.service.factory.default_worker_count", return_value=3),
+                                patch("langgraph_agent_toolkit.service.factory.logger") as mock_logger,
+                            ):
+                                service_runner.run_gunicorn()
+                                # Per-worker state is reported once several workers are started
+                                warning = mock_logger.warning.call_args.args[0]
+                                assert "RUN_QUEUE_BACKEND=memory" in warning
+                                assert "IDEMPOTENCY_BACKEND" not in warning
+
+                            mock_preload.assert_called_once_with(service_runner.app)
+                            mock_gc.freeze.assert_called_once()
+                            assert configs[0].workers == 3
+                            assert configs[0].post_fork.__name__ == "_post_fork"
+
+                            # Explicit options take precedence and nothing is preloaded when disabled
+                            mock_settings.GUNICORN_PRELOAD = False
+                            with patch("langgraph_agent_toolkit.service.factory.logger") as mock_logger:
+                                service_runner.run_gunicorn(workers=1)
+                                mock_logger.warning.assert_not_called()
+                            mock_preload.assert_called_once()
+                            assert configs[1].workers == 1
+
     def test_run_aws_lambda(self):
         """Test running in AWS Lambda mode."""
         # Mock Mangum class
@@ -116,6 +163,19 @@ class TestServiceRunner:
                 mock_mangum.assert_called_with(mock_app)
                 assert handler == mock_mangum_instance
 
+    def test_run_aws_lambda_registers_bundle(self):
+        """Test the agents of a bundle are registered during init without importing them."""
+        with patch("langgraph_agent_toolkit.service.factory.create_app"):
+            with patch("langgraph_agent_toolkit.service.factory.base_settings") as mock_settings:
+                with patch("langgraph_agent_toolkit.service.factory.preload_agents") as mock_preload:
+                    with patch.dict(sys.modules, {"mangum": Mock()}):
+                        mock_settings.AGENT_BUNDLE_PATH = "/var/task/agent_bundle"
+
+                        service_runner = ServiceRunner()
+                        service_runner.run_aws_lambda()
+
+                        mock_preload.assert_called_once_with(service_runner.app, warmup=False)
+
     def test_run_aws_lambda_import_error(self):
         """Test running in AWS Lambda mode when mangum is not installed."""
         with patch("langgraph_agent_toolkit.service.factory.create_app"):
@@ -255,3 +315,40 @@ class TestServiceRunner:
                 body=b"Hello, World!", status_code=200, headers={"content-type": "text/plain"}
             )
             assert response == "response"
+
+    def test_stream_azure_request(self):
+        """Test requests of the HTTP streams extension get the response chunks as the app sends them."""
+        from starlette.datastructures import URL, Headers
+        from starlette.responses import StreamingResponse
+
+        received = []
+
+        async def asgi_app(scope, receive, send):
+            received.append(await receive())
+            await send({"type": "http.response.start", "status": 200, "headers": [(b"set-cookie", b"a=1")]})
+            await send({"type": "http.response.body", "body": b"data: 1\n\n", "more_body": True})
+            await send({"type": "http.response.body", "body": b"data: 2\n\n"})
+
+        async def request_stream():
+            yield b'{"message": "hi"}'
+
+        mock_req = Mock()
+        mock_req.method = "POST"
+        mock_req.url = URL("https://example.com/react-agent/stream")
+        mock_req.headers = Headers({"content-type": "application/json"})
+        mock_req.stream.return_value = request_stream()
+
+        extension = Mock()
+        extension.StreamingResponse = StreamingResponse
+
+        async def run():
+            response = await ServiceRunner._stream_azure_request(asgi_app, mock_req)
+            return response, [chunk async for chunk in response.body_iterator]
+
+        with patch.dict(sys.modules, {"azurefunctions.extensions.http.fastapi": extension}):
+            response, chunks = asyncio.run(run())
+
+        assert received == [{"type": "http.request", "body": b'{"message": "hi"}', "more_body": False}]
+        assert response.status_code == 200
+        assert response.raw_headers == [(b"set-cookie", b"a=1")]
+        assert chunks == [b"data: 1\n\n", b"data: 2\n\n"]
@@ -0,0 +1,114 @@
+import asyncio
+import json
+from unittest.mock import Mock
+
+import pytest
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.graph import END, START, MessagesState, StateGraph
+
+from langgraph_agent_toolkit.service.history_import import LineTooLongError, import_history, iter_ndjson_lines
+
+
+async def _chunks(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+class _SlowSaver(InMemorySaver):
+    """Checkpointer yielding between reading the latest checkpoint and writing the next one."""
+
+    async def aget_tuple(self, config):
+        checkpoint = await super().aget_tuple(config)
+        await asyncio.sleep(0.01)
+        return checkpoint
+
+
+def _agent(checkpointer=None):
+    builder = StateGraph(MessagesState)
+    builder.add_node("noop", lambda state: {})
+    builder.add_edge(START, "noop")
+    builder.add_edge("noop", END)
+    agent = Mock()
+    agent.graph = builder.compile(checkpointer=checkpointer or InMemorySaver())
+    return agent
+
+
+def _record(thread_id: str, *contents: str) -> bytes:
+    messages = [{"type": "human" if i % 2 == 0 else "ai", "content": c} for i, c in enumerate(contents)]
+    return json.dumps({"thread_id": thread_id, "messages": messages}).encode() + b"\n"
+
+
+@pytest.mark.asyncio
+async def test_iter_ndjson_lines_splits_chunks_and_skips_long_lines():
+    """Test lines spanning chunks are joined and oversized lines are reported in their place."""
+    lines = [
+        line
+        async for line in iter_ndjson_lines(
+            _chunks(b'{"a"', b": 1}\n\n" + b"x" * 6, b"x" * 6 + b"\n", b"short\nlast"),
+            max_line_bytes=8,
+        )
+    ]
+    assert lines[:2] == [b'{"a": 1}', b""]
+    assert isinstance(lines[2], LineTooLongError)
+    assert lines[3:] == [b"short", b"last"]
+
+
+@pytest.mark.asyncio
+async def test_import_history_writes_records_and_reports_failures():
+    """Test valid records are appended to their threads while failed ones are reported by line."""
+    agent = _agent()
+    body = _record("t1", "hello", "hi there") + b"not json\n" + b'{"thread_id": "t2", "messages": []}\n'
+    body += _record("t3", "question") + _record("t4", "again")
+
+    events = [
+        event
+        async for event in import_history(
+            agent, iter_ndjson_lines(_chunks(body[:25], body[25:])), max_concurrency=2, progress_interval=2
+        )
+    ]
+
+    errors = [event for event in events if event.type == "error"]
+    assert [event.line for event in errors] == [2, 3]
+    assert [event.type for event in events].count("progress") == 2
+    summary = events[-1]
+    assert summary.type == "summary"
+    assert (summary.processed, summary.imported, summary.failed) == (5, 3, 2)
+
+    state = await agent.graph.aget_state({"configurable": {"thread_id": "t1"}})
+    assert [m.content for m in state.values["messages"]] == ["hello", "hi there"]
+
+
+@pytest.mark.asyncio
+async def test_import_history_bounds_concurrent_writes():
+    """Test no more than `max_concurrency` records are written at once."""
+    agent = Mock()
+    in_flight = 0
+    peak = 0
+
+    async def aupdate_state(config, values, as_node=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    agent.graph.aupdate_state = aupdate_state
+    body = b"".join(_record(f"t{i}", "hello") for i in range(10))
+
+    events = [event async for event in import_history(agent, iter_ndjson_lines(_chunks(body)), max_concurrency=3)]
+
+    assert events[-1].imported == 10
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_import_history_serializes_records_of_a_thread():
+    """Test records of the same thread are written in order without dropping each other's messages."""
+    agent = _agent(_SlowSaver())
+    body = b"".join(_record("shared", f"message {i}") for i in range(5)) + _record("other", "hello")
+
+    events = [event async for event in import_history(agent, iter_ndjson_lines(_chunks(body)), max_concurrency=4)]
+
+    assert events[-1].imported == 6
+    state = await agent.graph.aget_state({"configurable": {"thread_id": "shared"}})
+    assert [m.content for m in state.values["messages"]] == [f"message {i}" for i in range(5)]
@@ -0,0 +1,194 @@
+import asyncio
+import json
+import zlib
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import RedirectResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from langgraph_agent_toolkit.service.middleware import (
+    ENCODERS,
+    CompressionMiddleware,
+    LoggingMiddleware,
+    negotiate_encoding,
+)
+
+
+def _create_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ok")
+    async def ok():
+        return {"status": "ok"}
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+
+    @app.get("/large")
+    async def large():
+        return {"items": [{"index": i, "content": "search result " * 5} for i in range(100)]}
+
+    @app.get("/redirect")
+    async def redirect():
+        return RedirectResponse(url="/ok")
+
+    @app.get("/fail")
+    async def fail():
+        raise RuntimeError("boom")
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            yield b"data: 1\n\n"
+            yield b"data: 2\n\n"
+
+        return StreamingResponse(chunks(), media_type="text/event-stream")
+
+    return app
+
+
+@pytest.fixture
+def app():
+    return _create_app()
+
+
+def _logged(path: str, **middleware_kwargs) -> list[tuple]:
+    app = _create_app()
+    app.add_middleware(LoggingMiddleware, **middleware_kwargs)
+    with patch("langgraph_agent_toolkit.service.middleware.logger") as mock_logger:
+        client = TestClient(app, raise_server_exceptions=False)
+        client.get(path, follow_redirects=False)
+    return [c.args for c in mock_logger.log.call_args_list]
+
+
+def test_logs_single_line_with_status_and_timing():
+    """Test a request is logged once with its status, duration and time to first byte."""
+    (args,) = _logged("/ok")
+    level, message, method, path, status_code, phrase, duration_ms, ttfb_ms = args
+    assert level == "INFO"
+    assert (method, path, status_code, phrase) == ("GET", "/ok", 200, "OK")
+    assert 0 <= ttfb_ms <= duration_ms
+
+
+def test_streaming_response_is_passed_through(app):
+    """Test streaming responses keep their body and are logged once."""
+    app.add_middleware(LoggingMiddleware)
+    with patch("langgraph_agent_toolkit.service.middleware.logger") as mock_logger:
+        response = TestClient(app).get("/stream")
+    assert response.text == "data: 1\n\ndata: 2\n\n"
+    assert mock_logger.log.call_count == 1
+
+
+def test_excluded_paths_and_redirects_are_not_logged():
+    """Test excluded paths and redirections are skipped."""
+    assert _logged("/health") == []
+    assert _logged("/redirect", skip_redirection_logging=True) == []
+
+
+def test_logging_defaults_come_from_settings():
+    """Test the sample rate and excluded paths default to the settings."""
+    with patch("langgraph_agent_toolkit.service.middleware.settings") as settings:
+        settings.REQUEST_LOG_SAMPLE_RATE = 0.0
+        settings.REQUEST_LOG_EXCLUDE_PATHS = ["/ok"]
+        middleware = LoggingMiddleware(_create_app())
+    assert middleware.sample_rate == 0.0
+    assert middleware.exclude_paths == frozenset({"/ok"})
+
+
+def test_sampling_never_drops_server_errors():
+    """Test sampling drops successful requests but keeps server errors."""
+    assert _logged("/ok", sample_rate=0.0) == []
+
+    (args,) = _logged("/fail", sample_rate=0.0)
+    assert args[0] == "WARNING"
+    assert args[4] == 500
+
+
+def _compressed_client(**middleware_kwargs) -> TestClient:
+    app = _create_app()
+    app.add_middleware(CompressionMiddleware, **middleware_kwargs)
+    return TestClient(app)
+
+
+def test_negotiate_encoding_follows_server_preference_and_q_values():
+    """Test the first preferred encoding accepted by the client is chosen."""
+    preferred = ["zstd", "br", "gzip"]
+    assert negotiate_encoding("gzip, deflate, zstd", preferred) == "zstd"
+    assert negotiate_encoding("zstd;q=0, gzip;q=0.5", preferred) == "gzip"
+    assert negotiate_encoding("*", preferred) == "zstd"
+    assert negotiate_encoding("*, zstd;q=0", preferred) == "br"
+    assert negotiate_encoding("identity", preferred) is None
+    assert negotiate_encoding("", preferred) is None
+
+
+def test_large_responses_are_compressed():
+    """Test responses above the size threshold are compressed and small ones are sent as they are."""
+    client = _compressed_client(encodings=["gzip"])
+
+    response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) < len(json.dumps(response.json()))
+    assert len(response.json()["items"]) == 100
+
+    response = client.get("/ok", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert response.json() == {"status": "ok"}
+
+    response = client.get("/large", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in response.headers
+
+
+@pytest.mark.skipif("zstd" not in ENCODERS, reason="zstandard is not installed")
+def test_preferred_optional_encoding_is_used():
+    """Test zstd is preferred over gzip when both are available and accepted."""
+    client = _compressed_client()
+    response = client.get("/large", headers={"Accept-Encoding": "gzip, zstd"})
+    assert response.headers["content-encoding"] == "zstd"
+    assert len(response.json()["items"]) == 100
+
+
+def test_event_streams_are_compressed_only_on_opt_in():
+    """Test event streams stay uncompressed by default and are flushed per chunk once opted in."""
+    client = _compressed_client(encodings=["gzip"])
+
+    response = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert response.text == "data: 1\n\ndata: 2\n\n"
+
+    middleware = CompressionMiddleware(_create_app(), encodings=["gzip"])
+    messages = []
+
+    async def receive():
+        # Only queried for disconnects, which never happen here
+        await asyncio.Event().wait()
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/stream",
+        "raw_path": b"/stream",
+        "root_path": "",
+        "scheme": "http",
+        "query_string": b"",
+        "headers": [(b"accept-encoding", b"gzip"), (b"x-stream-compression", b"true")],
+        "server": ("testserver", 80),
+        "client": ("testclient", 50000),
+    }
+    asyncio.run(middleware(scope, receive, send))
+
+    assert (b"content-encoding", b"gzip") in messages[0]["headers"]
+    chunks = [message["body"] for message in messages[1:]]
+
+    # Every chunk is flushed, so it can be decoded without waiting for the rest of the stream
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    assert decompressor.decompress(chunks[0]) == b"data: 1\n\n"
+    assert decompressor.decompress(chunks[1]) == b"data: 2\n\n"
+    assert decompressor.decompress(b"".join(chunks[2:])) == b""
+    assert decompressor.eof
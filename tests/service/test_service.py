@@ -1,14 +1,30 @@
+import asyncio
 import json
+import threading
+import time
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, Mock, patch
 
 import langsmith
 import pytest
+from fastapi import HTTPException
 from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.checkpoint.memory import InMemorySaver
 from langgraph.errors import GraphRecursionError
+from langgraph.graph import END, START, MessagesState, StateGraph
 from langgraph.types import StateSnapshot
 
-from langgraph_agent_toolkit.schema import ChatHistory, ChatMessage, ServiceMetadata
+from langgraph_agent_toolkit.agents.agent import Agent
+from langgraph_agent_toolkit.agents.agent_executor import AgentExecutor
+from langgraph_agent_toolkit.agents.interrupt_index import PendingInterruptIndex
+from langgraph_agent_toolkit.core.queue.memory import InMemoryRunQueue
+from langgraph_agent_toolkit.core.queue.worker import RunWorkerPool
+from langgraph_agent_toolkit.helper.constants import DEFAULT_AGENT
+from langgraph_agent_toolkit.schema import BatchResponse, ChatHistory, ChatMessage, RunResponse, ServiceMetadata
 from langgraph_agent_toolkit.schema.models import ModelProvider
+from langgraph_agent_toolkit.service.admission import AdmissionController
+from langgraph_agent_toolkit.service.handler import lifespan
+from langgraph_agent_toolkit.service.utils import get_agent
 
 
 # Define MockStateSnapshot locally instead of importing from tests
@@ -51,6 +67,7 @@ def mock_agent_executor():
     executor = Mock()
     executor.agents = {"react-agent": mock_agent}
     executor.get_agent = Mock(return_value=mock_agent)
+    executor.aget_agent = AsyncMock(side_effect=lambda agent_id: executor.get_agent(agent_id))
     executor.get_all_agent_info = Mock(return_value=[{"key": "react-agent", "description": "A mock agent for testing"}])
 
     # Use AsyncMock for invoke
@@ -92,6 +109,139 @@ def test_invoke(test_client, mock_agent_executor) -> None:
         assert output.content == ANSWER
 
 
+def test_invoke_idempotency_key(test_client, mock_agent_executor) -> None:
+    """Test retries with the same idempotency key get the stored response without running again."""
+    mock_agent_executor.invoke.return_value = ChatMessage(type="ai", content="Once")
+    headers = {"Idempotency-Key": "retry-1"}
+
+    with patch("langgraph_agent_toolkit.service.routes.get_agent_executor", return_value=mock_agent_executor):
+        first = test_client.post("/invoke", json={"input": {"message": "hi"}}, headers=headers)
+        retry = test_client.post("/invoke", json={"input": {"message": "hi"}}, headers=headers)
+        assert first.status_code == retry.status_code == 200
+        assert "idempotent-replayed" not in first.headers
+        assert retry.headers["idempotent-replayed"] == "true"
+        assert retry.json() == first.json()
+        assert mock_agent_executor.invoke.await_count == 1
+
+        # The same key with a different request is rejected
+        response = test_client.post("/invoke", json={"input": {"message": "other"}}, headers=headers)
+        assert response.status_code == 422
+
+        # Requests without a key always run
+        test_client.post("/invoke", json={"input": {"message": "hi"}})
+        assert mock_agent_executor.invoke.await_count == 2
+
+
+def test_batch(test_client, mock_agent_executor) -> None:
+    mock_agent_executor.batch = AsyncMock(
+        return_value=[ChatMessage(type="ai", content="First"), GraphRecursionError("Recursion limit exceeded")]
+    )
+
+    with patch("langgraph_agent_toolkit.service.routes.get_agent_executor", return_value=mock_agent_executor):
+        response = test_client.post(
+            "/batch",
+            json={
+                "inputs": [{"input": {"message": "one"}, "thread_id": "t1"}, {"input": {"message": "two"}}],
+                "max_concurrency": 2,
+            },
+        )
+        assert response.status_code == 200
+
+        kwargs = mock_agent_executor.batch.call_args.kwargs
+        assert kwargs["max_concurrency"] == 2
+        assert [item["thread_id"] for item in kwargs["inputs"]] == ["t1", None]
+
+        output = BatchResponse.model_validate(response.json())
+        assert output.succeeded == 1
+        assert output.failed == 1
+        assert output.results[0].status == "success"
+        assert output.results[0].output.content == "First"
+        assert output.results[1].index == 1
+        assert output.results[1].status == "error"
+        assert output.results[1].error == "GraphRecursionError: Recursion limit exceeded"
+
+    # Empty batches are rejected by validation
+    response = test_client.post("/batch", json={"inputs": []})
+    assert response.status_code == 422
+
+
+def test_batch_admission_control(test_client, app, mock_agent_executor) -> None:
+    """Test every batch input takes an admission slot and rejected inputs are reported as errors."""
+    controller = AdmissionController(max_concurrency=1, max_waiting=0, retry_after=2.5)
+    app.state.admission_controller = controller
+    in_flight = []
+
+    async def invoke(**kwargs):
+        in_flight.append(controller._global.in_flight)
+        await asyncio.sleep(0.01)
+        return ChatMessage(type="ai", content="Done")
+
+    async def batch(**kwargs):
+        return await AgentExecutor.batch(mock_agent_executor, **kwargs)
+
+    mock_agent_executor.invoke = AsyncMock(side_effect=invoke)
+    mock_agent_executor.batch = batch
+    ticket = asyncio.run(controller.acquire(DEFAULT_AGENT))
+    body = {"inputs": [{"input": {"message": "one"}}, {"input": {"message": "two"}}], "max_concurrency": 2}
+
+    output = BatchResponse.model_validate(test_client.post("/batch", json=body).json())
+    assert output.failed == 2
+    assert all(result.error.startswith("RateLimitError") for result in output.results)
+    mock_agent_executor.invoke.assert_not_called()
+
+    ticket.release()
+    output = BatchResponse.model_validate(test_client.post("/batch", json=body).json())
+    # With a single slot the second input is rejected instead of running next to the first one
+    assert output.succeeded == 1
+    assert output.failed == 1
+    assert in_flight == [1]
+    assert controller._global.in_flight == 0
+
+
+def test_runs(test_client, app, mock_agent_executor) -> None:
+    app.state.run_queue = InMemoryRunQueue(max_size=10, result_ttl=60)
+
+    # Runs are not queued while no workers would execute them
+    response = test_client.post("/runs", json={"input": {"message": "Hello"}})
+    assert response.status_code == 503
+    app.state.run_worker_pool = RunWorkerPool(app.state.run_queue, mock_agent_executor, size=0)
+    assert test_client.post("/runs", json={"input": {"message": "Hello"}}).status_code == 503
+
+    app.state.run_worker_pool = Mock(running=True)
+    response = test_client.post("/runs", json={"input": {"message": "Hello"}, "thread_id": "t1"})
+    assert response.status_code == 202
+    run = RunResponse.model_validate(response.json())
+    assert run.status == "pending"
+    assert run.output is None
+
+    response = test_client.get(f"/runs/{run.run_id}")
+    assert response.status_code == 200
+    assert response.json()["status"] == "pending"
+
+    response = test_client.get("/runs/unknown-run")
+    assert response.status_code == 404
+
+
+def test_admission_control(test_client, app) -> None:
+    """Test runs beyond the concurrency limit are rejected with 429 and Retry-After."""
+    controller = AdmissionController(max_concurrency=1, max_waiting=0, retry_after=2.5)
+    app.state.admission_controller = controller
+    ticket = asyncio.run(controller.acquire(DEFAULT_AGENT))
+
+    response = test_client.post("/invoke", json={"input": {"message": "Hello"}})
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "3"
+    assert response.json()["error_code"] == "RATE_LIMIT_EXCEEDED"
+
+    response = test_client.post("/stream", json={"input": {"message": "Hello"}})
+    assert response.status_code == 429
+
+    ticket.release()
+    assert test_client.post("/invoke", json={"input": {"message": "Hello"}}).status_code == 200
+    assert test_client.post("/stream", json={"input": {"message": "Hello"}}).status_code == 200
+    assert controller._global.in_flight == 0
+
+
 def test_invoke_custom_agent(test_client, mock_agent_executor) -> None:
     """Test that /invoke works with a custom agent_id path parameter."""
     CUSTOM_AGENT = "custom_agent"
@@ -286,6 +436,28 @@ async def test_stream_no_tokens(test_client, mock_agent_executor) -> None:
                 assert message_messages[0]["content"]["type"] == "ai"
 
 
+def test_stream_coalesced_tokens(test_client, mock_agent_executor) -> None:
+    """Test tokens are merged into a single event when a coalescing window is requested."""
+    TOKENS = ["The", " weather", " is", " sunny."]
+
+    async def custom_mock_stream(*args, **kwargs):
+        for token in TOKENS:
+            yield token
+        yield ChatMessage(type="ai", content="".join(TOKENS))
+
+    with patch.object(mock_agent_executor, "stream", side_effect=[custom_mock_stream()]):
+        with test_client.stream(
+            "POST", "/stream", json={"input": {"message": "Weather?"}, "coalesce_ms": 1000}
+        ) as response:
+            assert response.status_code == 200
+            lines = [line for line in response.iter_lines() if line.startswith("data:")]
+
+    assert lines[-1] == "data: [DONE]"
+    events = [json.loads(line.removeprefix("data: ")) for line in lines[:-1]]
+    assert events[0] == {"type": "token", "content": "The weather is sunny."}
+    assert events[1]["type"] == "message"
+
+
 def test_stream_error_handling(test_client, mock_agent_executor) -> None:
     """Test that errors in stream are properly handled."""
     QUESTION = "What is the weather in Tokyo?"
@@ -525,6 +697,145 @@ def test_history(test_client, mock_agent, mock_agent_executor) -> None:
             assert output.messages[1].content == ANSWER
 
 
+def test_history_pagination_and_etag(test_client, mock_agent, mock_agent_executor) -> None:
+    """Test history pages are read from the latest checkpoint and unchanged threads return 304."""
+    builder = StateGraph(MessagesState)
+    builder.add_node("echo", lambda state: {"messages": [AIMessage(content=f"echo {len(state['messages'])}")]})
+    builder.add_edge(START, "echo")
+    builder.add_edge("echo", END)
+    mock_agent.graph = builder.compile(checkpointer=InMemorySaver())
+
+    config = {"configurable": {"thread_id": "paged-thread"}}
+    for i in range(3):
+        asyncio.run(mock_agent.graph.ainvoke({"messages": [HumanMessage(content=f"question {i}")]}, config))
+
+    with patch("langgraph_agent_toolkit.service.routes.get_agent", return_value=mock_agent):
+        response = test_client.get("/history", params={"thread_id": "paged-thread", "limit": 2})
+        assert response.status_code == 200
+        latest = ChatHistory.model_validate(response.json())
+        assert [m.content for m in latest.messages] == ["question 2", "echo 5"]
+        assert latest.has_more
+        etag = response.headers["etag"]
+
+        response = test_client.get(
+            "/history", params={"thread_id": "paged-thread", "limit": 2, "before": latest.messages[0].id}
+        )
+        previous = ChatHistory.model_validate(response.json())
+        assert [m.content for m in previous.messages] == ["question 1", "echo 3"]
+        assert previous.has_more
+
+        response = test_client.get("/history", params={"thread_id": "paged-thread", "after": previous.messages[1].id})
+        following = ChatHistory.model_validate(response.json())
+        assert [m.content for m in following.messages] == ["question 2", "echo 5"]
+        assert not following.has_more
+
+        response = test_client.get("/history", params={"thread_id": "paged-thread", "before": "unknown"})
+        assert response.status_code == 400
+
+        response = test_client.get(
+            "/history", params={"thread_id": "paged-thread", "limit": 2}, headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+
+        asyncio.run(mock_agent.graph.ainvoke({"messages": [HumanMessage(content="question 3")]}, config))
+        response = test_client.get(
+            "/history", params={"thread_id": "paged-thread", "limit": 2}, headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+
+def test_delete_threads(test_client, mock_agent_executor) -> None:
+    """Test thread deletion through clear_history and the bulk endpoint."""
+    mock_agent_executor.delete_threads = AsyncMock(return_value=1)
+
+    response = test_client.request("DELETE", "/history/clear", json={"thread_id": "t1", "delete_thread": True})
+    assert response.status_code == 200
+    assert response.json()["message"] == "Deleted thread t1."
+    mock_agent_executor.delete_threads.assert_awaited_once_with(DEFAULT_AGENT, ["t1"])
+
+    # Deleting a thread needs its ID
+    response = test_client.request("DELETE", "/history/clear", json={"user_id": "u1", "delete_thread": True})
+    assert response.status_code == 400
+
+    mock_agent_executor.delete_threads = AsyncMock(return_value=2)
+    response = test_client.request("DELETE", "/threads", json={"thread_ids": ["t1", "t2"]})
+    assert response.status_code == 200
+    assert response.json()["deleted"] == 2
+
+    mock_agent_executor.delete_threads = AsyncMock(side_effect=ValueError("no checkpoint saver"))
+    response = test_client.request("DELETE", "/threads", json={"thread_ids": ["t1"]})
+    assert response.status_code == 400
+
+    response = test_client.request("DELETE", "/threads", json={"thread_ids": []})
+    assert response.status_code == 422
+
+
+def test_import_history(test_client, mock_agent) -> None:
+    """Test NDJSON records are imported into their threads with streamed progress."""
+    builder = StateGraph(MessagesState)
+    builder.add_node("echo", lambda state: {})
+    builder.add_edge(START, "echo")
+    builder.add_edge("echo", END)
+    mock_agent.graph = builder.compile(checkpointer=InMemorySaver())
+
+    records = [
+        {"thread_id": "imported-1", "messages": [{"type": "human", "content": "hello"}]},
+        {"thread_id": "imported-2", "messages": [{"type": "human", "content": "hi"}, {"type": "ai", "content": "hey"}]},
+    ]
+    body = "\n".join(json.dumps(record) for record in records) + "\n{broken\n"
+
+    with patch("langgraph_agent_toolkit.service.routes.get_agent", return_value=mock_agent):
+        response = test_client.post(
+            "/history/import",
+            params={"max_concurrency": 2},
+            content=body.encode(),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert events[0]["type"] == "error"
+    assert events[0]["line"] == 3
+    assert events[-1] == {"type": "summary", "processed": 3, "imported": 2, "failed": 1}
+
+    state = asyncio.run(mock_agent.graph.aget_state({"configurable": {"thread_id": "imported-2"}}))
+    assert [m.content for m in state.values["messages"]] == ["hi", "hey"]
+
+
+def test_manual_state_updates_invalidate_interrupt_index(test_client, mock_agent, mock_agent_executor) -> None:
+    """Test adding, clearing and importing messages drops the cached pending-interrupt flag of the thread."""
+    builder = StateGraph(MessagesState)
+    builder.add_node("echo", lambda state: {})
+    builder.add_edge(START, "echo")
+    builder.add_edge("echo", END)
+    mock_agent.graph = builder.compile(checkpointer=InMemorySaver())
+    index = PendingInterruptIndex()
+    mock_agent_executor.interrupt_index = index
+
+    with patch("langgraph_agent_toolkit.service.routes.get_agent", return_value=mock_agent):
+        index.set(DEFAULT_AGENT, "t1", True)
+        response = test_client.post(
+            "/history/add_messages", json={"thread_id": "t1", "messages": [{"type": "human", "content": "hi"}]}
+        )
+        assert response.status_code == 201
+        assert index.get(DEFAULT_AGENT, "t1") is None
+
+        asyncio.run(
+            mock_agent.graph.ainvoke({"messages": [HumanMessage(content="hi")]}, {"configurable": {"thread_id": "t3"}})
+        )
+        index.set(DEFAULT_AGENT, "t3", False)
+        assert test_client.request("DELETE", "/history/clear", json={"thread_id": "t3"}).status_code == 200
+        assert index.get(DEFAULT_AGENT, "t3") is None
+
+        index.set(DEFAULT_AGENT, "t2", True)
+        record = {"thread_id": "t2", "messages": [{"type": "human", "content": "hello"}]}
+        response = test_client.post("/history/import", content=json.dumps(record).encode() + b"\n")
+        assert response.status_code == 200
+        assert index.get(DEFAULT_AGENT, "t2") is None
+
+
 def test_info(test_client, mock_settings, mock_agent_executor):
     """Test that /info returns the correct service metadata."""
     # Note: mock_settings is fixed to patch the correct modules
@@ -647,6 +958,21 @@ async def test_stream_with_recursion_limit(test_client, mock_agent_executor) ->
             assert called_args["recursion_limit"] is None
 
 
+def test_server_timing_and_metrics(test_client, mock_agent_executor) -> None:
+    """Test responses carry a Server-Timing header and requests are aggregated on /metrics."""
+    mock_agent_executor.invoke.return_value = ChatMessage(type="ai", content="Hi")
+
+    response = test_client.post("/invoke", json={"input": {"message": "Hello"}})
+    assert response.status_code == 200
+    assert "app;dur=" in response.headers["server-timing"]
+
+    response = test_client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'http_request_duration_seconds_count{method="POST",route="/invoke",status="200"}' in response.text
+    assert "# TYPE agent_stage_duration_seconds histogram" in response.text
+
+
 def test_exception_handlers_registered(test_client) -> None:
     """Test that exception handlers are properly registered."""
     # Test a route that should trigger a ValueError exception handler
@@ -659,3 +985,74 @@ def test_exception_handlers_registered(test_client) -> None:
     # The response should have proper JSON structure, not an unhandled exception
     response_data = response.json()
     assert "detail" in response_data
+
+
+@pytest.mark.asyncio
+async def test_lifespan_initializes_steps_concurrently(app, mock_agent_executor) -> None:
+    """Test observability, agent imports and checkpointer setup overlap instead of running in sequence."""
+    saver = AsyncMock()
+
+    async def setup():
+        await asyncio.sleep(0.2)
+
+    saver.setup = AsyncMock(side_effect=setup)
+
+    @asynccontextmanager
+    async def checkpoint_saver():
+        yield saver
+
+    memory_backend = Mock()
+    memory_backend.get_checkpoint_saver.side_effect = checkpoint_saver
+
+    def slow(value):
+        def create(*args):
+            time.sleep(0.2)
+            return value
+
+        return create
+
+    mock_agent_executor.get_all_agent_info.return_value = []
+    with (
+        patch("langgraph_agent_toolkit.service.handler.settings.MEMORY_BACKEND", "postgres"),
+        patch("langgraph_agent_toolkit.service.handler.MemoryFactory.create", return_value=memory_backend),
+        patch("langgraph_agent_toolkit.service.handler.ObservabilityFactory.create", side_effect=slow(Mock())),
+        patch("langgraph_agent_toolkit.service.handler.AgentExecutor", side_effect=slow(mock_agent_executor)),
+        patch("langgraph_agent_toolkit.service.handler.http_client_registry.aclose") as close_http_clients,
+    ):
+        started_at = time.perf_counter()
+        async with lifespan(app):
+            elapsed = time.perf_counter() - started_at
+            assert app.state.agent_executor is mock_agent_executor
+            saver.setup.assert_awaited_once()
+            close_http_clients.assert_not_awaited()
+
+    # Three 0.2s steps take 0.6s in sequence
+    assert 0.2 <= elapsed < 0.35
+    close_http_clients.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_agent_imports_lazy_agent_off_event_loop():
+    """Test lazily registered agents requested by a route are imported in a worker thread."""
+    import_threads = []
+
+    def import_agent(import_str):
+        import_threads.append(threading.current_thread())
+        return Agent(name="loaded-name", description="Lazy agent", graph=Mock(checkpointer=None))
+
+    with (
+        patch.object(AgentExecutor, "_import_agent", side_effect=import_agent),
+        patch.object(AgentExecutor, "_validate_default_agent_loaded"),
+    ):
+        executor = AgentExecutor("lazy-agent=some.module:agent")
+    request = Mock()
+    request.app.state.agent_executor = executor
+
+    with patch.object(AgentExecutor, "_import_agent", side_effect=import_agent):
+        agent = await get_agent(request, "lazy-agent")
+        with pytest.raises(HTTPException) as exc_info:
+            await get_agent(request, "unknown-agent")
+
+    assert agent.name == "lazy-agent"
+    assert import_threads and threading.main_thread() not in import_threads
+    assert exc_info.value.status_code == 404
@@ -149,6 +149,7 @@ def test_agent_stream(mock_httpx, sqlite_db_settings):
     # Create a mock agent executor that will return our test agent
     mock_executor = MagicMock(spec=AgentExecutor)
     mock_executor.get_agent = MagicMock(return_value=agent_meta)
+    mock_executor.aget_agent = AsyncMock(side_effect=lambda agent_id: mock_executor.get_agent(agent_id))
     mock_executor.agents = {"static-agent": agent_meta, "react-agent": MagicMock()}
 
     # Properly patch the request dependency
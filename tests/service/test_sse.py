@@ -0,0 +1,204 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from langgraph_agent_toolkit.helper.types import StreamBufferPolicy
+from langgraph_agent_toolkit.schema import ChatMessage, StreamInput
+from langgraph_agent_toolkit.service.sse import SSE_DONE, StreamBuffer, encode_error, encode_event, encode_stream
+from langgraph_agent_toolkit.service.utils import STREAMS_CANCELLED, message_generator
+
+
+def _parse(chunks: list[bytes]) -> list[dict]:
+    frames = b"".join(chunks).decode("utf-8").split("\n\n")
+    return [json.loads(frame.removeprefix("data: ")) for frame in frames if frame]
+
+
+async def _collect_generator(generator) -> list[bytes]:
+    return [chunk async for chunk in generator]
+
+
+async def _collect(events, **kwargs) -> list[bytes]:
+    return await _collect_generator(encode_stream(events, **kwargs))
+
+
+def test_encoded_frames_match_json_format():
+    """Test pre-encoded frames carry the same payload as the JSON encoded events."""
+    message = ChatMessage(type="ai", content='Héllo "world"\n', run_id="run-1")
+
+    assert _parse([encode_event('tok"en')]) == [{"type": "token", "content": 'tok"en'}]
+    assert _parse([encode_event(message)]) == [{"type": "message", "content": message.model_dump()}]
+    assert _parse([encode_error("boom")]) == [{"type": "error", "content": "boom"}]
+    assert SSE_DONE == b"data: [DONE]\n\n"
+
+
+@pytest.mark.asyncio
+async def test_encode_stream_without_coalescing():
+    """Test every event becomes its own chunk when coalescing is disabled."""
+
+    async def events():
+        yield "Hello"
+        yield " world"
+        yield ChatMessage(type="ai", content="Hello world")
+
+    chunks = await _collect(events())
+    assert len(chunks) == 3
+    assert [e["type"] for e in _parse(chunks)] == ["token", "token", "message"]
+
+
+@pytest.mark.asyncio
+async def test_encode_stream_coalesces_tokens():
+    """Test consecutive tokens are merged and flushed together with the next message."""
+
+    async def events():
+        for token in ["The", " weather", " is", " sunny"]:
+            yield token
+        yield ChatMessage(type="ai", content="The weather is sunny")
+        yield "!"
+
+    chunks = await _collect(events(), coalesce_ms=1000)
+    assert len(chunks) == 2
+    assert _parse(chunks[:1]) == [
+        {"type": "token", "content": "The weather is sunny"},
+        {"type": "message", "content": ChatMessage(type="ai", content="The weather is sunny").model_dump()},
+    ]
+    assert _parse(chunks[1:]) == [{"type": "token", "content": "!"}]
+
+
+@pytest.mark.asyncio
+async def test_encode_stream_flushes_on_size_and_window():
+    """Test buffered tokens are flushed once the size limit or the window is reached."""
+
+    async def events():
+        yield "abc"
+        yield "def"
+        yield "g"
+        await asyncio.sleep(0.1)
+        yield "h"
+
+    chunks = await _collect(events(), coalesce_ms=20, coalesce_bytes=6)
+    assert [e["content"] for e in _parse(chunks)] == ["abcdef", "g", "h"]
+
+
+@pytest.mark.asyncio
+async def test_encode_stream_propagates_errors_after_flushing():
+    """Test buffered tokens are sent before an error of the source is raised."""
+
+    async def events():
+        yield "partial"
+        raise ValueError("boom")
+
+    stream = encode_stream(events(), coalesce_ms=1000)
+    assert _parse([await anext(stream)]) == [{"type": "token", "content": "partial"}]
+    with pytest.raises(ValueError, match="boom"):
+        await anext(stream)
+
+
+@pytest.mark.asyncio
+async def test_encode_stream_cancels_source_on_disconnect():
+    """Test an idle source is cancelled as soon as the client disconnects."""
+    cancelled = asyncio.Event()
+    checks = []
+
+    async def events():
+        yield "partial"
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        yield "never"
+
+    async def is_disconnected():
+        checks.append(True)
+        return len(checks) > 1
+
+    chunks = await asyncio.wait_for(
+        _collect(events(), is_disconnected=is_disconnected, disconnect_check_interval=0.01), timeout=1
+    )
+    assert _parse(chunks) == [{"type": "token", "content": "partial"}]
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_message_generator_stops_without_done_on_disconnect():
+    """Test a disconnected stream is counted as cancelled and does not send the final frame."""
+    executor = Mock()
+
+    async def stream(**kwargs):
+        yield "Hello"
+        await asyncio.sleep(10)
+
+    executor.stream = stream
+    request = Mock()
+    request.app.state.agent_executor = executor
+    request.is_disconnected = AsyncMock(return_value=True)
+    before = STREAMS_CANCELLED.value(agent="agent")
+
+    with patch("langgraph_agent_toolkit.service.utils.settings.SSE_DISCONNECT_CHECK_INTERVAL", 0.01):
+        chunks = await asyncio.wait_for(
+            _collect_generator(message_generator(StreamInput(input={"message": "Hi"}), request, "agent")), timeout=1
+        )
+
+    assert SSE_DONE not in chunks
+    assert STREAMS_CANCELLED.value(agent="agent") == before + 1
+
+
+@pytest.mark.asyncio
+async def test_stream_buffer_block_policy_waits_for_consumer():
+    """Test a full blocking buffer pauses the producer until an event is taken."""
+    buffer = StreamBuffer(max_size=1)
+    await buffer.put("a")
+    put = asyncio.create_task(buffer.put("b"))
+    await asyncio.sleep(0)
+    assert not put.done()
+
+    assert await buffer.get() == "a"
+    await asyncio.wait_for(put, timeout=1)
+    assert await buffer.get() == "b"
+    assert buffer.max_depth == 1
+
+
+@pytest.mark.asyncio
+async def test_stream_buffer_merge_tokens_policy():
+    """Test tokens arriving at a full buffer are merged into the last buffered token."""
+    buffer = StreamBuffer(max_size=2, policy=StreamBufferPolicy.MERGE_TOKENS)
+    message = ChatMessage(type="ai", content="abc")
+    for event in [message, "a", "b", "c"]:
+        await asyncio.wait_for(buffer.put(event), timeout=1)
+    buffer.put_final("end")
+
+    assert [await buffer.get() for _ in range(3)] == [message, "abc", "end"]
+
+
+@pytest.mark.asyncio
+async def test_stream_buffer_drop_tokens_policy_keeps_messages():
+    """Test tokens are dropped when the buffer is full, making room for complete messages."""
+    buffer = StreamBuffer(max_size=2, policy=StreamBufferPolicy.DROP_TOKENS)
+    message = ChatMessage(type="ai", content="abc")
+    for event in ["a", "b", "c", message]:
+        await asyncio.wait_for(buffer.put(event), timeout=1)
+
+    assert len(buffer) == 1
+    assert await buffer.get() == message
+
+
+@pytest.mark.asyncio
+async def test_encode_stream_runs_ahead_of_slow_consumer():
+    """Test a non-blocking policy lets the source finish while the client has not read yet."""
+    finished = asyncio.Event()
+
+    async def events():
+        for token in "abcdef":
+            yield token
+        yield ChatMessage(type="ai", content="abcdef")
+        finished.set()
+
+    stream = encode_stream(events(), buffer_size=2, buffer_policy=StreamBufferPolicy.DROP_TOKENS)
+    first = await anext(stream)
+    await asyncio.wait_for(finished.wait(), timeout=1)
+    rest = await _collect_generator(stream)
+
+    # Tokens the client did not read in time were superseded by the complete message
+    assert [frame["type"] for frame in _parse([first, *rest])] == ["message"]